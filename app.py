@@ -15,8 +15,10 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
-from contract_risk.assistant.comparison import build_risk_trend_summary
-from contract_risk.assistant.pdf_export import build_legal_assistance_report_pdf
+from contract_risk.assistant.comparison import RiskTrendAggregator, build_risk_trend_summary
+from contract_risk.assistant.near_duplicates import NearDuplicateIndex
+from contract_risk.assistant.pdf_export import PdfRenderCache, report_content_hash
+from contract_risk.assistant.reporting import list_sources_consulted, resolve_finding_evidence
 from contract_risk.assistant.retrieval import build_knowledge_base
 from contract_risk.data.ingestion import (
     DocumentReadError,
@@ -27,6 +29,7 @@ from contract_risk.models.explainability import ExplainabilityError, top_feature
 from contract_risk.models.inference import load_or_train_model
 from contract_risk.risk.mapping import risk_badge_color
 from contract_risk.ui_support import (
+    ContractAnalysisResult,
     analyze_contract_text,
     build_clause_detail_index,
     format_clause_label,
@@ -53,6 +56,43 @@ def get_cached_knowledge_base() -> object:
     return build_knowledge_base(load_legal_guidance_corpus())
 
 
+@st.cache_resource(show_spinner=False)
+def get_pdf_render_cache() -> PdfRenderCache:
+    """Share rendered report PDFs across sessions, keyed by report content."""
+    return PdfRenderCache()
+
+
+@st.fragment
+def _render_pdf_download(report: dict[str, object], report_hash: str) -> None:
+    """Render the PDF on the shared background renderer only once it is requested.
+
+    Only this fragment reruns while the PDF renders; the rest of the page stays live.
+    """
+    cache = get_pdf_render_cache()
+    pdf_bytes = cache.get(report_hash)
+    if pdf_bytes is None and report_hash != st.session_state.get("assistant_report_pdf_requested"):
+        if not st.button("Prepare PDF Report", use_container_width=True):
+            return
+        st.session_state["assistant_report_pdf_requested"] = report_hash
+
+    if pdf_bytes is None:
+        future = cache.pending(report_hash) or cache.request(report, key=report_hash)
+        try:
+            with st.spinner("Rendering the PDF report..."):
+                pdf_bytes = future.result()
+        except Exception as exc:  # pragma: no cover - defensive guard for rendering failures
+            st.warning(f"Could not render the PDF report: {exc}")
+            return
+
+    st.download_button(
+        "Download PDF Report",
+        data=pdf_bytes,
+        file_name="legal_assistance_report.pdf",
+        mime="application/pdf",
+        use_container_width=True,
+    )
+
+
 def _render_report(report: dict[str, object] | None, report_error: str | None = None) -> None:
     """Render the structured legal assistance report in the UI."""
     st.subheader("Generate Legal Assistance Report")
@@ -94,8 +134,9 @@ def _render_report(report: dict[str, object] | None, report_error: str | None =
             )
             st.write(finding["explanation"])
             st.caption(f"Mitigation: {finding['mitigation_action']}")
-            if finding["evidence"]:
-                for evidence in finding["evidence"]:
+            evidence_items = resolve_finding_evidence(report, finding)
+            if evidence_items:
+                for evidence in evidence_items:
                     st.markdown(
                         f"- **{evidence['source_title']}** "
                         f"({evidence['score']:.2f}): {evidence['snippet']}"
@@ -104,8 +145,9 @@ def _render_report(report: dict[str, object] | None, report_error: str | None =
                 st.info("No strong evidence was cited for this clause.")
 
     with st.expander("Sources Consulted", expanded=False):
-        if report["sources_consulted"]:
-            st.dataframe(pd.DataFrame(report["sources_consulted"]), use_container_width=True)
+        sources_consulted = list_sources_consulted(report)
+        if sources_consulted:
+            st.dataframe(pd.DataFrame(sources_consulted), use_container_width=True)
         else:
             st.info("No external sources were consulted.")
 
@@ -196,8 +238,8 @@ def render_app() -> None:
                 st.session_state["assistant_report"] = analysis.report
                 st.session_state["assistant_report_error"] = analysis.report_error
                 st.session_state["assistant_report_warnings"] = analysis.warnings
-                st.session_state["assistant_report_pdf"] = (
-                    build_legal_assistance_report_pdf(analysis.report) if analysis.report else None
+                st.session_state["assistant_report_hash"] = (
+                    report_content_hash(analysis.report) if analysis.report else None
                 )
 
             report_to_render = st.session_state.get("assistant_report")
@@ -209,14 +251,8 @@ def render_app() -> None:
                 for warning in st.session_state.get("assistant_report_warnings", ()):
                     st.info(warning)
                 _render_report(report_to_render, st.session_state.get("assistant_report_error"))
-                if st.session_state.get("assistant_report_pdf"):
-                    st.download_button(
-                        "Download PDF Report",
-                        data=st.session_state["assistant_report_pdf"],
-                        file_name="legal_assistance_report.pdf",
-                        mime="application/pdf",
-                        use_container_width=True,
-                    )
+                if st.session_state.get("assistant_report_hash"):
+                    _render_pdf_download(report_to_render, st.session_state["assistant_report_hash"])
 
                 st.subheader("Clause Drill-Down")
                 clause_details = build_clause_detail_index(report_to_render)
@@ -331,7 +367,12 @@ def render_app() -> None:
         key="comparison_uploads",
     )
     if comparison_uploads:
-        comparison_analyses = []
+        # Keyed by file name: the aggregator and index also treat a repeated name as one contract.
+        comparison_analyses: dict[str, ContractAnalysisResult] = {}
+        comparison_trends = RiskTrendAggregator()
+        # Indexed only to list clauses shared between uploads. Each upload is
+        # analyzed on its own, so its findings match a standalone analysis.
+        comparison_index = NearDuplicateIndex()
         for comparison_file in comparison_uploads:
             try:
                 comparison_text = extract_text_from_upload(
@@ -351,12 +392,20 @@ def render_app() -> None:
                 contract_name=comparison_file.name,
                 knowledge_base=knowledge_base,
             )
-            comparison_analyses.append(comparison_analysis)
+            if comparison_file.name in comparison_analyses:
+                st.warning(f"{comparison_file.name}: uploaded more than once; only the last copy is compared.")
+            comparison_index.add_analysis(comparison_analysis)
+            comparison_trends.add(comparison_analysis)
+            comparison_analyses[comparison_file.name] = comparison_analysis
 
-        if len(comparison_analyses) < 2:
+        if len(comparison_trends) < 2:
             st.info("Upload at least two readable contracts to compare risk patterns.")
         else:
-            comparison = build_risk_trend_summary(comparison_analyses)
+            comparison = build_risk_trend_summary(
+                list(comparison_analyses.values()),
+                clause_index=comparison_index,
+                aggregator=comparison_trends,
+            )
             comparison_col1, comparison_col2, comparison_col3 = st.columns(3)
             with comparison_col1:
                 st.metric("Contracts Compared", comparison["contract_count"])
@@ -378,6 +427,12 @@ def render_app() -> None:
                 st.dataframe(pd.DataFrame(comparison["repeated_risk_patterns"]), use_container_width=True)
             else:
                 st.info("No repeated risk patterns were shared across the selected contracts.")
+
+            st.markdown("**Clauses Appearing in Other Contracts**")
+            if comparison["recurring_clauses"]:
+                st.dataframe(pd.DataFrame(comparison["recurring_clauses"]), use_container_width=True)
+            else:
+                st.info("No near-duplicate clauses were found across the selected contracts.")
     else:
         st.info("Upload at least two readable contracts to compare risk patterns.")
 
@@ -0,0 +1,193 @@
+"""Timing, result files, and regression comparison for benchmarks."""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings for one benchmark case."""
+
+    name: str
+    params: dict[str, Any]
+    repeats: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    items: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Return a stable identifier used to match cases across runs."""
+        return case_key(self.name, self.params)
+
+    @property
+    def items_per_second(self) -> float:
+        """Return throughput based on the median timing."""
+        return self.items / self.median_seconds if self.items and self.median_seconds else 0.0
+
+
+@dataclass(frozen=True)
+class Regression:
+    """One case that got slower than the baseline by more than the threshold."""
+
+    key: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """Return current over baseline median time."""
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds else float("inf")
+
+
+def case_key(name: str, params: Mapping[str, Any]) -> str:
+    """Build ``name[param=value,...]`` with parameters in sorted order."""
+    if not params:
+        return name
+    rendered = ",".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{name}[{rendered}]"
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    params: Mapping[str, Any] | None = None,
+    repeats: int = 5,
+    warmup: int = 1,
+    items: int | Callable[[Any], int] = 0,
+) -> BenchmarkResult:
+    """Time ``func`` after warm-up runs, with the garbage collector paused.
+
+    ``items`` is either a fixed count or a callable applied to the last return
+    value, and is used to report throughput.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings: list[float] = []
+    result: Any = None
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeats)):
+            started = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - started)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return BenchmarkResult(
+        name=name,
+        params=dict(params or {}),
+        repeats=len(timings),
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        mean_seconds=statistics.fmean(timings),
+        items=items(result) if callable(items) else items,
+    )
+
+
+def environment_metadata() -> dict[str, Any]:
+    """Describe the interpreter and host the results were recorded on."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_results(results: Sequence[BenchmarkResult], path: str | Path, *, profile: str) -> Path:
+    """Write benchmark results as JSON and return the path."""
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": RESULTS_VERSION,
+        "profile": profile,
+        "environment": environment_metadata(),
+        "results": [{"key": result.key, **asdict(result)} for result in results],
+    }
+    destination.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return destination
+
+
+def load_results(path: str | Path) -> dict[str, BenchmarkResult]:
+    """Load a results file keyed by case key."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    loaded: dict[str, BenchmarkResult] = {}
+    for entry in payload.get("results", []):
+        fields = {name: entry[name] for name in BenchmarkResult.__dataclass_fields__ if name in entry}
+        result = BenchmarkResult(**fields)
+        loaded[result.key] = result
+    return loaded
+
+
+def compare_results(
+    baseline: Mapping[str, BenchmarkResult],
+    current: Mapping[str, BenchmarkResult],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Return cases whose median time grew by more than ``threshold``.
+
+    Cases present in only one of the runs are ignored.
+    """
+    regressions: list[Regression] = []
+    for key, result in current.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if result.median_seconds > previous.median_seconds * (1.0 + threshold):
+            regressions.append(Regression(key, previous.median_seconds, result.median_seconds))
+    return regressions
+
+
+def format_comparison(
+    baseline: Mapping[str, BenchmarkResult],
+    current: Mapping[str, BenchmarkResult],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> str:
+    """Render a side-by-side table of baseline and current medians."""
+    flagged = {item.key for item in compare_results(baseline, current, threshold=threshold)}
+    rows = [f"{'case':<60} {'baseline':>11} {'current':>11} {'change':>9}"]
+    for key in sorted(current):
+        now = current[key].median_seconds
+        previous = baseline.get(key)
+        if previous is None:
+            rows.append(f"{key:<60} {'-':>11} {now:>10.4f}s {'new':>9}")
+            continue
+        change = (now / previous.median_seconds - 1.0) * 100 if previous.median_seconds else 0.0
+        marker = "  REGRESSION" if key in flagged else ""
+        rows.append(f"{key:<60} {previous.median_seconds:>10.4f}s {now:>10.4f}s {change:>+8.1f}%{marker}")
+    return "\n".join(rows)
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Render results as an aligned plain-text table."""
+    rows = [f"{'case':<60} {'median':>11} {'min':>11} {'items/s':>12}"]
+    for result in results:
+        rows.append(
+            f"{result.key:<60} {result.median_seconds:>10.4f}s {result.min_seconds:>10.4f}s "
+            f"{result.items_per_second:>12.0f}"
+        )
+    return "\n".join(rows)
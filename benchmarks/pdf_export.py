@@ -0,0 +1,176 @@
+"""Benchmark the native PDF report writer against the matplotlib renderer.
+
+The previous renderer drew one matplotlib figure per page and one text artist
+per wrapped line, and stopped after ten findings or at the bottom margin. It is
+kept here, unchanged, as the baseline.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.pdf_export --findings 1500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from io import BytesIO
+from textwrap import wrap
+from typing import Any, Sequence
+
+from benchmarks.harness import BenchmarkResult, format_results, measure, write_results
+from benchmarks.report_assembly import _with_extra, build_large_state
+from contract_risk.assistant.pdf_export import build_legal_assistance_report_pdf
+from contract_risk.assistant.reporting import build_structured_report, list_sources_consulted, resolve_finding_evidence
+
+LEGACY_PDF_WIDTH = 8.5
+LEGACY_PDF_HEIGHT = 11.0
+LEFT_MARGIN = 0.06
+TOP_MARGIN = 0.96
+BOTTOM_MARGIN = 0.06
+LINE_HEIGHT = 0.025
+
+
+def _legacy_new_page(title: str) -> tuple[Any, Any]:
+    """Create a blank PDF page with the given title."""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(LEGACY_PDF_WIDTH, LEGACY_PDF_HEIGHT))
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.axis("off")
+    fig.text(LEFT_MARGIN, TOP_MARGIN, title, fontsize=16, fontweight="bold", va="top")
+    return fig, ax
+
+
+def _legacy_write_wrapped_lines(fig: Any, start_y: float, paragraphs: list[str], width: int = 92) -> float:
+    """Write wrapped paragraphs onto the current figure."""
+    cursor = start_y
+    for paragraph in paragraphs:
+        lines = wrap(paragraph, width=width) or [""]
+        for line in lines:
+            if cursor <= BOTTOM_MARGIN:
+                return cursor
+            fig.text(LEFT_MARGIN, cursor, line, fontsize=9, va="top")
+            cursor -= LINE_HEIGHT
+        cursor -= LINE_HEIGHT * 0.6
+    return cursor
+
+
+def legacy_report_pdf(report: dict[str, Any]) -> bytes:
+    """Render the report with the previous matplotlib figure-per-page renderer."""
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    buffer = BytesIO()
+
+    summary = report["contract_summary"]
+    severity = report["severity_assessment"]
+    findings = report.get("identified_risks", [])
+    mitigation_actions = report.get("mitigation_actions", [])
+    sources = list_sources_consulted(report)
+    disclaimer = report.get("disclaimer", "")
+
+    with PdfPages(buffer) as pdf:
+        fig, _ = _legacy_new_page("DABB.ai Legal Assistance Report")
+        y = 0.90
+        summary_lines = [
+            f"Contract: {summary['contract_name']}",
+            f"Clauses reviewed: {summary['clause_count']}",
+            f"Risk profile: {severity['overall_risk_level']} "
+            f"(High: {severity['high_risk_count']}, Medium: {severity['medium_risk_count']}, Low: {severity['low_risk_count']})",
+            summary["overview"],
+        ]
+        y = _legacy_write_wrapped_lines(fig, y, summary_lines)
+        y = _legacy_write_wrapped_lines(fig, y, [f"Disclaimer: {disclaimer}"])
+        pdf.savefig(fig, bbox_inches="tight")
+        plt.close(fig)
+
+        fig, _ = _legacy_new_page("Top Findings")
+        y = 0.90
+        if findings:
+            for finding in findings[:10]:
+                finding_lines = [
+                    f"{finding['clause_id']} - {finding['predicted_type']} - "
+                    f"Severity {finding['severity']} - Risk {finding['risk_score']}",
+                    finding["explanation"],
+                    f"Mitigation: {finding['mitigation_action']}",
+                ]
+                evidence = resolve_finding_evidence(report, finding)
+                if evidence:
+                    lead = evidence[0]
+                    finding_lines.append(
+                        f"Evidence: {lead['source_title']} ({lead['score']:.2f}) - {lead['snippet']}"
+                    )
+                y = _legacy_write_wrapped_lines(fig, y, finding_lines)
+                if y <= BOTTOM_MARGIN + 0.08:
+                    break
+                y -= LINE_HEIGHT
+        else:
+            y = _legacy_write_wrapped_lines(fig, y, ["No risky clauses were identified in the report."])
+        pdf.savefig(fig, bbox_inches="tight")
+        plt.close(fig)
+
+        fig, _ = _legacy_new_page("Mitigation and Sources")
+        y = 0.90
+        mitigation_lines = ["Mitigation actions:"]
+        mitigation_lines.extend(f"- {item}" for item in mitigation_actions or ["No mitigation actions were generated."])
+        y = _legacy_write_wrapped_lines(fig, y, mitigation_lines)
+        source_lines = ["Sources consulted:"]
+        source_lines.extend(
+            f"- {source['source_id']}: {source['title']}" for source in sources or [{"source_id": "N/A", "title": "No sources consulted"}]
+        )
+        y = _legacy_write_wrapped_lines(fig, y, source_lines)
+        pdf.savefig(fig, bbox_inches="tight")
+        plt.close(fig)
+
+    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def page_count(pdf_bytes: bytes) -> int:
+    """Count the pages in a rendered PDF."""
+    from pypdf import PdfReader
+
+    return len(PdfReader(BytesIO(pdf_bytes)).pages)
+
+
+def run_pdf_export_benchmarks(finding_count: int = 1500, *, repeats: int = 3) -> list[BenchmarkResult]:
+    """Time both renderers on the same report and record page counts and sizes."""
+    report = build_structured_report(build_large_state(finding_count))
+    params = {"findings": finding_count}
+    results: list[BenchmarkResult] = []
+    for name, render in (
+        ("pdf_matplotlib_legacy", legacy_report_pdf),
+        ("pdf_native", build_legal_assistance_report_pdf),
+    ):
+        pdf_bytes = render(report)
+        result = measure(name, lambda: render(report), params=params, repeats=repeats, warmup=0, items=finding_count)
+        results.append(_with_extra(result, {"pages": page_count(pdf_bytes), "pdf_bytes": len(pdf_bytes)}))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the PDF export benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering.")
+    parser.add_argument("--findings", type=int, default=1500, help="Number of findings in the report")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repeats per case")
+    parser.add_argument("--output", default="reports/benchmarks/pdf_export.json", help="Where to write JSON results")
+    args = parser.parse_args(argv)
+
+    results = run_pdf_export_benchmarks(args.findings, repeats=args.repeats)
+    print(format_results(results))
+    legacy, native = results
+    legacy_per_page = legacy.median_seconds / legacy.extra["pages"]
+    native_per_page = native.median_seconds / native.extra["pages"]
+    print(
+        f"\nNative writer: {native.median_seconds:.3f}s for {native.extra['pages']} pages with every finding. "
+        f"Matplotlib: {legacy.median_seconds:.3f}s for {legacy.extra['pages']} pages, "
+        f"since it stops after ten findings. "
+        f"Per page: {legacy_per_page * 1000:.1f} ms -> {native_per_page * 1000:.2f} ms "
+        f"({legacy_per_page / native_per_page:.0f}x faster)."
+    )
+    print(f"Saved results to {write_results(results, args.output, profile='pdf_export')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
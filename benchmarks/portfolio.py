@@ -0,0 +1,163 @@
+"""Benchmark portfolio trend queries from the SQLite store against in-memory re-aggregation.
+
+Synthetic reports for many contracts are written to a temporary store. The
+same trend queries are then timed on the store and with
+``build_risk_trend_summary`` over the reports held in memory. Adding one
+contract to a ``RiskTrendAggregator``, and reading its summary, are timed
+against that full rebuild.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.portfolio --contracts 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+from benchmarks.harness import BenchmarkResult, format_results, measure, write_results
+from benchmarks.report_assembly import _with_extra
+from contract_risk.assistant.comparison import RiskTrendAggregator, build_risk_trend_summary
+from contract_risk.assistant.portfolio import PortfolioStore
+from contract_risk.ui_support import ContractAnalysisResult
+
+CLAUSE_TYPES = (
+    "termination",
+    "confidentiality",
+    "liability",
+    "indemnity",
+    "payment terms",
+    "governing law",
+    "intellectual property",
+    "audit rights",
+    "non-compete",
+    "assignment",
+)
+SEVERITIES = ("High", "Medium", "Low")
+
+
+def synthetic_reports(
+    contracts: int,
+    findings_per_contract: int = 20,
+    *,
+    seed: int = 0,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return ``(contract_name, report)`` pairs with random findings."""
+    rng = random.Random(seed)
+    reports = []
+    for contract in range(contracts):
+        findings = [
+            {
+                "clause_id": f"C{clause + 1:03d}",
+                "predicted_type": rng.choice(CLAUSE_TYPES),
+                "severity": rng.choice(SEVERITIES),
+                "risk_score": rng.randrange(10, 95),
+            }
+            for clause in range(findings_per_contract)
+        ]
+        reports.append(
+            (
+                f"contract-{contract:06d}",
+                {"contract_summary": {"clause_count": findings_per_contract}, "identified_risks": findings},
+            )
+        )
+    return reports
+
+
+def run_portfolio_benchmarks(
+    contracts: int = 20_000,
+    findings_per_contract: int = 20,
+    *,
+    repeats: int = 5,
+    store_path: str | Path | None = None,
+) -> list[BenchmarkResult]:
+    """Time trend queries on a populated store and the in-memory summary over the same reports."""
+    import pandas as pd
+
+    reports = synthetic_reports(contracts, findings_per_contract)
+    with tempfile.TemporaryDirectory() as directory:
+        store = PortfolioStore(store_path or Path(directory) / "portfolio.sqlite3")
+        started = time.perf_counter()
+        store.add_reports(reports)
+        load_seconds = time.perf_counter() - started
+
+        params = {"contracts": contracts, "findings_per_contract": findings_per_contract}
+        probe = reports[len(reports) // 2][0]
+        results = [
+            _with_extra(
+                measure(
+                    "portfolio_store_patterns",
+                    lambda: (store.severity_totals(), store.repeated_risk_patterns()),
+                    params=params,
+                    repeats=repeats,
+                ),
+                {"load_seconds": round(load_seconds, 3)},
+            ),
+            measure(
+                "portfolio_store_contract_rollup",
+                lambda: store.per_contract([probe]),
+                params=params,
+                repeats=repeats,
+            ),
+            measure(
+                "portfolio_store_findings_query",
+                lambda: store.findings(predicted_type="indemnity", severity="High", limit=100),
+                params=params,
+                repeats=repeats,
+                items=len,
+            ),
+            measure("portfolio_store_trend_summary", store.trend_summary, params=params, repeats=repeats),
+        ]
+        store.close()
+
+    analyses = [
+        ContractAnalysisResult(contract_name=name, raw_text="", clauses=(), clause_frame=pd.DataFrame(), report=report)
+        for name, report in reports
+    ]
+    results.append(
+        measure(
+            "portfolio_in_memory_trend_summary",
+            lambda: build_risk_trend_summary(analyses),
+            params=params,
+            repeats=repeats,
+        )
+    )
+    aggregator = RiskTrendAggregator()
+    for analysis in analyses:
+        aggregator.add(analysis)
+    results.append(
+        measure(
+            "portfolio_aggregator_add_one",
+            lambda: aggregator.add(analyses[len(analyses) // 2]),
+            params=params,
+            repeats=repeats,
+        )
+    )
+    results.append(measure("portfolio_aggregator_summary", aggregator.summary, params=params, repeats=repeats))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the portfolio store benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark portfolio trend queries.")
+    parser.add_argument("--contracts", type=int, default=20_000, help="Number of stored contracts")
+    parser.add_argument("--findings", type=int, default=20, help="Findings per contract")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats per case")
+    parser.add_argument("--output", default="reports/benchmarks/portfolio.json", help="Where to write JSON results")
+    args = parser.parse_args(argv)
+
+    results = run_portfolio_benchmarks(args.contracts, args.findings, repeats=args.repeats)
+    print(format_results(results))
+    print(f"\nLoaded {args.contracts:,} contracts in {results[0].extra['load_seconds']:.1f}s.")
+    print(f"Saved results to {write_results(results, args.output, profile='portfolio')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""Benchmark report assembly and payload size for a large (1,500-finding) report.
+
+Compares the previous serialization path, which rebuilt every explanation and
+deep-copied findings with ``dataclasses.asdict``, against the current compact
+layout that reuses the explanation stored on each finding and lists every
+guidance passage once in a ``sources`` table. It also compares the peak
+memory of ``json.dumps`` over the report dict with the streaming writer.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.report_assembly --findings 1500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, replace
+from typing import Any, Callable, Sequence
+
+from benchmarks.harness import BenchmarkResult, format_results, measure, write_results
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.explanations import build_clause_explanation
+from contract_risk.assistant.reporting import (
+    build_sources_table,
+    build_structured_report,
+    expand_report,
+    serialize_finding,
+    write_report_json,
+)
+from contract_risk.assistant.state import AgentState, ClausePrediction, EvidenceItem, RiskFinding
+from contract_risk.assistant.workflow import build_summary, complete_workflow, create_agent_state
+from contract_risk.risk.mapping import map_clause_type_to_risk
+
+CLAUSE_TYPES = ("Liability", "Indemnity", "Termination", "Payment Terms", "Confidentiality", "Governing Law")
+
+
+def build_large_state(finding_count: int, evidence_per_finding: int = 3, *, cache_explanations: bool = True) -> AgentState:
+    """Create a completed agent state with ``finding_count`` evidence-backed findings.
+
+    Evidence cites the bundled guidance corpus, so passages repeat across
+    findings the way they do in real reports.
+    """
+    corpus = load_legal_guidance_corpus()
+    predictions: list[ClausePrediction] = []
+    findings: list[RiskFinding] = []
+    for index in range(finding_count):
+        clause_type = CLAUSE_TYPES[index % len(CLAUSE_TYPES)]
+        risk = map_clause_type_to_risk(clause_type)
+        prediction = ClausePrediction(
+            clause_id=f"C{index + 1:04d}",
+            clause_text=f"{clause_type} clause {index}: the parties agree to the obligations set out in this section.",
+            predicted_type=clause_type,
+            severity=risk.severity,
+            risk_score=risk.score,
+        )
+        records = [corpus[(index + offset) % len(corpus)] for offset in range(evidence_per_finding)]
+        evidence = tuple(
+            EvidenceItem(
+                clause_id=prediction.clause_id,
+                source_id=record.id,
+                source_title=record.title,
+                source_url=record.source_url,
+                snippet=record.passage,
+                score=round(0.5 - offset * 0.05, 4),
+            )
+            for offset, record in enumerate(records)
+        )
+        explanation = build_clause_explanation(prediction, evidence)
+        predictions.append(prediction)
+        findings.append(
+            RiskFinding(
+                clause_id=prediction.clause_id,
+                clause_text=prediction.clause_text,
+                predicted_type=prediction.predicted_type,
+                severity=prediction.severity,
+                risk_score=prediction.risk_score,
+                explanation=explanation.why_risky,
+                mitigation_action=f"Review the {clause_type.lower()} wording with counsel.",
+                evidence=evidence,
+                clause_explanation=explanation if cache_explanations else None,
+            )
+        )
+
+    state = create_agent_state("synthetic contract", predictions)
+    state.findings.extend(findings)
+    build_summary(state, contract_name="Synthetic 1,500-finding contract")
+    complete_workflow(state)
+    return state
+
+
+def legacy_sections(state: AgentState) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Reproduce the previous findings and explanation serialization.
+
+    Run it on a state built with ``cache_explanations=False`` so ``asdict``
+    copies exactly what the previous finding layout held.
+    """
+    findings = [asdict(finding) for finding in state.findings]
+    for finding in findings:
+        del finding["clause_explanation"]
+        del finding["reused_from"]
+    explanations = [asdict(build_clause_explanation(finding, finding.evidence)) for finding in state.findings]
+    return findings, explanations
+
+
+def current_sections(state: AgentState) -> tuple[list[dict[str, Any]], dict[str, dict[str, str]]]:
+    """Serialize compact findings and the sources table through the current path."""
+    return [serialize_finding(finding) for finding in state.findings], build_sources_table(state)
+
+
+def payload_sizes(report: dict[str, Any]) -> dict[str, int]:
+    """Return JSON sizes in bytes for the compact report and its expanded form."""
+    compact = len(json.dumps(report).encode("utf-8"))
+    expanded = len(json.dumps(expand_report(report)).encode("utf-8"))
+    return {"compact_bytes": compact, "expanded_bytes": expanded}
+
+
+class _NullSink:
+    """Text sink that discards everything written to it, like a fast socket."""
+
+    def write(self, chunk: str) -> int:
+        return len(chunk)
+
+
+def peak_alloc_bytes(func: Callable[[], object]) -> int:
+    """Return the peak traced allocation while ``func`` runs."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def dump_report_json(state: AgentState) -> None:
+    """Write the report the materialized way: build the dict, then the string."""
+    _NullSink().write(json.dumps(build_structured_report(state), indent=2))
+
+
+def stream_report_json(state: AgentState) -> None:
+    """Write the report through the streaming writer."""
+    write_report_json(state, _NullSink(), indent=2)
+
+
+def run_report_assembly_benchmarks(finding_count: int = 1500, *, repeats: int = 5) -> list[BenchmarkResult]:
+    """Time the legacy and current serialization paths and the full report build."""
+    state = build_large_state(finding_count)
+    legacy_state = build_large_state(finding_count, cache_explanations=False)
+    report = build_structured_report(state)
+    expanded = expand_report(report)
+    if legacy_sections(legacy_state) != (expanded["identified_risks"], expanded["clause_explanations"]):
+        raise AssertionError("The expanded compact report no longer matches the legacy output.")
+
+    params = {"findings": finding_count}
+    sizes = payload_sizes(report)
+    return [
+        measure(
+            "report_sections_legacy",
+            lambda: legacy_sections(legacy_state),
+            params=params,
+            repeats=repeats,
+            items=finding_count,
+        ),
+        measure(
+            "report_sections",
+            lambda: current_sections(state),
+            params=params,
+            repeats=repeats,
+            items=finding_count,
+        ),
+        measure(
+            "build_structured_report",
+            lambda: build_structured_report(state),
+            params=params,
+            repeats=repeats,
+            items=finding_count,
+        ),
+        _with_extra(
+            measure("expand_report", lambda: expand_report(report), params=params, repeats=repeats, items=finding_count),
+            sizes,
+        ),
+        _with_extra(
+            measure("report_json_dumps", lambda: dump_report_json(state), params=params, repeats=repeats, items=finding_count),
+            {"peak_alloc_bytes": peak_alloc_bytes(lambda: dump_report_json(state))},
+        ),
+        _with_extra(
+            measure("report_json_stream", lambda: stream_report_json(state), params=params, repeats=repeats, items=finding_count),
+            {"peak_alloc_bytes": peak_alloc_bytes(lambda: stream_report_json(state))},
+        ),
+    ]
+
+
+def _with_extra(result: BenchmarkResult, extra: dict[str, Any]) -> BenchmarkResult:
+    """Attach extra measurements to a result."""
+    return replace(result, extra={**result.extra, **extra})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the report assembly benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark large report assembly.")
+    parser.add_argument("--findings", type=int, default=1500, help="Number of findings in the report")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats per case")
+    parser.add_argument("--output", default="reports/benchmarks/report_assembly.json", help="Where to write JSON results")
+    args = parser.parse_args(argv)
+
+    results = run_report_assembly_benchmarks(args.findings, repeats=args.repeats)
+    print(format_results(results))
+    legacy, current = results[0].median_seconds, results[1].median_seconds
+    sizes = results[3].extra
+    dumped, streamed = results[4].extra["peak_alloc_bytes"], results[5].extra["peak_alloc_bytes"]
+    print(f"\nCompact findings and sources serialize {legacy / current:.1f}x faster than the asdict path.")
+    print(
+        f"JSON payload: {sizes['expanded_bytes']:,} bytes expanded (report 2.0) -> "
+        f"{sizes['compact_bytes']:,} bytes compact (report 3.0), "
+        f"{1 - sizes['compact_bytes'] / sizes['expanded_bytes']:.0%} smaller."
+    )
+    print(f"Peak memory writing JSON: {dumped:,} bytes with json.dumps -> {streamed:,} bytes streamed.")
+    print(f"Saved results to {write_results(results, args.output, profile='report_assembly')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Benchmark report generation speedup against executor worker count.
+
+A synthetic contract is predicted once, then its report is generated serially
+and with thread and process pools of increasing size. Each pool is created
+once and passed in as an ``Executor``, so pool start-up is not timed. A
+synthetic guidance corpus stands in for a production-sized knowledge base.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.report_workers --clauses 1500 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Sequence
+
+from benchmarks.harness import BenchmarkResult, format_results, measure, write_results
+from benchmarks.report_assembly import _with_extra
+from benchmarks.synthetic import generate_contract, generate_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.assistant.service import DEFAULT_CHUNK_SIZE, generate_legal_assistance_report
+from contract_risk.features.segmentation import segment_clauses
+from contract_risk.models.inference import load_or_train_model
+from contract_risk.ui_support import analyze_contract_text
+
+
+def run_report_worker_benchmarks(
+    clause_count: int = 1500,
+    worker_counts: Sequence[int] = (1, 2, 4, 8),
+    *,
+    corpus_size: int = 2000,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    repeats: int = 3,
+) -> list[BenchmarkResult]:
+    """Time serial report generation and each executor kind at each worker count."""
+    model = load_or_train_model()
+    knowledge_base = build_knowledge_base(generate_guidance_corpus(corpus_size))
+    clauses = segment_clauses(generate_contract(clause_count * 250))[:clause_count]
+    text = "\n\n".join(clauses)
+    clause_frame = analyze_contract_text(text, model, generate_report=False).clause_frame
+
+    def generate(executor: Executor | None) -> dict:
+        return generate_legal_assistance_report(
+            text, clause_frame, knowledge_base=knowledge_base, executor=executor, chunk_size=chunk_size
+        )
+
+    params = {"clauses": len(clauses), "corpus": corpus_size, "chunk_size": chunk_size}
+    serial = measure("report_serial", lambda: generate(None), params=params, repeats=repeats, items=len(clauses))
+    expected = generate(None)
+    results = [serial]
+    for kind, pool_type in (("thread", ThreadPoolExecutor), ("process", ProcessPoolExecutor)):
+        for workers in worker_counts:
+            with pool_type(max_workers=workers) as pool:
+                report = generate(pool)
+                assert report["identified_risks"] == expected["identified_risks"], "parallel report differs"
+                assert report["fallback"] == expected["fallback"], "parallel fallback differs"
+                result = measure(
+                    f"report_{kind}_pool",
+                    lambda: generate(pool),
+                    params={**params, "workers": workers},
+                    repeats=repeats,
+                    items=len(clauses),
+                )
+            speedup = serial.median_seconds / result.median_seconds if result.median_seconds else 0.0
+            results.append(_with_extra(result, {"speedup": round(speedup, 2)}))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the report worker benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark report generation speedup versus worker count.")
+    parser.add_argument("--clauses", type=int, default=1500, help="Number of clauses in the contract")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to time")
+    parser.add_argument("--corpus", type=int, default=2000, help="Synthetic guidance passages in the knowledge base")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Clauses per executor task")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repeats per case")
+    parser.add_argument(
+        "--output", default="reports/benchmarks/report_workers.json", help="Where to write JSON results"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_report_worker_benchmarks(
+        args.clauses,
+        args.workers,
+        corpus_size=args.corpus,
+        chunk_size=args.chunk_size,
+        repeats=args.repeats,
+    )
+    print(format_results(results))
+    print("\nSpeedup over serial:")
+    for result in results[1:]:
+        print(f"  {result.name:<20} workers={result.params['workers']:<3} {result.extra['speedup']:.2f}x")
+    print(f"Saved results to {write_results(results, args.output, profile='report_workers')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Benchmark incremental re-analysis of a revised contract against a full analysis.
+
+A synthetic contract is analyzed once, then a revision with a fraction of its
+clauses edited, one clause inserted, and one removed is analyzed both from
+scratch and against the first analysis.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.revisions --clauses 1500 --edit-fraction 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from typing import Sequence
+
+from benchmarks.harness import BenchmarkResult, format_results, measure, write_results
+from benchmarks.report_assembly import _with_extra
+from benchmarks.synthetic import generate_contract
+from contract_risk.assistant.service import _load_or_build_knowledge_base
+from contract_risk.features.segmentation import segment_clauses
+from contract_risk.models.inference import load_or_train_model
+from contract_risk.ui_support import analyze_contract_revision, analyze_contract_text
+
+AMENDMENT = "This clause is amended by mutual written agreement of the parties."
+
+
+def revise_clauses(clauses: Sequence[str], edit_fraction: float, *, seed: int = 0) -> list[str]:
+    """Edit a fraction of clauses in place, insert one clause, and drop one."""
+    rng = random.Random(seed)
+    revised = list(clauses)
+    for index in rng.sample(range(len(revised)), max(1, int(len(revised) * edit_fraction))):
+        revised[index] = f"{revised[index]} {AMENDMENT}"
+    revised.insert(len(revised) // 2, "The supplier shall indemnify the customer against all third-party claims.")
+    del revised[len(revised) // 4]
+    return revised
+
+
+def run_revision_benchmarks(
+    clause_count: int = 1500,
+    edit_fraction: float = 0.05,
+    *,
+    repeats: int = 3,
+) -> list[BenchmarkResult]:
+    """Time a full analysis and an incremental analysis of the same revision."""
+    model = load_or_train_model()
+    knowledge_base = _load_or_build_knowledge_base()
+    clauses = segment_clauses(generate_contract(clause_count * 250))[:clause_count]
+    original_text = "\n\n".join(clauses)
+    revised_text = "\n\n".join(revise_clauses(clauses, edit_fraction))
+    previous = analyze_contract_text(original_text, model, knowledge_base=knowledge_base)
+
+    params = {"clauses": len(clauses), "edit_fraction": edit_fraction}
+    full = measure(
+        "revision_full_analysis",
+        lambda: analyze_contract_text(revised_text, model, knowledge_base=knowledge_base),
+        params=params,
+        repeats=repeats,
+        items=lambda result: len(result.clauses),
+    )
+    revision = analyze_contract_revision(revised_text, model, previous, knowledge_base=knowledge_base)
+    incremental = measure(
+        "revision_incremental",
+        lambda: analyze_contract_revision(revised_text, model, previous, knowledge_base=knowledge_base),
+        params=params,
+        repeats=repeats,
+        items=lambda revision: len(revision.result.clauses),
+    )
+    alignment = revision.result.revision
+    assert alignment is not None
+    extra = {
+        "reused_clauses": len(alignment.unchanged),
+        "analyzed_clauses": len(alignment.changed) + len(alignment.added),
+        "delta": {key: len(value) for key, value in revision.delta.asdict().items() if isinstance(value, list)},
+    }
+    return [full, _with_extra(incremental, extra)]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the revision benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark incremental contract revision analysis.")
+    parser.add_argument("--clauses", type=int, default=1500, help="Number of clauses in the contract")
+    parser.add_argument("--edit-fraction", type=float, default=0.05, help="Fraction of clauses edited in the revision")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repeats per case")
+    parser.add_argument("--output", default="reports/benchmarks/revisions.json", help="Where to write JSON results")
+    args = parser.parse_args(argv)
+
+    results = run_revision_benchmarks(args.clauses, args.edit_fraction, repeats=args.repeats)
+    print(format_results(results))
+    full, incremental = results
+    print(
+        f"\nIncremental re-analysis reused {incremental.extra['reused_clauses']} clauses and analyzed "
+        f"{incremental.extra['analyzed_clauses']}: {full.median_seconds:.3f}s -> {incremental.median_seconds:.3f}s "
+        f"({incremental.median_seconds / full.median_seconds:.0%} of a full analysis)."
+    )
+    print(f"Saved results to {write_results(results, args.output, profile='revisions')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
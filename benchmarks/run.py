@@ -0,0 +1,259 @@
+"""Run the pipeline benchmarks and optionally compare against a baseline.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.run --profile quick --output reports/benchmarks/current.json
+    PYTHONPATH=src:. python -m benchmarks.run --profile quick --compare reports/benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    compare_results,
+    format_comparison,
+    format_results,
+    load_results,
+    measure,
+    write_results,
+)
+from benchmarks.report_assembly import _with_extra
+from benchmarks.synthetic import generate_contract, generate_guidance_corpus, load_clause_templates
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.pdf_export import build_legal_assistance_report_pdf
+from contract_risk.assistant.retrieval import DEFAULT_QUERY_CACHE_SIZE, build_knowledge_base
+from contract_risk.assistant.service import generate_legal_assistance_report
+from contract_risk.config import ProjectConfig
+from contract_risk.features.segmentation import segment_clauses
+from contract_risk.models.cascade import RuleCascadeClassifier
+from contract_risk.models.inference import load_or_train_model, predict_clauses
+from contract_risk.risk.mapping import map_clause_type_to_risk
+
+SEARCH_QUERY_COUNT = 50
+
+
+@dataclass(frozen=True)
+class BenchmarkProfile:
+    """Input sizes and repeat counts for one benchmark run."""
+
+    document_chars: tuple[int, ...]
+    corpus_records: tuple[int, ...]
+    repeats: int
+    report_max_chars: int
+
+
+PROFILES: dict[str, BenchmarkProfile] = {
+    "quick": BenchmarkProfile((1_000, 10_000, 100_000), (10, 1_000), repeats=3, report_max_chars=100_000),
+    "standard": BenchmarkProfile(
+        (1_000, 10_000, 100_000, 1_000_000),
+        (10, 1_000, 100_000),
+        repeats=5,
+        report_max_chars=1_000_000,
+    ),
+    "full": BenchmarkProfile(
+        (1_000, 10_000, 100_000, 1_000_000, 5_000_000),
+        (10, 1_000, 100_000, 1_000_000),
+        repeats=3,
+        report_max_chars=1_000_000,
+    ),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the benchmark argument parser."""
+    parser = argparse.ArgumentParser(description="Benchmark the contract analysis pipeline.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="Input size profile")
+    parser.add_argument("--doc-sizes", type=int, nargs="+", help="Override document sizes in characters")
+    parser.add_argument("--corpus-sizes", type=int, nargs="+", help="Override guidance corpus sizes")
+    parser.add_argument("--repeats", type=int, help="Override timed repeats per case")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic generators")
+    parser.add_argument("--model-path", default=None, help="Override model artifact path")
+    parser.add_argument("--output", default="reports/benchmarks/latest.json", help="Where to write JSON results")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown of the median that counts as a regression (0.10 = 10%%)",
+    )
+    return parser
+
+
+def _prediction_rows(clauses: Sequence[str], labels: Sequence[str]) -> list[dict[str, object]]:
+    """Shape predictions the way the app hands them to the assistant."""
+    rows: list[dict[str, object]] = []
+    for index, (clause, label) in enumerate(zip(clauses, labels), start=1):
+        risk = map_clause_type_to_risk(label)
+        rows.append(
+            {
+                "clause_id": index,
+                "clause_text": clause,
+                "predicted_type": label,
+                "severity": risk.severity,
+                "risk_score": risk.score,
+            }
+        )
+    return rows
+
+
+def run_document_benchmarks(
+    model: object,
+    document_chars: Sequence[int],
+    *,
+    repeats: int,
+    report_max_chars: int,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """Benchmark segmentation, prediction with and without the rule cascade, report generation, and PDF export."""
+    templates = load_clause_templates()
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    results: list[BenchmarkResult] = []
+
+    for chars in document_chars:
+        text = generate_contract(chars, seed=seed, templates=templates)
+        params = {"chars": chars}
+        results.append(measure("segment_clauses", lambda: segment_clauses(text), params=params, repeats=repeats, items=len))
+
+        clauses = segment_clauses(text)
+        results.append(
+            measure(
+                "predict_clauses",
+                lambda: predict_clauses(model, clauses),
+                params=params,
+                repeats=repeats,
+                items=len(clauses),
+            )
+        )
+        cascade = RuleCascadeClassifier(model)
+        cascaded = measure(
+            "predict_clauses_cascade",
+            lambda: predict_clauses(cascade, clauses),
+            params=params,
+            repeats=repeats,
+            items=len(clauses),
+        )
+        results.append(_with_extra(cascaded, {"cascade": cascade.stats.asdict()}))
+        if chars > report_max_chars:
+            continue
+
+        rows = _prediction_rows(clauses, predict_clauses(model, clauses))
+
+        def _generate_report() -> dict:
+            # A cold query cache per run, so repeats time one contract rather than cache hits.
+            knowledge_base.clear_query_cache()
+            return generate_legal_assistance_report(text, rows, knowledge_base=knowledge_base)
+
+        results.append(
+            measure(
+                "generate_legal_assistance_report",
+                _generate_report,
+                params=params,
+                repeats=repeats,
+                items=len(rows),
+            )
+        )
+
+        report = generate_legal_assistance_report(text, rows, knowledge_base=knowledge_base)
+        results.append(
+            measure(
+                "build_legal_assistance_report_pdf",
+                lambda: build_legal_assistance_report_pdf(report),
+                params=params,
+                repeats=repeats,
+                items=len(report["identified_risks"]),
+            )
+        )
+    return results
+
+
+def run_search_benchmarks(
+    corpus_records: Sequence[int],
+    *,
+    repeats: int,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """Benchmark knowledge base construction and search per corpus size."""
+    queries = [f"{template.heading}. {template.body}" for template in load_clause_templates()]
+    queries = [queries[index % len(queries)] for index in range(SEARCH_QUERY_COUNT)]
+    results: list[BenchmarkResult] = []
+
+    for count in corpus_records:
+        records = generate_guidance_corpus(count, seed=seed)
+        params = {"records": count}
+        results.append(
+            measure(
+                "build_knowledge_base",
+                lambda: build_knowledge_base(records),
+                params=params,
+                repeats=1,
+                warmup=0,
+                items=count,
+            )
+        )
+        knowledge_base = build_knowledge_base(records)
+
+        def _search_all() -> int:
+            for query in queries:
+                knowledge_base.search(query, top_k=5)
+            return len(queries)
+
+        knowledge_base.query_cache_size = 0
+        results.append(
+            measure("knowledge_base_search", _search_all, params=params, repeats=repeats, items=len(queries))
+        )
+        knowledge_base.query_cache_size = DEFAULT_QUERY_CACHE_SIZE
+        knowledge_base.clear_query_cache()
+        cached = measure(
+            "knowledge_base_search_cached", _search_all, params=params, repeats=repeats, items=len(queries)
+        )
+        results.append(_with_extra(cached, {"query_cache": knowledge_base.query_cache_stats()}))
+        del knowledge_base, records
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the selected benchmarks and return a process exit code."""
+    args = _build_parser().parse_args(argv)
+    profile = PROFILES[args.profile]
+    repeats = args.repeats or profile.repeats
+    document_chars = tuple(args.doc_sizes or profile.document_chars)
+    corpus_records = tuple(args.corpus_sizes or profile.corpus_records)
+
+    model = load_or_train_model(args.model_path or ProjectConfig().model_path)
+    results = run_document_benchmarks(
+        model,
+        document_chars,
+        repeats=repeats,
+        report_max_chars=profile.report_max_chars,
+        seed=args.seed,
+    )
+    results.extend(run_search_benchmarks(corpus_records, repeats=repeats, seed=args.seed))
+
+    output = write_results(results, args.output, profile=args.profile)
+    print(format_results(results))
+    print(f"\nSaved results to {output}")
+
+    if not args.compare:
+        return 0
+
+    baseline = load_results(args.compare)
+    current = {result.key: result for result in results}
+    print()
+    print(format_comparison(baseline, current, threshold=args.threshold))
+    regressions = compare_results(baseline, current, threshold=args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    print(f"\nNo regressions above {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Measure import-time startup cost with ``python -X importtime``.
+
+Usage::
+
+    PYTHONPATH=src:. python -m benchmarks.startup --output reports/benchmarks/startup.json
+    PYTHONPATH=src:. python -m benchmarks.startup --compare reports/benchmarks/startup_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    compare_results,
+    format_comparison,
+    load_results,
+    write_results,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET_PATH = Path(__file__).resolve().with_name("startup_budget.json")
+
+
+@dataclass(frozen=True)
+class StartupTarget:
+    """One import whose startup cost is budgeted."""
+
+    name: str
+    code: str
+    max_ms: float
+    forbidden: tuple[str, ...] = ()
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Parsed ``-X importtime`` output for one interpreter run."""
+
+    cumulative_us: dict[str, int]
+    top_level: tuple[str, ...]
+
+    @property
+    def modules(self) -> set[str]:
+        """Return every module imported during the run."""
+        return set(self.cumulative_us)
+
+
+def load_startup_targets(path: str | Path = DEFAULT_BUDGET_PATH) -> list[StartupTarget]:
+    """Read startup targets and their budgets from JSON."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [
+        StartupTarget(
+            name=name,
+            code=str(entry["code"]),
+            max_ms=float(entry["max_ms"]),
+            forbidden=tuple(entry.get("forbidden", ())),
+            description=str(entry.get("description", "")),
+        )
+        for name, entry in payload.items()
+    ]
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Parse ``import time: self | cumulative | name`` lines.
+
+    Nesting is encoded as extra leading spaces before the module name; only
+    unindented entries are top-level imports whose cumulative time counts.
+    """
+    cumulative: dict[str, int] = {}
+    top_level: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name_field = parts[2].rstrip()
+        name = name_field.strip()
+        cumulative[name] = int(parts[1])
+        if len(name_field) - len(name_field.lstrip()) <= 1:
+            top_level.append(name)
+    return ImportProfile(cumulative_us=cumulative, top_level=tuple(top_level))
+
+
+def profile_imports(code: str, *, python: str = sys.executable) -> ImportProfile:
+    """Run ``code`` in a fresh interpreter with ``-X importtime``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT / "src"), str(ROOT)])
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Import failed for {code!r}:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def startup_seconds(profile: ImportProfile, interpreter_modules: set[str]) -> float:
+    """Sum top-level import time, excluding modules the bare interpreter loads."""
+    total_us = sum(profile.cumulative_us[name] for name in profile.top_level if name not in interpreter_modules)
+    return total_us / 1_000_000
+
+
+def forbidden_loaded(profile: ImportProfile, forbidden: Sequence[str]) -> list[str]:
+    """Return forbidden top-level packages that were imported."""
+    roots = {name.split(".", 1)[0] for name in profile.modules}
+    return sorted(name for name in forbidden if name in roots)
+
+
+def run_startup_benchmarks(targets: Sequence[StartupTarget], *, repeats: int = 5) -> list[BenchmarkResult]:
+    """Measure each target ``repeats`` times in fresh interpreters."""
+    interpreter_modules = profile_imports("pass").modules
+    results: list[BenchmarkResult] = []
+    for target in targets:
+        timings: list[float] = []
+        profile: ImportProfile | None = None
+        for _ in range(max(1, repeats)):
+            profile = profile_imports(target.code)
+            timings.append(startup_seconds(profile, interpreter_modules))
+        assert profile is not None
+        results.append(
+            BenchmarkResult(
+                name="import_time",
+                params={"target": target.name},
+                repeats=len(timings),
+                min_seconds=min(timings),
+                median_seconds=statistics.median(timings),
+                mean_seconds=statistics.fmean(timings),
+                items=len(profile.modules - interpreter_modules),
+                extra={"forbidden_loaded": forbidden_loaded(profile, target.forbidden)},
+            )
+        )
+    return results
+
+
+def check_budgets(results: Sequence[BenchmarkResult], targets: Sequence[StartupTarget]) -> list[str]:
+    """Return a message for every target over its time budget or loading a forbidden module."""
+    by_name = {target.name: target for target in targets}
+    violations: list[str] = []
+    for result in results:
+        target = by_name[result.params["target"]]
+        median_ms = result.median_seconds * 1000
+        if median_ms > target.max_ms:
+            violations.append(f"{target.name}: {median_ms:.0f} ms exceeds the {target.max_ms:.0f} ms budget")
+        if result.extra.get("forbidden_loaded"):
+            violations.append(f"{target.name}: imports {', '.join(result.extra['forbidden_loaded'])} at startup")
+    return violations
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Measure startup imports, check budgets, and optionally compare with a baseline."""
+    parser = argparse.ArgumentParser(description="Measure import-time startup cost.")
+    parser.add_argument("--budget", default=str(DEFAULT_BUDGET_PATH), help="Startup budget JSON")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--output", default="reports/benchmarks/startup.json", help="Where to write JSON results")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    targets = load_startup_targets(args.budget)
+    results = run_startup_benchmarks(targets, repeats=args.repeats)
+    output = write_results(results, args.output, profile="startup")
+    print(f"{'target':<10} {'median':>10} {'min':>10} {'budget':>10} {'modules':>8}")
+    for target, result in zip(targets, results):
+        print(
+            f"{target.name:<10} {result.median_seconds * 1000:>8.1f}ms {result.min_seconds * 1000:>8.1f}ms "
+            f"{target.max_ms:>8.0f}ms {result.items:>8}"
+        )
+    print(f"\nSaved results to {output}")
+
+    violations = check_budgets(results, targets)
+    for violation in violations:
+        print(f"BUDGET: {violation}")
+    failed = bool(violations)
+
+    if args.compare:
+        current = {result.key: result for result in results}
+        baseline = load_results(args.compare)
+        print()
+        print(format_comparison(baseline, current, threshold=args.threshold))
+        failed = failed or bool(compare_results(baseline, current, threshold=args.threshold))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Deterministic synthetic contracts and guidance corpora for benchmarks."""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Sequence
+
+from contract_risk.assistant.corpus import LegalGuidanceRecord, load_legal_guidance_corpus
+
+ROOT = Path(__file__).resolve().parents[1]
+TEMPLATE_PATHS: tuple[Path, ...] = (
+    ROOT / "data" / "demo" / "demo_contract.txt",
+    *sorted((ROOT / "data" / "raw" / "samples").glob("*.txt")),
+)
+HEADING_PATTERN = re.compile(r"^\s*\d+(?:\.\d+)*\s+(.+)$")
+PARTY_NAMES = ("Client", "Vendor", "Service Provider", "Supplier", "Customer", "Licensor", "Licensee")
+JURISDICTIONS = ("India", "the State of New York", "England and Wales", "Singapore", "Delaware")
+FILLER_SENTENCES = (
+    "The obligations in this section survive expiry of the Agreement.",
+    "Notices under this section shall be delivered in writing to the registered address.",
+    "Any amendment to this section requires the signed consent of both parties.",
+    "Nothing in this section limits the rights of either party under applicable law.",
+)
+
+
+@dataclass(frozen=True)
+class ClauseTemplate:
+    """One heading and body pair lifted from a bundled contract."""
+
+    heading: str
+    body: str
+
+
+def load_clause_templates(paths: Sequence[Path] = TEMPLATE_PATHS) -> list[ClauseTemplate]:
+    """Parse numbered ``heading`` / ``body`` blocks from the template contracts."""
+    templates: list[ClauseTemplate] = []
+    for path in paths:
+        blocks = re.split(r"\n\s*\n", path.read_text(encoding="utf-8").strip())
+        for block in blocks:
+            lines = [line.strip() for line in block.splitlines() if line.strip()]
+            if len(lines) < 2:
+                continue
+            match = HEADING_PATTERN.match(lines[0])
+            if match is None:
+                continue
+            templates.append(ClauseTemplate(heading=match.group(1), body=" ".join(lines[1:])))
+    if not templates:
+        raise ValueError("No clause templates were found in the bundled contracts.")
+    return templates
+
+
+def _vary_body(body: str, rng: random.Random) -> str:
+    """Swap parties, numbers, and jurisdictions and pad with filler sentences."""
+    text = body
+    for name in PARTY_NAMES:
+        if name in text:
+            text = text.replace(name, rng.choice(PARTY_NAMES))
+    text = re.sub(r"\d+", lambda _: str(rng.randint(2, 90)), text)
+    text = re.sub(r"laws of [A-Z][\w ]+\.", lambda _: f"laws of {rng.choice(JURISDICTIONS)}.", text)
+    extra = rng.randint(0, 2)
+    if extra:
+        text = " ".join([text, *rng.sample(FILLER_SENTENCES, extra)])
+    return text
+
+
+def generate_contract(
+    target_chars: int,
+    *,
+    seed: int = 0,
+    templates: Sequence[ClauseTemplate] | None = None,
+) -> str:
+    """Build a numbered contract of roughly ``target_chars`` characters.
+
+    The output is deterministic for a given seed and always ends on a whole
+    clause, so it may overshoot the target by at most one clause.
+    """
+    pool = list(templates) if templates is not None else load_clause_templates()
+    rng = random.Random(seed)
+    parts: list[str] = []
+    size = 0
+    number = 1
+    while size < target_chars:
+        template = rng.choice(pool)
+        block = f"{number} {template.heading}\n{_vary_body(template.body, rng)}"
+        parts.append(block)
+        size += len(block) + 2
+        number += 1
+    return "\n\n".join(parts)
+
+
+def generate_guidance_corpus(
+    record_count: int,
+    *,
+    seed: int = 0,
+    base_records: Sequence[LegalGuidanceRecord] | None = None,
+) -> list[LegalGuidanceRecord]:
+    """Expand the bundled guidance corpus to ``record_count`` unique records.
+
+    Each synthetic record keeps the tags and topic of its base record and gets
+    a passage built from the base passage plus sentences from other records,
+    so the vocabulary grows with the corpus like a real guidance library.
+    """
+    base = list(base_records) if base_records is not None else load_legal_guidance_corpus()
+    sentences = [
+        sentence.strip()
+        for record in base
+        for sentence in re.split(r"(?<=[.!?])\s+", record.passage)
+        if sentence.strip()
+    ]
+    rng = random.Random(seed)
+    records: list[LegalGuidanceRecord] = []
+    for index in range(record_count):
+        source = base[index % len(base)]
+        if index < len(base):
+            records.append(source)
+            continue
+        mixed = " ".join(rng.sample(sentences, min(2, len(sentences))))
+        records.append(
+            replace(
+                source,
+                id=f"{source.id}-syn-{index:07d}",
+                title=f"{source.title} (variant {index})",
+                jurisdiction=rng.choice(JURISDICTIONS),
+                passage=f"{source.passage} {mixed} Reference {index}.",
+            )
+        )
+    return records
@@ -0,0 +1,94 @@
+"""Concurrent load test for the local analysis HTTP service."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEMO_CONTRACT = ROOT / "data" / "demo" / "demo_contract.txt"
+
+
+async def _post(host: str, port: int, path: str, payload: dict[str, object]) -> int:
+    """Send one JSON POST and return the HTTP status code."""
+    body = json.dumps(payload).encode("utf-8")
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+        + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()
+    writer.close()
+    return int(status_line.split()[1])
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(percent / 100 * len(values)) - 1))
+    return values[rank]
+
+
+async def run_load_test(args: argparse.Namespace) -> dict[str, object]:
+    """Fire ``requests`` calls with bounded concurrency and collect latencies."""
+    contract_text = DEMO_CONTRACT.read_text(encoding="utf-8")
+    if args.endpoint == "/predict":
+        clauses = [line.strip() for line in contract_text.splitlines() if len(line.strip()) > 30]
+        payload: dict[str, object] = {"clauses": clauses}
+    else:
+        payload = {"text": contract_text, "contract_name": "Load Test", "generate_report": not args.no_report}
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    async def _one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            status = await _post(args.host, args.port, args.endpoint, payload)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 200:
+                latencies.append(elapsed_ms)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(args.requests)))
+    wall_seconds = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "endpoint": args.endpoint,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "status_counts": statuses,
+        "throughput_rps": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    """Parse arguments and print a JSON latency summary."""
+    parser = argparse.ArgumentParser(description="Load test the contract analysis service")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Service host")
+    parser.add_argument("--port", type=int, default=8765, help="Service port")
+    parser.add_argument("--endpoint", choices=["/analyze", "/predict"], default="/analyze", help="Endpoint to call")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent in-flight requests")
+    parser.add_argument("--no-report", action="store_true", help="Skip assistant report generation on /analyze")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run_load_test(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
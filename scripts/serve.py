@@ -0,0 +1,18 @@
+"""CLI wrapper for the local analysis HTTP service."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from contract_risk.cli import main
+
+
+if __name__ == "__main__":
+    sys.argv.insert(1, "serve")
+    main()
@@ -1,73 +1,87 @@
-"""Agentic legal assistance helpers for Milestone 2."""
+"""Agentic legal assistance helpers for Milestone 2.
 
-from contract_risk.assistant.corpus import LegalGuidanceRecord, load_legal_guidance_corpus
-from contract_risk.assistant.explanations import ClauseExplanation, build_clause_explanation
-from contract_risk.assistant.guardrails import (
-    MIN_EVIDENCE_SCORE,
-    STRICT_GENERATION_TEMPLATE,
-    build_generation_prompt,
-    evidence_is_strong,
-    filter_supported_evidence,
-)
-from contract_risk.assistant.preprocessing import RetrievalChunk, build_retrieval_chunks
-from contract_risk.assistant.reporting import (
-    LEGAL_DISCLAIMER,
-    REPORT_VERSION,
-    build_clause_explanations,
-    build_clause_references,
-    build_severity_assessment,
-    build_structured_report,
-)
-from contract_risk.assistant.retrieval import (
-    LegalKnowledgeBase,
-    RetrievalHit,
-    RetrievalQuery,
-    build_knowledge_base,
-    build_retrieval_query,
-    retrieve_best_practices,
-    retrieve_clause_guidance,
-    retrieve_contract_guidance,
-    select_top_hits,
-)
-from contract_risk.assistant.service import generate_legal_assistance_report
-from contract_risk.assistant.state import AgentState, ClausePrediction, ContractSummary, EvidenceItem, RiskFinding, WorkflowStage
-from contract_risk.assistant.workflow import build_summary, complete_workflow, create_agent_state
+Public names are resolved on first access so that importing the package does
+not load scikit-learn, pandas, or joblib until a helper that needs them is used.
+"""
 
-__all__ = [
-    "AgentState",
-    "ClausePrediction",
-    "ClauseExplanation",
-    "ContractSummary",
-    "EvidenceItem",
-    "LegalGuidanceRecord",
-    "LegalKnowledgeBase",
-    "RetrievalChunk",
-    "RetrievalHit",
-    "RetrievalQuery",
-    "RiskFinding",
-    "WorkflowStage",
-    "build_knowledge_base",
-    "build_clause_references",
-    "build_clause_explanations",
-    "build_generation_prompt",
-    "build_retrieval_query",
-    "build_retrieval_chunks",
-    "build_severity_assessment",
-    "build_structured_report",
-    "build_clause_explanation",
-    "build_summary",
-    "complete_workflow",
-    "create_agent_state",
-    "LEGAL_DISCLAIMER",
-    "generate_legal_assistance_report",
-    "MIN_EVIDENCE_SCORE",
-    "STRICT_GENERATION_TEMPLATE",
-    "load_legal_guidance_corpus",
-    "evidence_is_strong",
-    "filter_supported_evidence",
-    "retrieve_best_practices",
-    "retrieve_clause_guidance",
-    "retrieve_contract_guidance",
-    "REPORT_VERSION",
-    "select_top_hits",
-]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS: dict[str, str] = {
+    "AgentState": "contract_risk.assistant.state",
+    "ClausePrediction": "contract_risk.assistant.state",
+    "ClauseExplanation": "contract_risk.assistant.explanations",
+    "ContractSummary": "contract_risk.assistant.state",
+    "EvidenceItem": "contract_risk.assistant.state",
+    "LegalGuidanceRecord": "contract_risk.assistant.corpus",
+    "LegalKnowledgeBase": "contract_risk.assistant.retrieval",
+    "RetrievalChunk": "contract_risk.assistant.preprocessing",
+    "RetrievalHit": "contract_risk.assistant.retrieval",
+    "RetrievalQuery": "contract_risk.assistant.retrieval",
+    "RiskFinding": "contract_risk.assistant.state",
+    "StageMetrics": "contract_risk.assistant.state",
+    "WorkflowStage": "contract_risk.assistant.state",
+    "build_knowledge_base": "contract_risk.assistant.retrieval",
+    "build_clause_references": "contract_risk.assistant.reporting",
+    "build_clause_explanations": "contract_risk.assistant.reporting",
+    "build_generation_prompt": "contract_risk.assistant.guardrails",
+    "build_performance_summary": "contract_risk.assistant.reporting",
+    "build_retrieval_budget": "contract_risk.assistant.reporting",
+    "build_retrieval_query": "contract_risk.assistant.retrieval",
+    "build_retrieval_chunks": "contract_risk.assistant.preprocessing",
+    "build_severity_assessment": "contract_risk.assistant.reporting",
+    "build_structured_report": "contract_risk.assistant.reporting",
+    "build_clause_explanation": "contract_risk.assistant.explanations",
+    "build_summary": "contract_risk.assistant.workflow",
+    "complete_workflow": "contract_risk.assistant.workflow",
+    "create_agent_state": "contract_risk.assistant.workflow",
+    "LEGAL_DISCLAIMER": "contract_risk.assistant.reporting",
+    "generate_legal_assistance_report": "contract_risk.assistant.service",
+    "MIN_EVIDENCE_SCORE": "contract_risk.assistant.guardrails",
+    "STRICT_GENERATION_TEMPLATE": "contract_risk.assistant.guardrails",
+    "load_legal_guidance_corpus": "contract_risk.assistant.corpus",
+    "evidence_is_strong": "contract_risk.assistant.guardrails",
+    "filter_supported_evidence": "contract_risk.assistant.guardrails",
+    "retrieve_best_practices": "contract_risk.assistant.retrieval",
+    "retrieve_clause_guidance": "contract_risk.assistant.retrieval",
+    "retrieve_contract_guidance": "contract_risk.assistant.retrieval",
+    "REPORT_VERSION": "contract_risk.assistant.reporting",
+    "EXPANDED_REPORT_VERSION": "contract_risk.assistant.reporting",
+    "build_sources_table": "contract_risk.assistant.reporting",
+    "expand_report": "contract_risk.assistant.reporting",
+    "is_compact_report": "contract_risk.assistant.reporting",
+    "list_sources_consulted": "contract_risk.assistant.reporting",
+    "resolve_finding_evidence": "contract_risk.assistant.reporting",
+    "select_top_hits": "contract_risk.assistant.retrieval",
+    "serialize_evidence": "contract_risk.assistant.reporting",
+    "serialize_finding": "contract_risk.assistant.reporting",
+    "iter_report_json": "contract_risk.assistant.reporting",
+    "write_report_json": "contract_risk.assistant.reporting",
+    "stream_legal_assistance_report": "contract_risk.assistant.service",
+    "predictions_from_columns": "contract_risk.assistant.service",
+    "finding_evidence_items": "contract_risk.assistant.reporting",
+    "IndexedClause": "contract_risk.assistant.near_duplicates",
+    "NearDuplicateIndex": "contract_risk.assistant.near_duplicates",
+    "NearDuplicateMatch": "contract_risk.assistant.near_duplicates",
+    "clause_shingles": "contract_risk.assistant.near_duplicates",
+    "PortfolioStore": "contract_risk.assistant.portfolio",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the export."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy exports in ``dir()`` output."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -2,64 +2,206 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Any, Sequence
+import bisect
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence
 
+from contract_risk.assistant.portfolio import MAX_LISTED_CONTRACTS
 from contract_risk.ui_support import ContractAnalysisResult
 
+if TYPE_CHECKING:
+    from contract_risk.assistant.near_duplicates import NearDuplicateIndex
 
-def build_risk_trend_summary(analyses: Sequence[ContractAnalysisResult]) -> dict[str, Any]:
-    """Aggregate multiple contract reports into repeated risk patterns."""
-    per_contract: list[dict[str, Any]] = []
-    severity_totals: Counter[str] = Counter()
-    pattern_occurrences: dict[str, list[str]] = defaultdict(list)
+SEVERITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
 
+
+def build_clause_recurrence(
+    analyses: Sequence[ContractAnalysisResult],
+    clause_index: NearDuplicateIndex,
+    *,
+    threshold: float | None = None,
+) -> list[dict[str, Any]]:
+    """List clauses that nearly duplicate clauses in other indexed contracts.
+
+    Each row names the other contracts the clause appears in. Rows are ordered
+    by how many contracts share the clause, then by severity.
+    """
+    rows: list[dict[str, Any]] = []
     for analysis in analyses:
-        if not analysis.report:
+        frame = analysis.clause_frame
+        if frame.empty:
             continue
+        for clause_id, text, predicted_type, severity in zip(
+            frame["clause_id"].tolist(),
+            frame["clause_text"].tolist(),
+            frame["predicted_type"].astype(str).tolist(),
+            frame["severity"].astype(str).tolist(),
+        ):
+            matches = clause_index.query(text, threshold=threshold, exclude_contract=analysis.contract_name)
+            if not matches:
+                continue
+            other_contracts = sorted({match.clause.contract_name for match in matches})
+            rows.append(
+                {
+                    "contract_name": analysis.contract_name,
+                    "clause_id": clause_id,
+                    "predicted_type": predicted_type,
+                    "severity": severity,
+                    "other_contract_count": len(other_contracts),
+                    "other_contracts": ", ".join(other_contracts),
+                    "best_similarity": round(matches[0].similarity, 3),
+                }
+            )
+    rows.sort(
+        key=lambda row: (
+            -row["other_contract_count"],
+            SEVERITY_ORDER.get(row["severity"], len(SEVERITY_ORDER)),
+            row["contract_name"],
+            row["clause_id"],
+        )
+    )
+    return rows
 
-        findings = analysis.report.get("identified_risks", [])
-        contract_severities: Counter[str] = Counter()
-        contract_types: Counter[str] = Counter()
 
+@dataclass(frozen=True)
+class _ContractTally:
+    """One contract's per-contract row and the counts it adds to the totals."""
+
+    row: dict[str, Any]
+    severities: Counter[str]
+    types: Counter[str]
+
+
+class RiskTrendAggregator:
+    """Incrementally maintained counts behind ``build_risk_trend_summary``.
+
+    Severity totals, occurrences per clause type, and the contracts behind
+    each type, kept sorted by name, are updated as contracts are added or
+    removed, so adding one contract costs only its own findings and
+    :meth:`summary` costs only the clause types. Per-contract rows come from
+    :meth:`per_contract`. Aggregators built from disjoint batches, for example
+    by parallel workers, can be combined with :meth:`merge`. A contract added
+    under a name already present replaces it.
+    """
+
+    def __init__(self) -> None:
+        self._contracts: dict[str, _ContractTally] = {}
+        self._severity_totals: Counter[str] = Counter()
+        self._type_occurrences: Counter[str] = Counter()
+        self._type_contracts: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+    def __contains__(self, contract_name: object) -> bool:
+        return contract_name in self._contracts
+
+    def add(self, analysis: ContractAnalysisResult) -> bool:
+        """Count an analysis's findings; returns False when it has no report."""
+        if not analysis.report:
+            return False
+        findings = analysis.report.get("identified_risks", [])
+        severities: Counter[str] = Counter()
+        types: Counter[str] = Counter()
         for finding in findings:
-            severity = str(finding.get("severity", "Medium"))
-            predicted_type = str(finding.get("predicted_type", "unknown"))
-            severity_totals[severity] += 1
-            contract_severities[severity] += 1
-            contract_types[predicted_type] += 1
-            pattern_occurrences[predicted_type].append(analysis.contract_name)
-
-        per_contract.append(
-            {
-                "contract_name": analysis.contract_name,
-                "clause_count": analysis.report.get("contract_summary", {}).get("clause_count", len(findings)),
-                "high_risk_count": contract_severities.get("High", 0),
-                "medium_risk_count": contract_severities.get("Medium", 0),
-                "low_risk_count": contract_severities.get("Low", 0),
-                "dominant_risk_type": contract_types.most_common(1)[0][0] if contract_types else "unknown",
-            }
-        )
+            severities[str(finding.get("severity", "Medium"))] += 1
+            types[str(finding.get("predicted_type", "unknown"))] += 1
+        row = {
+            "contract_name": analysis.contract_name,
+            "clause_count": analysis.report.get("contract_summary", {}).get("clause_count", len(findings)),
+            "high_risk_count": severities.get("High", 0),
+            "medium_risk_count": severities.get("Medium", 0),
+            "low_risk_count": severities.get("Low", 0),
+            "dominant_risk_type": types.most_common(1)[0][0] if types else "unknown",
+        }
+        self._add_tally(_ContractTally(row, severities, types))
+        return True
 
-    repeated_risk_patterns: list[dict[str, Any]] = []
-    for predicted_type, contract_names in pattern_occurrences.items():
-        unique_contracts = sorted(set(contract_names))
-        if len(unique_contracts) < 2:
-            continue
-        repeated_risk_patterns.append(
+    def _add_tally(self, tally: _ContractTally) -> None:
+        name = tally.row["contract_name"]
+        self.remove(name)
+        self._contracts[name] = tally
+        self._severity_totals.update(tally.severities)
+        self._type_occurrences.update(tally.types)
+        for predicted_type in tally.types:
+            bisect.insort(self._type_contracts.setdefault(predicted_type, []), name)
+
+    def remove(self, contract_name: str) -> bool:
+        """Subtract a contract's findings; returns False when it was not added."""
+        tally = self._contracts.pop(contract_name, None)
+        if tally is None:
+            return False
+        self._severity_totals.subtract(tally.severities)
+        self._type_occurrences.subtract(tally.types)
+        for predicted_type in tally.types:
+            contracts = self._type_contracts[predicted_type]
+            del contracts[bisect.bisect_left(contracts, contract_name)]
+            if not contracts:
+                del self._type_contracts[predicted_type]
+                del self._type_occurrences[predicted_type]
+        for severity in tally.severities:
+            if self._severity_totals[severity] <= 0:
+                del self._severity_totals[severity]
+        return True
+
+    def merge(self, other: RiskTrendAggregator) -> None:
+        """Fold another aggregator's contracts into this one; ``other`` wins on shared names."""
+        for tally in other._contracts.values():
+            self._add_tally(tally)
+
+    def summary(self, *, listed_contracts: int | None = MAX_LISTED_CONTRACTS) -> dict[str, Any]:
+        """Return contract count, severity totals, and repeated patterns from the maintained counts.
+
+        ``contracts`` names the first ``listed_contracts`` contracts by name, or
+        all of them when it is None. Per-contract rows are left out; see
+        :meth:`per_contract`.
+        """
+        repeated_risk_patterns = [
             {
                 "predicted_type": predicted_type,
-                "occurrences": len(contract_names),
-                "contract_count": len(unique_contracts),
-                "contracts": ", ".join(unique_contracts),
+                "occurrences": occurrences,
+                "contract_count": len(contracts),
+                "contracts": ", ".join(contracts[:listed_contracts]),
             }
-        )
+            for predicted_type, occurrences in self._type_occurrences.items()
+            if len(contracts := self._type_contracts[predicted_type]) >= 2
+        ]
+        repeated_risk_patterns.sort(key=lambda item: (item["contract_count"], item["occurrences"]), reverse=True)
+        return {
+            "contract_count": len(self._contracts),
+            "severity_totals": dict(self._severity_totals),
+            "repeated_risk_patterns": repeated_risk_patterns,
+        }
+
+    def per_contract(self) -> list[dict[str, Any]]:
+        """Return one summary row per contract, in the order they were added."""
+        return [dict(tally.row) for tally in self._contracts.values()]
+
 
-    repeated_risk_patterns.sort(key=lambda item: (item["contract_count"], item["occurrences"]), reverse=True)
+def build_risk_trend_summary(
+    analyses: Sequence[ContractAnalysisResult],
+    *,
+    clause_index: NearDuplicateIndex | None = None,
+    aggregator: RiskTrendAggregator | None = None,
+) -> dict[str, Any]:
+    """Aggregate multiple contract reports into repeated risk patterns.
 
-    return {
-        "contract_count": len(per_contract),
-        "severity_totals": dict(severity_totals),
-        "per_contract": per_contract,
-        "repeated_risk_patterns": repeated_risk_patterns,
-    }
+    Contracts sharing a name count once, the later analysis winning. With a
+    ``clause_index`` holding the portfolio, the summary also lists
+    ``recurring_clauses`` and each contract's ``recurring_clause_count``.
+    Pass an ``aggregator`` already holding ``analyses`` to skip counting them again.
+    """
+    if aggregator is None:
+        aggregator = RiskTrendAggregator()
+        for analysis in analyses:
+            aggregator.add(analysis)
+    summary = aggregator.summary(listed_contracts=None)
+    summary["per_contract"] = aggregator.per_contract()
+    if clause_index is not None:
+        recurring = build_clause_recurrence([analysis for analysis in analyses if analysis.report], clause_index)
+        recurring_counts = Counter(row["contract_name"] for row in recurring)
+        for row in summary["per_contract"]:
+            row["recurring_clause_count"] = recurring_counts.get(row["contract_name"], 0)
+        summary["recurring_clauses"] = recurring
+    return summary
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 from contract_risk.assistant.state import ClausePrediction, EvidenceItem
 
@@ -20,8 +20,20 @@ class ClauseExplanation:
     citations: tuple[str, ...]
 
     def asdict(self) -> dict[str, object]:
-        """Serialize the explanation into a stable dictionary."""
-        return asdict(self)
+        """Serialize the explanation into a stable dictionary.
+
+        All fields are strings or tuples of strings, so a shallow copy matches
+        ``dataclasses.asdict`` without its recursive deep copy.
+        """
+        return {
+            "clause_id": self.clause_id,
+            "clause_reference": self.clause_reference,
+            "why_risky": self.why_risky,
+            "supporting_reasoning": self.supporting_reasoning,
+            "source_titles": self.source_titles,
+            "evidence_ids": self.evidence_ids,
+            "citations": self.citations,
+        }
 
 
 def build_clause_explanation(
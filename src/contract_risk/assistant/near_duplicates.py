@@ -0,0 +1,229 @@
+"""Near-duplicate clause search across analyzed contracts with MinHash LSH."""
+
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator
+
+from contract_risk.assistant.reporting import finding_evidence_items
+from contract_risk.assistant.state import EvidenceItem
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from contract_risk.ui_support import ContractAnalysisResult
+
+SHINGLE_WORDS = 3
+DEFAULT_BANDS = 20
+DEFAULT_ROWS = 6
+DEFAULT_THRESHOLD = 0.7
+# A prime above 2**32, so ``(a * x + b) % _PRIME`` permutes 32-bit shingle hashes.
+_PRIME = 4294967311
+_TOKEN_PATTERN = re.compile(r"[a-z]+|\d+")
+
+
+def clause_shingles(text: str, size: int = SHINGLE_WORDS) -> set[int]:
+    """Return 32-bit hashes of a clause's overlapping word ``size``-grams.
+
+    Text is case-folded and every number becomes ``0``, so dates and amounts
+    do not make otherwise identical boilerplate look different.
+    """
+    tokens = ["0" if token[0].isdigit() else token for token in _TOKEN_PATTERN.findall(text.casefold())]
+    if len(tokens) < size:
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))} if tokens else set()
+    return {zlib.crc32(" ".join(tokens[start : start + size]).encode("utf-8")) for start in range(len(tokens) - size + 1)}
+
+
+@dataclass(frozen=True)
+class IndexedClause:
+    """A previously analyzed clause with the prediction and evidence it received."""
+
+    contract_name: str
+    clause_id: str
+    clause_text: str
+    predicted_type: str
+    severity: str
+    risk_score: int
+    confidence: float | None = None
+    evidence: tuple[EvidenceItem, ...] = field(default=(), repr=False)
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    """An indexed clause and its estimated Jaccard similarity to the query."""
+
+    clause: IndexedClause
+    similarity: float
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index of clauses from previously analyzed contracts.
+
+    Each clause gets a ``bands * rows`` MinHash signature over its word
+    shingles. Clauses sharing any band of rows land in the same bucket, so a
+    query only compares against bucket-mates instead of every indexed clause.
+    Candidates are kept when their estimated Jaccard similarity reaches
+    ``threshold``. The defaults find clauses at 0.7 similarity over 90% of the
+    time. The index is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        bands: int = DEFAULT_BANDS,
+        rows: int = DEFAULT_ROWS,
+        threshold: float = DEFAULT_THRESHOLD,
+        seed: int = 1,
+    ) -> None:
+        import numpy as np
+
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        generator = np.random.default_rng(seed)
+        permutations = bands * rows
+        # ``a < 2**31`` keeps ``a * x + b`` for 32-bit ``x`` inside uint64.
+        self._a = generator.integers(1, 2**31, size=(permutations, 1), dtype=np.uint64)
+        self._b = generator.integers(0, 2**32, size=(permutations, 1), dtype=np.uint64)
+        self._clauses: dict[int, IndexedClause] = {}
+        self._signatures: dict[int, np.ndarray] = {}
+        self._by_contract: dict[str, list[int]] = {}
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clauses)
+
+    @property
+    def contracts(self) -> list[str]:
+        """Names of the indexed contracts, in the order they were added."""
+        with self._lock:
+            return list(self._by_contract)
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """Return the MinHash signature of a clause, or None when it has no words."""
+        import numpy as np
+
+        shingles = clause_shingles(text)
+        if not shingles:
+            return None
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        return ((self._a * values + self._b) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[tuple[int, bytes]]:
+        """Yield each band's bucket key."""
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def add(self, clause: IndexedClause) -> bool:
+        """Index one clause; returns False when it has no words to hash."""
+        signature = self.signature(clause.clause_text)
+        if signature is None:
+            return False
+        with self._lock:
+            clause_key = self._next_id
+            self._next_id += 1
+            self._clauses[clause_key] = clause
+            self._signatures[clause_key] = signature
+            self._by_contract.setdefault(clause.contract_name, []).append(clause_key)
+            for band, key in self._band_keys(signature):
+                self._buckets[band].setdefault(key, []).append(clause_key)
+        return True
+
+    def remove_contract(self, contract_name: str) -> int:
+        """Drop every clause of a contract and return how many were removed."""
+        with self._lock:
+            clause_keys = self._by_contract.pop(contract_name, [])
+            for clause_key in clause_keys:
+                del self._clauses[clause_key]
+                for band, key in self._band_keys(self._signatures.pop(clause_key)):
+                    bucket = self._buckets[band][key]
+                    bucket.remove(clause_key)
+                    if not bucket:
+                        del self._buckets[band][key]
+        return len(clause_keys)
+
+    def add_analysis(self, analysis: ContractAnalysisResult) -> int:
+        """Index a contract's clauses with their predictions and cited evidence.
+
+        A contract already in the index under the same name is replaced.
+        Analyses that failed before prediction are skipped. Returns the number
+        of clauses indexed.
+        """
+        self.remove_contract(analysis.contract_name)
+        frame = analysis.clause_frame
+        if analysis.errors or frame.empty:
+            return 0
+        evidence: dict[str, tuple[EvidenceItem, ...]] = {}
+        if analysis.report:
+            for finding in analysis.report.get("identified_risks", []):
+                evidence[finding["clause_id"]] = finding_evidence_items(analysis.report, finding)
+        confidences = frame["confidence"].tolist() if "confidence" in frame else [None] * len(frame)
+        added = 0
+        for clause_id, text, predicted_type, severity, risk_score, confidence in zip(
+            frame["clause_id"].tolist(),
+            frame["clause_text"].tolist(),
+            frame["predicted_type"].astype(str).tolist(),
+            frame["severity"].astype(str).tolist(),
+            frame["risk_score"].tolist(),
+            confidences,
+        ):
+            added += self.add(
+                IndexedClause(
+                    contract_name=analysis.contract_name,
+                    clause_id=str(clause_id),
+                    clause_text=str(text),
+                    predicted_type=predicted_type,
+                    severity=severity,
+                    risk_score=int(risk_score),
+                    confidence=None if confidence is None or confidence != confidence else float(confidence),
+                    evidence=evidence.get(str(clause_id), ()),
+                )
+            )
+        return added
+
+    def query(
+        self,
+        text: str,
+        *,
+        threshold: float | None = None,
+        exclude_contract: str | None = None,
+        limit: int | None = None,
+    ) -> list[NearDuplicateMatch]:
+        """Return indexed clauses similar to ``text``, most similar first."""
+        import numpy as np
+
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            candidates: set[int] = set()
+            for band, key in self._band_keys(signature):
+                candidates.update(self._buckets[band].get(key, ()))
+            scored = [
+                (self._clauses[clause_key], float(np.mean(self._signatures[clause_key] == signature)))
+                for clause_key in candidates
+                if self._clauses[clause_key].contract_name != exclude_contract
+            ]
+        matches = [NearDuplicateMatch(clause, similarity) for clause, similarity in scored if similarity >= threshold]
+        matches.sort(key=lambda match: (-match.similarity, match.clause.contract_name, match.clause.clause_id))
+        return matches[:limit] if limit is not None else matches
+
+    def best_match(self, text: str, *, threshold: float | None = None) -> NearDuplicateMatch | None:
+        """Return the most similar indexed clause, or None below the threshold."""
+        matches = self.query(text, threshold=threshold, limit=1)
+        return matches[0] if matches else None
+
+    def stats(self) -> dict[str, Any]:
+        """Return clause, contract, and bucket counts."""
+        with self._lock:
+            return {
+                "clauses": len(self._clauses),
+                "contracts": len(self._by_contract),
+                "buckets": sum(len(buckets) for buckets in self._buckets),
+            }
@@ -2,107 +2,192 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-from textwrap import wrap
-from typing import Any
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
-
-PDF_WIDTH = 8.5
-PDF_HEIGHT = 11.0
-LEFT_MARGIN = 0.06
-TOP_MARGIN = 0.96
-BOTTOM_MARGIN = 0.06
-LINE_HEIGHT = 0.025
-
-
-def _new_page(pdf: PdfPages, title: str) -> tuple[plt.Figure, Any]:
-    """Create a blank PDF page with the given title."""
-    fig = plt.figure(figsize=(PDF_WIDTH, PDF_HEIGHT))
-    ax = fig.add_axes([0, 0, 1, 1])
-    ax.axis("off")
-    fig.text(LEFT_MARGIN, TOP_MARGIN, title, fontsize=16, fontweight="bold", va="top")
-    return fig, ax
-
-
-def _write_wrapped_lines(fig: plt.Figure, start_y: float, paragraphs: list[str], width: int = 92) -> float:
-    """Write wrapped paragraphs onto the current figure."""
-    cursor = start_y
-    for paragraph in paragraphs:
-        lines = wrap(paragraph, width=width) or [""]
-        for line in lines:
-            if cursor <= BOTTOM_MARGIN:
-                return cursor
-            fig.text(LEFT_MARGIN, cursor, line, fontsize=9, va="top")
-            cursor -= LINE_HEIGHT
-        cursor -= LINE_HEIGHT * 0.6
-    return cursor
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Mapping
+
+from contract_risk.assistant.pdf_writer import TextPdfDocument
+from contract_risk.assistant.reporting import list_sources_consulted, resolve_finding_evidence
+from contract_risk.metrics import record_cache_lookup
+
+REPORT_TITLE = "DABB.ai Legal Assistance Report"
+# Report sections that the PDF renders; timings and generation settings are left
+# out so reruns of the same analysis share one cached PDF.
+PDF_CONTENT_KEYS = (
+    "contract_summary",
+    "severity_assessment",
+    "sources",
+    "sources_consulted",
+    "identified_risks",
+    "mitigation_actions",
+    "disclaimer",
+)
+
+
+def _finding_lines(report: dict[str, Any], finding: dict[str, Any]) -> tuple[str, list[str]]:
+    """Return the heading and body paragraphs for one finding."""
+    heading = (
+        f"{finding['clause_id']} - {finding['predicted_type']} - "
+        f"Severity {finding['severity']} - Risk {finding['risk_score']}"
+    )
+    lines = [finding["explanation"], f"Mitigation: {finding['mitigation_action']}"]
+    evidence = resolve_finding_evidence(report, finding)
+    if evidence:
+        lead = evidence[0]
+        lines.append(f"Evidence: {lead['source_title']} ({lead['score']:.2f}) - {lead['snippet']}")
+    return heading, lines
 
 
 def build_legal_assistance_report_pdf(report: dict[str, Any]) -> bytes:
-    """Render the structured report into a small multi-page PDF artifact."""
-    buffer = BytesIO()
+    """Render the structured report into a multi-page PDF artifact.
 
+    Every finding is included; sections continue onto as many pages as needed.
+    """
     summary = report["contract_summary"]
     severity = report["severity_assessment"]
     findings = report.get("identified_risks", [])
     mitigation_actions = report.get("mitigation_actions", [])
-    sources = report.get("sources_consulted", [])
+    sources = list_sources_consulted(report)
     disclaimer = report.get("disclaimer", "")
 
-    with PdfPages(buffer) as pdf:
-        fig, _ = _new_page(pdf, "DABB.ai Legal Assistance Report")
-        y = 0.90
-        summary_lines = [
-            f"Contract: {summary['contract_name']}",
-            f"Clauses reviewed: {summary['clause_count']}",
-            f"Risk profile: {severity['overall_risk_level']} "
-            f"(High: {severity['high_risk_count']}, Medium: {severity['medium_risk_count']}, Low: {severity['low_risk_count']})",
-            summary["overview"],
-        ]
-        y = _write_wrapped_lines(fig, y, summary_lines)
-        y = _write_wrapped_lines(fig, y, [f"Disclaimer: {disclaimer}"])
-        pdf.savefig(fig, bbox_inches="tight")
-        plt.close(fig)
-
-        fig, _ = _new_page(pdf, "Top Findings")
-        y = 0.90
-        if findings:
-            for finding in findings[:10]:
-                finding_lines = [
-                    f"{finding['clause_id']} - {finding['predicted_type']} - "
-                    f"Severity {finding['severity']} - Risk {finding['risk_score']}",
-                    finding["explanation"],
-                    f"Mitigation: {finding['mitigation_action']}",
-                ]
-                evidence = finding.get("evidence", [])
-                if evidence:
-                    lead = evidence[0]
-                    finding_lines.append(
-                        f"Evidence: {lead['source_title']} ({lead['score']:.2f}) - {lead['snippet']}"
-                    )
-                y = _write_wrapped_lines(fig, y, finding_lines)
-                if y <= BOTTOM_MARGIN + 0.08:
-                    break
-                y -= LINE_HEIGHT
-        else:
-            y = _write_wrapped_lines(fig, y, ["No risky clauses were identified in the report."])
-        pdf.savefig(fig, bbox_inches="tight")
-        plt.close(fig)
-
-        fig, _ = _new_page(pdf, "Mitigation and Sources")
-        y = 0.90
-        mitigation_lines = ["Mitigation actions:"]
-        mitigation_lines.extend(f"- {item}" for item in mitigation_actions or ["No mitigation actions were generated."])
-        y = _write_wrapped_lines(fig, y, mitigation_lines)
-        source_lines = ["Sources consulted:"]
-        source_lines.extend(
-            f"- {source['source_id']}: {source['title']}" for source in sources or [{"source_id": "N/A", "title": "No sources consulted"}]
-        )
-        y = _write_wrapped_lines(fig, y, source_lines)
-        pdf.savefig(fig, bbox_inches="tight")
-        plt.close(fig)
-
-    buffer.seek(0)
-    return buffer.getvalue()
+    document = TextPdfDocument(REPORT_TITLE)
+    document.heading(REPORT_TITLE)
+    for line in (
+        f"Contract: {summary['contract_name']}",
+        f"Clauses reviewed: {summary['clause_count']}",
+        f"Risk profile: {severity['overall_risk_level']} "
+        f"(High: {severity['high_risk_count']}, Medium: {severity['medium_risk_count']}, Low: {severity['low_risk_count']})",
+        summary["overview"],
+        f"Disclaimer: {disclaimer}",
+    ):
+        document.paragraph(line)
+
+    document.new_page()
+    document.heading(f"Findings ({len(findings)})")
+    if findings:
+        for finding in findings:
+            heading, lines = _finding_lines(report, finding)
+            document.block(lines, heading=heading)
+            document.spacer(4.0)
+    else:
+        document.paragraph("No risky clauses were identified in the report.")
+
+    document.new_page()
+    document.heading("Mitigation and Sources")
+    document.block(
+        [f"- {item}" for item in mitigation_actions or ["No mitigation actions were generated."]],
+        heading="Mitigation actions:",
+    )
+    document.block(
+        [f"- {source['source_id']}: {source['title']}" for source in sources]
+        or ["- N/A: No sources consulted"],
+        heading="Sources consulted:",
+    )
+    return document.to_bytes()
+
+
+def report_content_hash(report: Mapping[str, Any]) -> str:
+    """Return a SHA-256 hash of the report sections that appear in the PDF."""
+    content = {key: report.get(key) for key in PDF_CONTENT_KEYS}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class PdfRenderCache:
+    """Bounded LRU cache of rendered report PDFs keyed by ``report_content_hash``.
+
+    Renders run on a background thread. Concurrent requests for the same
+    report share one render, so identical reports are never rendered twice
+    while their PDF stays cached. One instance is meant to be shared across
+    sessions.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        *,
+        workers: int = 1,
+        render: Callable[[dict[str, Any]], bytes] = build_legal_assistance_report_pdf,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._render = render
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._pending: dict[str, Future[bytes]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="pdf-render")
+
+    def get(self, key: str) -> bytes | None:
+        """Return cached PDF bytes for a content hash, or None."""
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+            if pdf_bytes is not None:
+                self._entries.move_to_end(key)
+            return pdf_bytes
+
+    def pending(self, key: str) -> Future[bytes] | None:
+        """Return the in-flight render for a content hash, or None."""
+        with self._lock:
+            return self._pending.get(key)
+
+    def request(self, report: dict[str, Any], key: str | None = None) -> Future[bytes]:
+        """Return a future for the report's PDF, rendering it in the background on a miss."""
+        key = key or report_content_hash(report)
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+            future = self._pending.get(key)
+            if pdf_bytes is not None:
+                self._entries.move_to_end(key)
+                future = Future()
+                future.set_result(pdf_bytes)
+            hit = future is not None
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+                future = self._executor.submit(self._render_and_store, key, report)
+                self._pending[key] = future
+        record_cache_lookup("report_pdf", hit=hit)
+        return future
+
+    def _render_and_store(self, key: str, report: dict[str, Any]) -> bytes:
+        """Render one PDF and add it to the cache, evicting the least recently used."""
+        try:
+            pdf_bytes = self._render(report)
+        except BaseException:
+            with self._lock:
+                self._pending.pop(key, None)
+            raise
+        with self._lock:
+            self._pending.pop(key, None)
+            if len(pdf_bytes) <= self.max_bytes and key not in self._entries:
+                self._entries[key] = pdf_bytes
+                self._size += len(pdf_bytes)
+                while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return pdf_bytes
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, cached bytes, and hit statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "pending": len(self._pending),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Wait for pending renders and stop the worker thread."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,217 @@
+"""Minimal text-only PDF writer using the standard Helvetica fonts."""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+PAGE_WIDTH = 612.0
+PAGE_HEIGHT = 792.0
+MARGIN = 48.0
+FOOTER_SIZE = 8.0
+
+REGULAR = "F1"
+BOLD = "F2"
+FONT_NAMES = {REGULAR: "Helvetica", BOLD: "Helvetica-Bold"}
+
+# Advance widths (1/1000 em) for printable ASCII 32-126 from the Helvetica AFM.
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)  # fmt: skip
+_CHAR_WIDTHS = {chr(code): width for code, width in enumerate(_HELVETICA_WIDTHS, start=32)}
+# Characters outside ASCII are measured as a full em (the em dash) so lines never overflow.
+_DEFAULT_WIDTH = 1000
+# Helvetica-Bold glyphs are at most about 11% wider; measuring with the
+# regular widths scaled by this factor keeps bold lines inside the margin.
+_BOLD_SCALE = 1.11
+_ESCAPES = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)", "\r": " ", "\t": " "})
+
+
+@lru_cache(maxsize=65536)
+def _word_units(word: str) -> int:
+    """Return a word's width in 1/1000 em; words repeat often, so results are cached."""
+    return sum(_CHAR_WIDTHS.get(char, _DEFAULT_WIDTH) for char in word)
+
+
+def text_width(text: str, size: float, font: str = REGULAR) -> float:
+    """Return the rendered width of ``text`` in points."""
+    units = sum(_CHAR_WIDTHS.get(char, _DEFAULT_WIDTH) for char in text)
+    scale = _BOLD_SCALE if font == BOLD else 1.0
+    return units * size * scale / 1000
+
+
+def wrap_text(text: str, max_width: float, size: float, font: str = REGULAR) -> list[str]:
+    """Greedily wrap ``text`` to lines no wider than ``max_width`` points.
+
+    Words longer than a line are split across lines.
+    """
+    limit = max_width * 1000 / (size * (_BOLD_SCALE if font == BOLD else 1.0))
+    space = _CHAR_WIDTHS[" "]
+    lines: list[str] = []
+    current: list[str] = []
+    current_units = 0
+    for word in text.split():
+        word_units = _word_units(word)
+        if current and current_units + space + word_units <= limit:
+            current.append(word)
+            current_units += space + word_units
+            continue
+        if current:
+            lines.append(" ".join(current))
+            current, current_units = [], 0
+        while word_units > limit:
+            cut, cut_units = 0, 0
+            while cut < len(word) and cut_units + _CHAR_WIDTHS.get(word[cut], _DEFAULT_WIDTH) <= limit:
+                cut_units += _CHAR_WIDTHS.get(word[cut], _DEFAULT_WIDTH)
+                cut += 1
+            cut = max(cut, 1)
+            lines.append(word[:cut])
+            word = word[cut:]
+            word_units = _word_units(word)
+        if word:
+            current, current_units = [word], word_units
+    if current:
+        lines.append(" ".join(current))
+    return lines or [""]
+
+
+def _pdf_string(text: str) -> bytes:
+    """Encode text as a PDF literal string in WinAnsi (cp1252) encoding."""
+    return b"(" + text.translate(_ESCAPES).encode("cp1252", errors="replace") + b")"
+
+
+@dataclass
+class _Page:
+    """Text runs placed on one page, as ``(font, size, x, y, text)``."""
+
+    runs: list[tuple[str, float, float, float, str]] = field(default_factory=list)
+
+
+class TextPdfDocument:
+    """Lay out wrapped text top to bottom and paginate it into a PDF.
+
+    Each page gets a content stream of positioned ``Tj`` operators in the base
+    14 Helvetica fonts, so no font data is embedded and rendering is a matter
+    of string formatting. Page numbers are added to the footer on output.
+    """
+
+    def __init__(self, title: str = "", *, margin: float = MARGIN) -> None:
+        self.title = title
+        self.margin = margin
+        self.content_width = PAGE_WIDTH - 2 * margin
+        self.pages: list[_Page] = []
+        self._cursor = 0.0
+        self.new_page()
+
+    @property
+    def _bottom(self) -> float:
+        """Lowest baseline available for body text, above the footer."""
+        return self.margin + FOOTER_SIZE * 2
+
+    def new_page(self) -> None:
+        """Start a new page."""
+        self.pages.append(_Page())
+        self._cursor = PAGE_HEIGHT - self.margin
+
+    def _ensure_space(self, height: float) -> None:
+        """Break the page when the next ``height`` points do not fit."""
+        if self._cursor - height < self._bottom and self.pages[-1].runs:
+            self.new_page()
+
+    def heading(self, text: str, size: float = 16.0) -> None:
+        """Write a bold heading, keeping it on the same page as the next line of text."""
+        line_height = size * 1.3
+        self._ensure_space(line_height + 9.0 * 1.35)
+        for line in wrap_text(text, self.content_width, size, BOLD):
+            self._ensure_space(line_height)
+            self._cursor -= size
+            self.pages[-1].runs.append((BOLD, size, self.margin, self._cursor, line))
+            self._cursor -= line_height - size
+        self._cursor -= size * 0.4
+
+    def paragraph(self, text: str, size: float = 9.0, *, indent: float = 0.0, font: str = REGULAR) -> None:
+        """Write a wrapped paragraph, breaking pages as needed."""
+        line_height = size * 1.35
+        x = self.margin + indent
+        for line in wrap_text(text, self.content_width - indent, size, font):
+            self._ensure_space(line_height)
+            self._cursor -= size
+            self.pages[-1].runs.append((font, size, x, self._cursor, line))
+            self._cursor -= line_height - size
+        self._cursor -= size * 0.6
+
+    def block(self, paragraphs: list[str], size: float = 9.0, *, heading: str | None = None) -> None:
+        """Write a group of paragraphs, starting a page if its first lines would be orphaned."""
+        self._ensure_space(size * 1.35 * min(3, len(paragraphs) + 1))
+        if heading is not None:
+            self.paragraph(heading, size, font=BOLD)
+        for text in paragraphs:
+            self.paragraph(text, size)
+
+    def spacer(self, height: float) -> None:
+        """Leave vertical space."""
+        self._cursor -= height
+
+    def _content_stream(self, page: _Page, number: int, total: int) -> bytes:
+        """Render one page's text runs as a content stream."""
+        parts = [b"BT"]
+        current_font: tuple[str, float] | None = None
+        runs = list(page.runs)
+        footer = f"{self.title} - Page {number} of {total}" if self.title else f"Page {number} of {total}"
+        runs.append((REGULAR, FOOTER_SIZE, self.margin, self.margin, footer))
+        for font, size, x, y, text in runs:
+            if current_font != (font, size):
+                parts.append(f"/{font} {size:g} Tf".encode("ascii"))
+                current_font = (font, size)
+            parts.append(f"1 0 0 1 {x:.2f} {y:.2f} Tm ".encode("ascii") + _pdf_string(text) + b" Tj")
+        parts.append(b"ET")
+        return b"\n".join(parts)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the document as PDF bytes."""
+        total = len(self.pages)
+        objects: list[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"",  # page tree, filled in once the page object numbers are known
+        ]
+        font_ids: dict[str, int] = {}
+        for resource_name, base_font in FONT_NAMES.items():
+            objects.append(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} /Encoding /WinAnsiEncoding >>".encode("ascii")
+            )
+            font_ids[resource_name] = len(objects)
+        font_resources = " ".join(f"/{name} {object_id} 0 R" for name, object_id in font_ids.items())
+
+        page_ids: list[int] = []
+        for number, page in enumerate(self.pages, start=1):
+            stream = zlib.compress(self._content_stream(page, number, total))
+            objects.append(
+                f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("ascii") + stream + b"\nendstream"
+            )
+            content_id = len(objects)
+            objects.append(
+                (
+                    f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH:g} {PAGE_HEIGHT:g}] "
+                    f"/Resources << /Font << {font_resources} >> >> /Contents {content_id} 0 R >>"
+                ).encode("ascii")
+            )
+            page_ids.append(len(objects))
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+        objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {total} >>".encode("ascii")
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets: list[int] = []
+        for object_id, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += f"{object_id} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+        xref_offset = len(output)
+        output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+        output += b"".join(f"{offset:010d} 00000 n \n".encode("ascii") for offset in offsets)
+        output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode("ascii")
+        return bytes(output)
@@ -0,0 +1,317 @@
+"""Persistent SQLite store of analyzed contracts for portfolio trend queries."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from contract_risk.ui_support import ContractAnalysisResult
+
+SCHEMA_VERSION = 1
+# Repeated patterns list at most this many contract names by default; the
+# counts always cover the whole portfolio.
+MAX_LISTED_CONTRACTS = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contracts (
+    contract_id INTEGER PRIMARY KEY,
+    contract_name TEXT NOT NULL UNIQUE,
+    clause_count INTEGER NOT NULL,
+    high_risk_count INTEGER NOT NULL,
+    medium_risk_count INTEGER NOT NULL,
+    low_risk_count INTEGER NOT NULL,
+    dominant_risk_type TEXT NOT NULL,
+    analyzed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    contract_id INTEGER NOT NULL REFERENCES contracts (contract_id),
+    clause_id TEXT NOT NULL,
+    predicted_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    risk_score INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_by_contract ON findings (contract_id);
+CREATE INDEX IF NOT EXISTS findings_by_type ON findings (predicted_type, severity, contract_id);
+CREATE INDEX IF NOT EXISTS findings_by_severity ON findings (severity, contract_id);
+CREATE TABLE IF NOT EXISTS type_contracts (
+    predicted_type TEXT NOT NULL,
+    contract_name TEXT NOT NULL,
+    occurrences INTEGER NOT NULL,
+    PRIMARY KEY (predicted_type, contract_name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS type_totals (
+    predicted_type TEXT PRIMARY KEY,
+    occurrences INTEGER NOT NULL,
+    contract_count INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS severity_totals (
+    severity TEXT PRIMARY KEY,
+    occurrences INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_CONTRACT_COLUMNS = (
+    "contract_name",
+    "clause_count",
+    "high_risk_count",
+    "medium_risk_count",
+    "low_risk_count",
+    "dominant_risk_type",
+)
+
+
+class PortfolioStore:
+    """Analyzed contracts and their findings in a local SQLite database.
+
+    Findings are indexed by contract, clause type, and severity. Per-type and
+    per-severity totals, and the contracts behind each clause type, are kept
+    up to date as contracts are added or removed. A trend summary therefore
+    reads a handful of small tables instead of re-scanning every finding.
+    Re-adding a contract under the same name replaces it. The store is safe
+    to share between threads. Use ``":memory:"`` for a throwaway store.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = path if path == ":memory:" else Path(path)
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if isinstance(self.path, Path):
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> PortfolioStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._fetchone("SELECT COUNT(*) FROM contracts")[0]
+
+    def __contains__(self, contract_name: object) -> bool:
+        return self._fetchone("SELECT 1 FROM contracts WHERE contract_name = ?", (contract_name,)) is not None
+
+    def _fetchone(self, sql: str, parameters: Sequence[Any] = ()) -> tuple[Any, ...] | None:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def _fetchall(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def add_analysis(self, analysis: ContractAnalysisResult) -> bool:
+        """Store an analysis's report; returns False when it has no report."""
+        if not analysis.report:
+            return False
+        self.add_report(analysis.contract_name, analysis.report)
+        return True
+
+    def add_analyses(self, analyses: Iterable[ContractAnalysisResult]) -> int:
+        """Store several analyses in one transaction and return how many had a report."""
+        return self.add_reports((analysis.contract_name, analysis.report) for analysis in analyses if analysis.report)
+
+    def add_report(self, contract_name: str, report: Mapping[str, Any]) -> None:
+        """Store one contract report, replacing any contract with the same name."""
+        self.add_reports([(contract_name, report)])
+
+    def add_reports(self, reports: Iterable[tuple[str, Mapping[str, Any]]]) -> int:
+        """Store ``(contract_name, report)`` pairs in one transaction and return how many were stored."""
+        stored = 0
+        with self._lock, self._connection:
+            for contract_name, report in reports:
+                self._insert_report(contract_name, report)
+                stored += 1
+        return stored
+
+    def _insert_report(self, contract_name: str, report: Mapping[str, Any]) -> None:
+        """Replace one contract's rows and totals; the caller holds the lock and transaction."""
+        findings = [
+            (
+                str(finding.get("clause_id", "")),
+                str(finding.get("predicted_type", "unknown")),
+                str(finding.get("severity", "Medium")),
+                int(finding.get("risk_score", 0)),
+            )
+            for finding in report.get("identified_risks", [])
+        ]
+        severities = Counter(severity for _, _, severity, _ in findings)
+        types = Counter(predicted_type for _, predicted_type, _, _ in findings)
+        row = (
+            contract_name,
+            report.get("contract_summary", {}).get("clause_count", len(findings)),
+            severities.get("High", 0),
+            severities.get("Medium", 0),
+            severities.get("Low", 0),
+            types.most_common(1)[0][0] if types else "unknown",
+        )
+        self._delete_contract(contract_name)
+        cursor = self._connection.execute(
+            f"INSERT INTO contracts ({', '.join(_CONTRACT_COLUMNS)}, analyzed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (*row, time.time()),
+        )
+        contract_id = cursor.lastrowid
+        self._connection.executemany(
+            "INSERT INTO findings (contract_id, clause_id, predicted_type, severity, risk_score) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(contract_id, *finding) for finding in findings],
+        )
+        self._connection.executemany(
+            "INSERT INTO type_contracts (predicted_type, contract_name, occurrences) VALUES (?, ?, ?)",
+            [(predicted_type, contract_name, count) for predicted_type, count in types.items()],
+        )
+        self._connection.executemany(
+            """
+            INSERT INTO type_totals (predicted_type, occurrences, contract_count) VALUES (?, ?, 1)
+            ON CONFLICT (predicted_type) DO UPDATE SET
+                occurrences = occurrences + excluded.occurrences,
+                contract_count = contract_count + 1
+            """,
+            list(types.items()),
+        )
+        self._connection.executemany(
+            """
+            INSERT INTO severity_totals (severity, occurrences) VALUES (?, ?)
+            ON CONFLICT (severity) DO UPDATE SET occurrences = occurrences + excluded.occurrences
+            """,
+            list(severities.items()),
+        )
+
+    def remove_contract(self, contract_name: str) -> bool:
+        """Drop a contract and its findings; returns False when it was not stored."""
+        with self._lock, self._connection:
+            return self._delete_contract(contract_name)
+
+    def _delete_contract(self, contract_name: str) -> bool:
+        """Delete a contract and roll back its totals; the caller holds the lock and transaction."""
+        row = self._connection.execute(
+            "SELECT contract_id FROM contracts WHERE contract_name = ?", (contract_name,)
+        ).fetchone()
+        if row is None:
+            return False
+        contract_id = row[0]
+        types = self._connection.execute(
+            "SELECT predicted_type, occurrences FROM type_contracts WHERE contract_name = ? AND predicted_type IN "
+            "(SELECT DISTINCT predicted_type FROM findings WHERE contract_id = ?)",
+            (contract_name, contract_id),
+        ).fetchall()
+        severities = self._connection.execute(
+            "SELECT severity, COUNT(*) FROM findings WHERE contract_id = ? GROUP BY severity", (contract_id,)
+        ).fetchall()
+        self._connection.executemany(
+            "UPDATE type_totals SET occurrences = occurrences - ?, contract_count = contract_count - 1 "
+            "WHERE predicted_type = ?",
+            [(count, predicted_type) for predicted_type, count in types],
+        )
+        self._connection.executemany(
+            "UPDATE severity_totals SET occurrences = occurrences - ? WHERE severity = ?",
+            [(count, severity) for severity, count in severities],
+        )
+        self._connection.executemany(
+            "DELETE FROM type_contracts WHERE predicted_type = ? AND contract_name = ?",
+            [(predicted_type, contract_name) for predicted_type, _ in types],
+        )
+        self._connection.execute("DELETE FROM type_totals WHERE contract_count <= 0")
+        self._connection.execute("DELETE FROM severity_totals WHERE occurrences <= 0")
+        self._connection.execute("DELETE FROM findings WHERE contract_id = ?", (contract_id,))
+        self._connection.execute("DELETE FROM contracts WHERE contract_id = ?", (contract_id,))
+        return True
+
+    def severity_totals(self) -> dict[str, int]:
+        """Return finding counts per severity across the portfolio."""
+        return dict(self._fetchall("SELECT severity, occurrences FROM severity_totals ORDER BY severity"))
+
+    def repeated_risk_patterns(
+        self,
+        *,
+        min_contracts: int = 2,
+        listed_contracts: int | None = MAX_LISTED_CONTRACTS,
+    ) -> list[dict[str, Any]]:
+        """Return clause types found in at least ``min_contracts`` contracts.
+
+        ``contracts`` names the first ``listed_contracts`` contracts by name, or
+        all of them when it is None.
+        """
+        rows = self._fetchall(
+            "SELECT predicted_type, occurrences, contract_count FROM type_totals WHERE contract_count >= ? "
+            "ORDER BY contract_count DESC, occurrences DESC, predicted_type",
+            (min_contracts,),
+        )
+        patterns = []
+        for predicted_type, occurrences, contract_count in rows:
+            names = self._fetchall(
+                "SELECT contract_name FROM type_contracts WHERE predicted_type = ? ORDER BY contract_name LIMIT ?",
+                (predicted_type, -1 if listed_contracts is None else listed_contracts),
+            )
+            patterns.append(
+                {
+                    "predicted_type": predicted_type,
+                    "occurrences": occurrences,
+                    "contract_count": contract_count,
+                    "contracts": ", ".join(name for (name,) in names),
+                }
+            )
+        return patterns
+
+    def per_contract(self, contract_names: Sequence[str] | None = None) -> list[dict[str, Any]]:
+        """Return per-contract rollups in the order contracts were stored."""
+        sql = f"SELECT {', '.join(_CONTRACT_COLUMNS)} FROM contracts"
+        parameters: Sequence[Any] = ()
+        if contract_names is not None:
+            sql += f" WHERE contract_name IN ({', '.join('?' for _ in contract_names)})"
+            parameters = list(contract_names)
+        return [dict(zip(_CONTRACT_COLUMNS, row)) for row in self._fetchall(sql + " ORDER BY contract_id", parameters)]
+
+    def findings(
+        self,
+        *,
+        predicted_type: str | None = None,
+        severity: str | None = None,
+        contract_name: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return stored findings matching every given filter."""
+        conditions = []
+        parameters: list[Any] = []
+        for column, value in (
+            ("findings.predicted_type", predicted_type),
+            ("findings.severity", severity),
+            ("contracts.contract_name", contract_name),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        parameters.append(-1 if limit is None else limit)
+        rows = self._fetchall(
+            "SELECT contracts.contract_name, findings.clause_id, findings.predicted_type, findings.severity, "
+            "findings.risk_score FROM findings JOIN contracts USING (contract_id)"
+            f"{where} ORDER BY findings.contract_id, findings.rowid LIMIT ?",
+            parameters,
+        )
+        columns = ("contract_name", "clause_id", "predicted_type", "severity", "risk_score")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def trend_summary(self, *, listed_contracts: int | None = MAX_LISTED_CONTRACTS) -> dict[str, Any]:
+        """Return the portfolio summary in the shape of ``build_risk_trend_summary``."""
+        per_contract = self.per_contract()
+        return {
+            "contract_count": len(per_contract),
+            "severity_totals": self.severity_totals(),
+            "per_contract": per_contract,
+            "repeated_risk_patterns": self.repeated_risk_patterns(listed_contracts=listed_contracts),
+        }
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 
+from contract_risk.features.keywords import KeywordMatcher
 from contract_risk.features.segmentation import clean_text, segment_clauses
 
 SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
@@ -19,6 +20,8 @@ CLAUSE_TAG_RULES: dict[str, tuple[str, ...]] = {
     "governing law": ("governing law", "jurisdiction", "venue", "state law"),
 }
 
+CLAUSE_TAG_MATCHER = KeywordMatcher(CLAUSE_TAG_RULES)
+
 
 @dataclass(frozen=True)
 class RetrievalChunk:
@@ -41,12 +44,7 @@ class RetrievalChunk:
 
 def infer_clause_tags(text: str) -> tuple[str, ...]:
     """Infer lightweight metadata tags from clause wording."""
-    normalized = text.lower()
-    tags: list[str] = []
-    for tag, keywords in CLAUSE_TAG_RULES.items():
-        if any(keyword in normalized for keyword in keywords):
-            tags.append(tag)
-    return tuple(tags)
+    return CLAUSE_TAG_MATCHER.match_tags(text)
 
 
 def _split_clause_text(text: str, max_chars: int) -> list[str]:
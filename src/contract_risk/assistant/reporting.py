@@ -2,21 +2,189 @@
 
 from __future__ import annotations
 
+import json
 from collections import Counter
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Iterator, Mapping, TextIO
 
 from contract_risk.assistant.explanations import build_clause_explanation
 from contract_risk.assistant.guardrails import MIN_EVIDENCE_SCORE, STRICT_GENERATION_TEMPLATE
-from contract_risk.assistant.state import AgentState
+from contract_risk.assistant.state import AgentState, EvidenceItem, RiskFinding, StageMetrics
+from contract_risk.assistant.workflow import start_stage_clock, stop_stage_clock
 
-REPORT_VERSION = "2.0"
+REPORT_VERSION = "3.0"
+EXPANDED_REPORT_VERSION = "2.0"
 LEGAL_DISCLAIMER = (
     "This report is informational only and is not legal advice. "
     "A qualified lawyer should review all contract decisions."
 )
 
 
+def serialize_evidence(item: EvidenceItem) -> dict[str, Any]:
+    """Serialize one evidence item as a reference into the ``sources`` table."""
+    return {"source_id": item.source_id, "score": item.score}
+
+
+def serialize_finding(finding: RiskFinding) -> dict[str, Any]:
+    """Serialize one finding in the compact ``identified_risks`` layout.
+
+    Evidence is stored as ``source_id``/``score`` references. The supporting
+    reasoning sits on the finding, so no separate explanation block is needed.
+    Findings whose prediction was reused from another contract carry
+    ``reused_from``.
+    """
+    explanation = finding.clause_explanation or build_clause_explanation(finding, finding.evidence)
+    serialized = {
+        "clause_id": finding.clause_id,
+        "clause_text": finding.clause_text,
+        "predicted_type": finding.predicted_type,
+        "severity": finding.severity,
+        "risk_score": finding.risk_score,
+        "explanation": finding.explanation,
+        "supporting_reasoning": explanation.supporting_reasoning,
+        "mitigation_action": finding.mitigation_action,
+        "evidence": [serialize_evidence(item) for item in finding.evidence],
+    }
+    if finding.reused_from:
+        serialized["reused_from"] = finding.reused_from
+    return serialized
+
+
+def build_sources_table(state: AgentState) -> dict[str, dict[str, str]]:
+    """Collect each cited guidance record once, keyed by ``source_id`` in first-cited order."""
+    sources: dict[str, dict[str, str]] = {}
+    for finding in state.findings:
+        for evidence in finding.evidence:
+            if evidence.source_id not in sources:
+                sources[evidence.source_id] = {
+                    "title": evidence.source_title,
+                    "url": evidence.source_url,
+                    "snippet": evidence.snippet,
+                }
+    return sources
+
+
+def is_compact_report(report: Mapping[str, Any]) -> bool:
+    """Return True for reports in the compact, sources-table layout."""
+    return "sources" in report and report.get("report_version") != EXPANDED_REPORT_VERSION
+
+
+def resolve_finding_evidence(report: Mapping[str, Any], finding: Mapping[str, Any]) -> tuple[dict[str, Any], ...]:
+    """Return a finding's evidence with title, URL, and snippet filled in.
+
+    Works for both layouts: expanded findings already carry full evidence.
+    """
+    evidence = finding.get("evidence", ())
+    if not is_compact_report(report):
+        return tuple(evidence)
+    sources = report["sources"]
+    resolved: list[dict[str, Any]] = []
+    for item in evidence:
+        source = sources.get(item["source_id"], {})
+        resolved.append(
+            {
+                "clause_id": finding["clause_id"],
+                "source_id": item["source_id"],
+                "source_title": source.get("title", ""),
+                "source_url": source.get("url", ""),
+                "snippet": source.get("snippet", ""),
+                "score": item["score"],
+            }
+        )
+    return tuple(resolved)
+
+
+def finding_evidence_items(report: Mapping[str, Any], finding: Mapping[str, Any]) -> tuple[EvidenceItem, ...]:
+    """Rebuild a serialized finding's evidence as ``EvidenceItem`` objects."""
+    return tuple(
+        EvidenceItem(
+            clause_id=item["clause_id"],
+            source_id=item["source_id"],
+            source_title=item["source_title"],
+            source_url=item["source_url"],
+            snippet=item["snippet"],
+            score=item["score"],
+        )
+        for item in resolve_finding_evidence(report, finding)
+    )
+
+
+def list_sources_consulted(report: Mapping[str, Any]) -> list[dict[str, str]]:
+    """Return the ``sources_consulted`` rows for either layout."""
+    if not is_compact_report(report):
+        return list(report.get("sources_consulted", []))
+    return [
+        {"source_id": source_id, "title": source["title"], "url": source["url"]}
+        for source_id, source in report["sources"].items()
+    ]
+
+
+def expand_report(report: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild the expanded (report version 2.0) shape from a compact report.
+
+    Expanded reports are returned unchanged, so callers can always pass
+    whatever report they hold.
+    """
+    if not is_compact_report(report):
+        return dict(report)
+
+    findings: list[dict[str, Any]] = []
+    references: list[dict[str, Any]] = []
+    explanations: list[dict[str, Any]] = []
+    for finding in report.get("identified_risks", []):
+        evidence = resolve_finding_evidence(report, finding)
+        evidence_ids = [item["source_id"] for item in evidence]
+        expanded_finding = {
+            "clause_id": finding["clause_id"],
+            "clause_text": finding["clause_text"],
+            "predicted_type": finding["predicted_type"],
+            "severity": finding["severity"],
+            "risk_score": finding["risk_score"],
+            "explanation": finding["explanation"],
+            "mitigation_action": finding["mitigation_action"],
+            "evidence": evidence,
+        }
+        if "reused_from" in finding:
+            expanded_finding["reused_from"] = finding["reused_from"]
+        findings.append(expanded_finding)
+        references.append(
+            {
+                "clause_id": finding["clause_id"],
+                "predicted_type": finding["predicted_type"],
+                "severity": finding["severity"],
+                "risk_score": finding["risk_score"],
+                "evidence_ids": evidence_ids,
+                "evidence_count": len(evidence_ids),
+                "clause_text": finding["clause_text"],
+            }
+        )
+        explanations.append(
+            {
+                "clause_id": finding["clause_id"],
+                "clause_reference": f"{finding['clause_id']} ({finding['predicted_type']})",
+                "why_risky": finding["explanation"],
+                "supporting_reasoning": finding["supporting_reasoning"],
+                "source_titles": tuple(item["source_title"] for item in evidence),
+                "evidence_ids": tuple(evidence_ids),
+                "citations": tuple(f"{item['source_title']} ({item['source_url']})" for item in evidence),
+            }
+        )
+
+    expanded: dict[str, Any] = {
+        "report_version": EXPANDED_REPORT_VERSION,
+        "contract_summary": report["contract_summary"],
+        "severity_assessment": report["severity_assessment"],
+        "identified_risks": findings,
+        "clause_references": references,
+        "clause_explanations": explanations,
+        "sources_consulted": list_sources_consulted(report),
+    }
+    for key, value in report.items():
+        if key not in expanded and key != "sources":
+            expanded[key] = value
+    return expanded
+
+
 def build_clause_references(state: AgentState) -> list[dict[str, Any]]:
     """Create a UI-friendly index of the clauses that were reviewed."""
     references: list[dict[str, Any]] = []
@@ -37,10 +205,14 @@ def build_clause_references(state: AgentState) -> list[dict[str, Any]]:
 
 
 def build_clause_explanations(state: AgentState) -> list[dict[str, Any]]:
-    """Create a structured explanation block for each risky clause."""
+    """Create a structured explanation block for each risky clause.
+
+    Reuses the explanation cached on each finding and only builds one for
+    findings created without it.
+    """
     explanations: list[dict[str, Any]] = []
     for finding in state.findings:
-        explanation = build_clause_explanation(finding, finding.evidence)
+        explanation = finding.clause_explanation or build_clause_explanation(finding, finding.evidence)
         explanations.append(explanation.asdict())
     return explanations
 
@@ -67,47 +239,160 @@ def build_severity_assessment(state: AgentState) -> dict[str, Any]:
     }
 
 
-def build_structured_report(state: AgentState) -> dict[str, Any]:
-    """Serialize the assistant state into a stable report payload."""
-    assert state.summary is not None
+def build_retrieval_budget(state: AgentState, low_risk_confidence: float | None = None) -> dict[str, Any]:
+    """Summarize how many clauses skipped retrieval and the time that saved."""
+    skipped_count = len(state.skipped_retrievals)
+    retrieved_count = len(state.findings) - skipped_count
+    average_seconds = state.retrieval_seconds / retrieved_count if retrieved_count > 0 else 0.0
+    return {
+        "low_risk_confidence": low_risk_confidence,
+        "retrieved_clause_count": max(retrieved_count, 0),
+        "skipped_clause_count": skipped_count,
+        "skipped_clause_ids": list(state.skipped_retrievals),
+        "retrieval_seconds": round(state.retrieval_seconds, 6),
+        "estimated_seconds_saved": round(average_seconds * skipped_count, 6),
+    }
 
-    findings = [asdict(finding) for finding in state.findings]
-    mitigation_actions = [finding["mitigation_action"] for finding in findings]
-    unique_actions = list(dict.fromkeys(mitigation_actions))
 
-    sources = []
-    seen_sources: set[str] = set()
-    for finding in state.findings:
-        for evidence in finding.evidence:
-            if evidence.source_id in seen_sources:
-                continue
-            seen_sources.add(evidence.source_id)
-            sources.append(
-                {
-                    "source_id": evidence.source_id,
-                    "title": evidence.source_title,
-                    "url": evidence.source_url,
-                }
-            )
+def build_performance_summary(
+    stage_metrics: list[StageMetrics],
+    cascade_stats: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Summarize per-stage wall time, CPU time, peak allocation, and item counts.
+
+    ``cascade_stats`` from a rule-first classifier cascade are added under
+    ``cascade`` when prediction used one.
+    """
+    peaks = [item.peak_alloc_bytes for item in stage_metrics if item.peak_alloc_bytes is not None]
+    summary = {
+        "stages": [asdict(item) for item in stage_metrics],
+        "total_wall_seconds": round(sum(item.wall_seconds for item in stage_metrics), 6),
+        "total_cpu_seconds": round(sum(item.cpu_seconds for item in stage_metrics), 6),
+        "peak_alloc_bytes": max(peaks) if peaks else None,
+    }
+    if cascade_stats is not None:
+        summary["cascade"] = dict(cascade_stats)
+    return summary
 
+
+def _report_header(state: AgentState) -> dict[str, Any]:
+    """Build the sections that precede ``identified_risks``."""
+    assert state.summary is not None
     return {
         "report_version": REPORT_VERSION,
         "contract_summary": asdict(state.summary),
         "severity_assessment": build_severity_assessment(state),
-        "identified_risks": findings,
-        "clause_references": build_clause_references(state),
-        "clause_explanations": build_clause_explanations(state),
-        "mitigation_actions": unique_actions,
+        "sources": build_sources_table(state),
+    }
+
+
+def _report_trailer(
+    state: AgentState,
+    mitigation_actions: list[str],
+    low_risk_confidence: float | None,
+) -> dict[str, Any]:
+    """Build the sections between ``identified_risks`` and ``performance``."""
+    return {
+        "mitigation_actions": mitigation_actions,
         "disclaimer": LEGAL_DISCLAIMER,
         "generation_controls": {
             "min_evidence_score": MIN_EVIDENCE_SCORE,
             "citation_policy": "cite sources when evidence is strong; refuse to speculate when evidence is weak or missing",
             "prompt_template": STRICT_GENERATION_TEMPLATE,
         },
-        "sources_consulted": sources,
+        "retrieval_budget": build_retrieval_budget(state, low_risk_confidence),
         "fallback": {
             "used": state.fallback_reason is not None,
             "reason": state.fallback_reason,
             "errors": list(state.errors),
         },
     }
+
+
+def build_structured_report(state: AgentState, *, low_risk_confidence: float | None = None) -> dict[str, Any]:
+    """Serialize the assistant state into a compact, stable report payload.
+
+    Guidance passages, titles, and URLs appear once in ``sources``, and findings
+    cite them by ``source_id`` and score. Use ``expand_report`` for the previous
+    layout with per-finding evidence, clause references, and explanations.
+    """
+    assert state.summary is not None
+    serialize_clock = start_stage_clock("serialize", len(state.findings))
+
+    findings = [serialize_finding(finding) for finding in state.findings]
+    unique_actions = list(dict.fromkeys(finding["mitigation_action"] for finding in findings))
+
+    report = {
+        **_report_header(state),
+        "identified_risks": findings,
+        **_report_trailer(state, unique_actions, low_risk_confidence),
+    }
+    stage_metrics = [*state.stage_metrics, stop_stage_clock(serialize_clock)]
+    report["performance"] = build_performance_summary(stage_metrics, state.cascade_stats)
+    return report
+
+
+def iter_report_json(
+    state: AgentState,
+    *,
+    low_risk_confidence: float | None = None,
+    indent: int | str | None = None,
+) -> Iterator[str]:
+    """Yield the JSON text of ``build_structured_report`` in small chunks.
+
+    Findings are serialized and encoded one at a time, so the report dict and
+    the full JSON string are never held in memory. Without ``indent`` the text
+    equals ``json.dumps`` of the report apart from the ``serialize`` stage
+    timings. With ``indent`` the top-level sections are indented and each
+    finding is written compactly on its own line; findings always go through
+    the C encoder, whose indented counterpart leaves reference cycles behind
+    on every call.
+    """
+    assert state.summary is not None
+    serialize_clock = start_stage_clock("serialize", len(state.findings))
+    encode_section = json.JSONEncoder(indent=indent).encode
+    encode_finding = json.JSONEncoder().encode
+    pad = " " * indent if isinstance(indent, int) else indent
+    separator = ", " if pad is None else ","
+
+    def newline(level: int) -> str:
+        return "" if pad is None else "\n" + pad * level
+
+    def member(key: str, value: Any, first: bool = False) -> str:
+        text = encode_section(value).replace("\n", newline(1)) if pad is not None else encode_section(value)
+        return ("" if first else separator) + newline(1) + encode_finding(key) + ": " + text
+
+    yield "{"
+    for index, (key, value) in enumerate(_report_header(state).items()):
+        yield member(key, value, first=index == 0)
+
+    yield separator + newline(1) + '"identified_risks": ['
+    mitigation_actions: dict[str, None] = {}
+    for index, finding in enumerate(state.findings):
+        item = serialize_finding(finding)
+        mitigation_actions.setdefault(item["mitigation_action"])
+        yield ("" if index == 0 else separator) + newline(2) + encode_finding(item)
+    yield (newline(1) if state.findings else "") + "]"
+
+    for key, value in _report_trailer(state, list(mitigation_actions), low_risk_confidence).items():
+        yield member(key, value)
+    stage_metrics = [*state.stage_metrics, stop_stage_clock(serialize_clock)]
+    yield member("performance", build_performance_summary(stage_metrics, state.cascade_stats))
+    yield newline(0) + "}"
+
+
+def write_report_json(
+    state: AgentState,
+    fp: TextIO,
+    *,
+    low_risk_confidence: float | None = None,
+    indent: int | str | None = None,
+) -> None:
+    """Stream the structured report as JSON to a text file or socket stream.
+
+    ``fp`` is anything with a text ``write`` method, such as an open file or
+    ``socket.makefile("w", encoding="utf-8")``. Memory use stays flat as the
+    number of findings grows.
+    """
+    for chunk in iter_report_json(state, low_risk_confidence=low_risk_confidence, indent=indent):
+        fp.write(chunk)
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-
-import joblib
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import TYPE_CHECKING, Any
 
 from contract_risk.assistant.corpus import LegalGuidanceRecord
+from contract_risk.metrics import instrumented, record_cache_lookup
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer
 
 DEFAULT_KB_PATH = Path("models/legal_guidance_store.joblib")
+DEFAULT_QUERY_CACHE_SIZE = 4096
+# Replacing any of these attributes bumps the index generation.
+_INDEX_FIELDS = frozenset({"vectorizer", "matrix", "records"})
 
 
 @dataclass(frozen=True)
@@ -51,22 +57,166 @@ def _normalize_clause_tags(clause_tags: Sequence[str] | str | None) -> tuple[str
     return tuple(tag.strip() for tag in clause_tags if str(tag).strip())
 
 
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse its whitespace; the vectorizer sees no difference."""
+    return " ".join(query.lower().split())
+
+
 @dataclass
 class LegalKnowledgeBase:
-    """Persisted TF-IDF index over normalized legal guidance notes."""
+    """Persisted TF-IDF index over normalized legal guidance notes.
+
+    Search results are kept in a bounded LRU cache keyed by the normalized
+    query and ``top_k``, holding at most ``query_cache_size`` entries (0
+    disables it). The cache is cleared when the vectorizer, matrix, or
+    records are replaced or the record count changes, is safe to use from
+    concurrent workers, and is not pickled with the knowledge base.
+    """
 
     vectorizer: TfidfVectorizer
     matrix: object
     records: list[LegalGuidanceRecord]
-
+    query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE
+
+    def __post_init__(self) -> None:
+        self._reset_query_cache()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _INDEX_FIELDS:
+            self.__dict__["_index_generation"] = self.__dict__.get("_index_generation", 0) + 1
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if not name.startswith("_query_cache")}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_query_cache()
+
+    def _reset_query_cache(self) -> None:
+        """Start an empty query cache with a fresh lock."""
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_entries: OrderedDict[tuple[str, int], list[RetrievalHit]] = OrderedDict()
+        self._query_cache_version = self._index_version()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
+    def _index_version(self) -> tuple[int, int]:
+        """Identify the index contents the cached results were computed from.
+
+        The generation counts replacements of the vectorizer, matrix, or
+        records; the record count catches records appended in place.
+        """
+        return self._index_generation, len(self.records)
+
+    def clear_query_cache(self) -> None:
+        """Drop every cached search result and reset the hit statistics."""
+        with self._query_cache_lock:
+            self._query_cache_entries.clear()
+            self._query_cache_version = self._index_version()
+            self._query_cache_hits = 0
+            self._query_cache_misses = 0
+
+    def _cached_hits(self, keys: Sequence[tuple[str, int]]) -> list[list[RetrievalHit] | None]:
+        """Look up cached results for each key, counting hits and misses."""
+        if self.query_cache_size <= 0:
+            return [None] * len(keys)
+        found: list[list[RetrievalHit] | None] = []
+        with self._query_cache_lock:
+            version = self._index_version()
+            if version != self._query_cache_version:
+                self._query_cache_entries.clear()
+                self._query_cache_version = version
+            for key in keys:
+                hits = self._query_cache_entries.get(key)
+                if hits is not None:
+                    self._query_cache_entries.move_to_end(key)
+                found.append(hits)
+            hit_count = sum(hits is not None for hits in found)
+            self._query_cache_hits += hit_count
+            self._query_cache_misses += len(keys) - hit_count
+        for hits in found:
+            record_cache_lookup("knowledge_base_query", hit=hits is not None)
+        return found
+
+    def _store_hits(
+        self,
+        version: tuple[int, int],
+        entries: Mapping[tuple[str, int], list[RetrievalHit]],
+    ) -> None:
+        """Cache freshly computed results unless the index changed while computing them."""
+        if self.query_cache_size <= 0:
+            return
+        with self._query_cache_lock:
+            if version != self._query_cache_version:
+                return
+            for key, hits in entries.items():
+                self._query_cache_entries[key] = hits
+                self._query_cache_entries.move_to_end(key)
+            while len(self._query_cache_entries) > self.query_cache_size:
+                self._query_cache_entries.popitem(last=False)
+
+    def query_cache_stats(self) -> dict[str, Any]:
+        """Return entry count, capacity, and hit statistics of the query cache."""
+        with self._query_cache_lock:
+            lookups = self._query_cache_hits + self._query_cache_misses
+            return {
+                "entries": len(self._query_cache_entries),
+                "max_entries": self.query_cache_size,
+                "hits": self._query_cache_hits,
+                "misses": self._query_cache_misses,
+                "hit_rate": self._query_cache_hits / lookups if lookups else 0.0,
+            }
+
+    @instrumented("knowledge_base_search")
     def search(self, query: str, top_k: int = 5) -> list[RetrievalHit]:
         """Return the most relevant legal notes for a query."""
-        if not query.strip() or not self.records:
-            return []
-
-        query_vector = self.vectorizer.transform([query])
-        similarities = cosine_similarity(query_vector, self.matrix).ravel()
-
+        return self._search_many([query], top_k)[0]
+
+    @instrumented("knowledge_base_search_many", items=len)
+    def search_many(self, queries: Sequence[str], top_k: int = 5) -> list[list[RetrievalHit]]:
+        """Return hits for several queries with one vectorizer and similarity call.
+
+        Cached queries are answered from the cache, and repeated queries in the
+        batch are scored once.
+        """
+        return self._search_many(queries, top_k)
+
+    def _search_many(self, queries: Sequence[str], top_k: int) -> list[list[RetrievalHit]]:
+        results: list[list[RetrievalHit]] = [[] for _ in queries]
+        if not self.records:
+            return results
+
+        active = [index for index, query in enumerate(queries) if query.strip()]
+        if not active:
+            return results
+
+        version = self._index_version()
+        keys = [(normalize_query(queries[index]), top_k) for index in active]
+        pending: dict[tuple[str, int], list[int]] = {}
+        for index, key, cached in zip(active, keys, self._cached_hits(keys)):
+            if cached is not None:
+                results[index] = list(cached)
+            else:
+                pending.setdefault(key, []).append(index)
+        if not pending:
+            return results
+
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        query_matrix = self.vectorizer.transform([queries[indices[0]] for indices in pending.values()])
+        similarities = cosine_similarity(query_matrix, self.matrix)
+        computed: dict[tuple[str, int], list[RetrievalHit]] = {}
+        for row, (key, indices) in enumerate(pending.items()):
+            hits = self._rank_hits(similarities[row], top_k)
+            computed[key] = hits
+            for index in indices:
+                results[index] = list(hits)
+        self._store_hits(version, computed)
+        return results
+
+    def _rank_hits(self, similarities: object, top_k: int) -> list[RetrievalHit]:
+        """Turn one row of similarity scores into ranked, positive-score hits."""
         ranked = similarities.argsort()[::-1][:top_k]
         hits: list[RetrievalHit] = []
         for index in ranked:
@@ -78,6 +228,8 @@ class LegalKnowledgeBase:
 
     def to_frame(self) -> pd.DataFrame:
         """Return the indexed passages as a dataframe for inspection."""
+        import pandas as pd
+
         return pd.DataFrame(
             [
                 {
@@ -199,6 +351,8 @@ def retrieve_best_practices(
 
 def build_knowledge_base(records: list[LegalGuidanceRecord]) -> LegalKnowledgeBase:
     """Build a local TF-IDF index over legal guidance records."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     vectorizer = TfidfVectorizer(lowercase=True, ngram_range=(1, 2), min_df=1, max_features=5000)
     documents = [record.search_text for record in records]
     matrix = vectorizer.fit_transform(documents)
@@ -209,10 +363,14 @@ def save_knowledge_base(knowledge_base: LegalKnowledgeBase, path: str | Path = D
     """Persist the knowledge base to disk."""
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
+    import joblib
+
     joblib.dump(knowledge_base, destination)
     return destination
 
 
 def load_knowledge_base(path: str | Path = DEFAULT_KB_PATH) -> LegalKnowledgeBase:
     """Load a previously saved knowledge base."""
+    import joblib
+
     return joblib.load(Path(path))
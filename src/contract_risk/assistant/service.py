@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence, TextIO, Union
 
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
 from contract_risk.assistant.explanations import build_clause_explanation
 from contract_risk.assistant.guardrails import MIN_EVIDENCE_SCORE, evidence_is_strong, filter_supported_evidence
-from contract_risk.assistant.reporting import build_structured_report
+from contract_risk.assistant.reporting import build_structured_report, write_report_json
 from contract_risk.assistant.retrieval import (
     DEFAULT_KB_PATH,
     LegalKnowledgeBase,
@@ -22,10 +26,35 @@ from contract_risk.assistant.state import (
     ClausePrediction,
     EvidenceItem,
     RiskFinding,
+    StageMetrics,
     WorkflowStage,
 )
-from contract_risk.assistant.workflow import build_summary, complete_workflow, create_agent_state, mark_fallback, mark_mitigation
-from contract_risk.risk.mapping import map_clause_type_to_risk
+from contract_risk.assistant.workflow import (
+    ProgressCallback,
+    advance_stage,
+    build_summary,
+    complete_workflow,
+    create_agent_state,
+    mark_fallback,
+    mark_mitigation,
+    notify_progress,
+)
+from contract_risk.metrics import instrumented, record_cache_lookup
+from contract_risk.profiling import profiled
+from contract_risk.risk.mapping import map_clause_type_to_risk, map_clause_types_to_risk
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# A clause table (``pd.DataFrame`` or a mapping of column name to values) or a
+# sequence of per-clause predictions.
+ClauseColumns = Mapping[str, Sequence[Any]]
+ClausePredictionInput = Union[Sequence[Union[ClausePrediction, Mapping[str, Any]]], ClauseColumns, "pd.DataFrame"]
+# ``"thread"`` or ``"process"`` for a pool sized by ``workers``, or an existing executor.
+ReportExecutor = Union[str, Executor]
+
+# Clauses per task when retrieval and finding construction fan out to an executor.
+DEFAULT_CHUNK_SIZE = 128
 
 MITIGATION_GUIDANCE: dict[str, str] = {
     "termination": "Clarify notice periods, cure rights, transition duties, and survival obligations.",
@@ -53,6 +82,11 @@ def _normalize_prediction(item: ClausePrediction | Mapping[str, Any]) -> ClauseP
         risk_score = int(raw_score)
     except (TypeError, ValueError):
         risk_score = risk.score
+    raw_confidence = item.get("confidence")
+    try:
+        confidence = float(raw_confidence) if raw_confidence is not None else None
+    except (TypeError, ValueError):
+        confidence = None
 
     return ClausePrediction(
         clause_id=str(item.get("clause_id", "")).strip() or "C000",
@@ -60,14 +94,85 @@ def _normalize_prediction(item: ClausePrediction | Mapping[str, Any]) -> ClauseP
         predicted_type=predicted_type,
         severity=severity,
         risk_score=risk_score,
+        confidence=confidence,
+        reused_from=item.get("reused_from") or None,
     )
 
 
+def _column_values(columns: ClauseColumns, name: str) -> list[Any] | None:
+    """Return one column as a list, or None when it is missing."""
+    if name not in columns:
+        return None
+    values = columns[name]
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert a confidence value, treating None and NaN as missing."""
+    try:
+        number = float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+    return None if number is None or number != number else number
+
+
+def predictions_from_columns(columns: ClauseColumns) -> list[ClausePrediction]:
+    """Build typed predictions from aligned clause columns without a row-dict round trip.
+
+    ``columns`` is the clause frame from ``build_clause_frame`` or any mapping
+    of column name to sequence. ``severity`` and ``risk_score`` fall back to the
+    risk table, looked up once per distinct label, when they are absent.
+    """
+    clause_texts = _column_values(columns, "clause_text") or []
+    count = len(clause_texts)
+    clause_ids = _column_values(columns, "clause_id") or [f"C{index:03d}" for index in range(1, count + 1)]
+    predicted_types = [str(label).strip() or "unknown" for label in _column_values(columns, "predicted_type") or []]
+    severities = _column_values(columns, "severity")
+    scores = _column_values(columns, "risk_score")
+    if severities is None or scores is None:
+        risk = map_clause_types_to_risk(predicted_types)
+        severities = severities if severities is not None else risk.severity.tolist()
+        scores = scores if scores is not None else risk.score.tolist()
+    confidences = _column_values(columns, "confidence") or [None] * count
+    reused_from = _column_values(columns, "reused_from") or [None] * count
+
+    return [
+        ClausePrediction(
+            clause_id=str(clause_id),
+            clause_text=str(clause_text).strip(),
+            predicted_type=predicted_type,
+            severity=str(severity),
+            risk_score=int(score),
+            confidence=_optional_float(confidence),
+            reused_from=source if isinstance(source, str) and source else None,
+        )
+        for clause_id, clause_text, predicted_type, severity, score, confidence, source in zip(
+            clause_ids, clause_texts, predicted_types, severities, scores, confidences, reused_from
+        )
+    ]
+
+
+def _normalize_predictions(clause_predictions: ClausePredictionInput) -> list[ClausePrediction]:
+    """Normalize row payloads or a columnar clause table into typed predictions."""
+    if isinstance(clause_predictions, Mapping) or hasattr(clause_predictions, "columns"):
+        return predictions_from_columns(clause_predictions)  # type: ignore[arg-type]
+    return [_normalize_prediction(item) for item in clause_predictions]
+
+
+def _is_confident_low_risk(prediction: ClausePrediction, low_risk_confidence: float | None) -> bool:
+    """Return True when a clause is low risk with enough confidence to skip retrieval."""
+    if low_risk_confidence is None or prediction.confidence is None:
+        return False
+    return prediction.severity.lower() == "low" and prediction.confidence >= low_risk_confidence
+
+
 def _load_or_build_knowledge_base(path: str | Path = DEFAULT_KB_PATH) -> LegalKnowledgeBase:
     """Load the persisted KB or build it from the bundled legal corpus."""
     kb_path = Path(path)
     if kb_path.exists():
+        record_cache_lookup("knowledge_base_artifact", hit=True)
         return load_knowledge_base(kb_path)
+    record_cache_lookup("knowledge_base_artifact", hit=False)
 
     corpus = load_legal_guidance_corpus()
     knowledge_base = build_knowledge_base(corpus)
@@ -75,6 +180,11 @@ def _load_or_build_knowledge_base(path: str | Path = DEFAULT_KB_PATH) -> LegalKn
     return knowledge_base
 
 
+def _build_retrieval_text(prediction: ClausePrediction) -> str:
+    """Build the knowledge-base query used for one clause."""
+    return f"{prediction.predicted_type} {prediction.clause_text}".strip()
+
+
 def _evidence_from_hits(clause_id: str, hits: list[RetrievalHit]) -> tuple[EvidenceItem, ...]:
     """Translate retrieval hits into serializable evidence items."""
     evidence: list[EvidenceItem] = []
@@ -107,7 +217,7 @@ def _build_finding(
 ) -> RiskFinding:
     """Build a structured clause-level risk finding."""
     mitigation = _build_mitigation_action(prediction)
-    explanation = build_clause_explanation(prediction, evidence).why_risky
+    explanation = build_clause_explanation(prediction, evidence)
 
     return RiskFinding(
         clause_id=prediction.clause_id,
@@ -115,57 +225,328 @@ def _build_finding(
         predicted_type=prediction.predicted_type,
         severity=prediction.severity,
         risk_score=prediction.risk_score,
-        explanation=explanation,
+        explanation=explanation.why_risky,
         mitigation_action=mitigation,
         evidence=evidence,
+        clause_explanation=explanation,
+        reused_from=prediction.reused_from,
     )
 
 
-def generate_legal_assistance_report(
+@dataclass(frozen=True)
+class _ClauseAssessment:
+    """The finding for one clause and the bookkeeping it contributes to the state."""
+
+    finding: RiskFinding
+    skipped: bool = False
+    fallback_reason: str | None = None
+    strong_evidence: tuple[EvidenceItem, ...] = ()
+
+
+def _assess_clause(
+    prediction: ClausePrediction,
+    skipped: bool,
+    hits: list[RetrievalHit],
+    reused: Sequence[EvidenceItem] | None,
+    min_evidence_score: float,
+) -> _ClauseAssessment:
+    """Build one clause's finding from its retrieval hits or reused evidence."""
+    if skipped:
+        return _ClauseAssessment(_build_finding(prediction, ()), skipped=True)
+
+    if reused is not None:
+        evidence = tuple(
+            item if item.clause_id == prediction.clause_id else replace(item, clause_id=prediction.clause_id)
+            for item in reused
+        )
+    else:
+        evidence = _evidence_from_hits(prediction.clause_id, hits)
+    supported_evidence = filter_supported_evidence(evidence, min_score=min_evidence_score)
+    fallback_reason = None
+    if not evidence:
+        fallback_reason = f"No retrieval evidence was found for {prediction.clause_id}; refusing to speculate."
+    elif not supported_evidence:
+        fallback_reason = f"Evidence for {prediction.clause_id} was below the support threshold; refusing to speculate."
+    strong = evidence_is_strong(supported_evidence, min_score=min_evidence_score)
+    return _ClauseAssessment(
+        _build_finding(prediction, supported_evidence),
+        fallback_reason=fallback_reason,
+        strong_evidence=supported_evidence if strong else (),
+    )
+
+
+# Knowledge base of a process-pool worker, installed once by the pool initializer.
+_WORKER_KNOWLEDGE_BASE: LegalKnowledgeBase | None = None
+
+
+def _install_worker_knowledge_base(knowledge_base: LegalKnowledgeBase) -> None:
+    """Keep the knowledge base in a pool worker so tasks need not pickle it."""
+    global _WORKER_KNOWLEDGE_BASE
+    _WORKER_KNOWLEDGE_BASE = knowledge_base
+
+
+def _search_chunk(
+    knowledge_base: LegalKnowledgeBase | None,
+    queries: list[str],
+    top_k: int,
+) -> list[list[RetrievalHit]]:
+    """Retrieve hits for one chunk of queries."""
+    kb = knowledge_base if knowledge_base is not None else _WORKER_KNOWLEDGE_BASE
+    return kb.search_many(queries, top_k=top_k)
+
+
+def _assess_chunk(
+    items: list[tuple[ClausePrediction, bool, list[RetrievalHit], Sequence[EvidenceItem] | None]],
+    min_evidence_score: float,
+) -> list[_ClauseAssessment]:
+    """Assess one chunk of clauses."""
+    return [_assess_clause(*item, min_evidence_score) for item in items]
+
+
+def _chunks(items: Sequence[Any], chunk_size: int) -> list[Sequence[Any]]:
+    """Split items into consecutive chunks of at most ``chunk_size``."""
+    return [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+
+@contextmanager
+def _report_executor(
+    executor: ReportExecutor | None,
+    workers: int | None,
+    knowledge_base: LegalKnowledgeBase,
+    *,
+    fan_out: bool = True,
+) -> Iterator[tuple[Executor | None, LegalKnowledgeBase | None]]:
+    """Yield the executor to fan out to and the knowledge base to send with each task.
+
+    Pools created here are shut down on exit; a process pool gets the knowledge
+    base once per worker, so tasks send None instead. Executors passed in are
+    left running for the caller to reuse. Without ``fan_out`` (a report that
+    fits in one chunk) no pool is started and None is yielded.
+    """
+    if executor is not None and not isinstance(executor, Executor) and executor not in ("thread", "process"):
+        raise ValueError(f"Unknown report executor {executor!r}; expected 'thread', 'process', or an Executor.")
+    if executor is None or not fan_out:
+        yield None, knowledge_base
+        return
+    if isinstance(executor, Executor):
+        yield executor, knowledge_base
+        return
+    if executor == "thread":
+        pool: Executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="contract-risk-report")
+        shipped: LegalKnowledgeBase | None = knowledge_base
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_worker_knowledge_base,
+            initargs=(knowledge_base,),
+        )
+        shipped = None
+    try:
+        yield pool, shipped
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_assistant_workflow(
     contract_text: str,
-    clause_predictions: Sequence[ClausePrediction | Mapping[str, Any]],
+    clause_predictions: ClausePredictionInput,
     *,
-    knowledge_base: LegalKnowledgeBase | None = None,
-    contract_name: str = "Uploaded Contract",
-    top_k: int = 3,
-    min_evidence_score: float = MIN_EVIDENCE_SCORE,
-) -> dict[str, Any]:
-    """Generate a structured draft legal risk report from clause predictions."""
-    normalized_predictions = [_normalize_prediction(item) for item in clause_predictions]
-    state = create_agent_state(contract_text, normalized_predictions)
+    knowledge_base: LegalKnowledgeBase | None,
+    contract_name: str,
+    top_k: int,
+    min_evidence_score: float,
+    low_risk_confidence: float | None,
+    progress: ProgressCallback | None,
+    stage_metrics: Sequence[StageMetrics],
+    cascade_stats: Mapping[str, Any] | None = None,
+    reused_evidence: Mapping[int, Sequence[EvidenceItem]] | None = None,
+    executor: ReportExecutor | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[AgentState, bool]:
+    """Run retrieval and risk assessment and return the completed state.
+
+    The flag is False when input was missing and the state only holds the fallback.
+    Clauses listed in ``reused_evidence`` (by position) skip retrieval and are
+    assessed with that evidence instead. With an ``executor``, retrieval and
+    finding construction run in chunks of ``chunk_size`` clauses; results are
+    applied to the state in clause order, so the report does not change.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}.")
+    normalized_predictions = _normalize_predictions(clause_predictions)
+    state = create_agent_state(contract_text, normalized_predictions, stage_metrics=stage_metrics)
+    state.cascade_stats = dict(cascade_stats) if cascade_stats is not None else None
 
     if not contract_text.strip() or not normalized_predictions:
         mark_fallback(state, "Contract text or clause predictions were missing.")
         build_summary(state, contract_name=contract_name)
         complete_workflow(state)
-        return build_structured_report(state)
+        return state, False
 
     kb = knowledge_base or _load_or_build_knowledge_base()
     if not kb.records:
         mark_fallback(state, "No legal guidance corpus was available for retrieval.")
 
     build_summary(state, contract_name=contract_name)
+    notify_progress(progress, WorkflowStage.SUMMARIZE, clause_count=len(normalized_predictions))
 
-    for prediction in normalized_predictions:
-        query = f"{prediction.predicted_type} {prediction.clause_text}".strip()
-        hits = kb.search(query, top_k=top_k) if kb.records else []
-        evidence = _evidence_from_hits(prediction.clause_id, hits)
-        supported_evidence = filter_supported_evidence(evidence, min_score=min_evidence_score)
-        if not evidence:
-            mark_fallback(
-                state,
-                f"No retrieval evidence was found for {prediction.clause_id}; refusing to speculate.",
-            )
-        elif not supported_evidence:
-            mark_fallback(
-                state,
-                f"Evidence for {prediction.clause_id} was below the support threshold; refusing to speculate.",
-            )
-        if evidence_is_strong(supported_evidence, min_score=min_evidence_score):
-            state.evidence.extend(supported_evidence)
-        finding = _build_finding(prediction, supported_evidence)
-        state.findings.append(finding)
+    reused_evidence = reused_evidence or {}
+    skip_flags = [_is_confident_low_risk(prediction, low_risk_confidence) for prediction in normalized_predictions]
+    retrieval_indices = [
+        index for index, skipped in enumerate(skip_flags) if not skipped and index not in reused_evidence
+    ]
+    clause_hits: list[list[RetrievalHit]] = [[] for _ in normalized_predictions]
+    total = len(normalized_predictions)
+    with _report_executor(executor, workers, kb, fan_out=total > chunk_size) as (pool, shipped_kb):
+        advance_stage(state, WorkflowStage.RETRIEVE, len(retrieval_indices))
+        if kb.records and retrieval_indices:
+            queries = [_build_retrieval_text(normalized_predictions[index]) for index in retrieval_indices]
+            # Wall time around the whole fan-out, so parallel chunks are not summed as CPU time.
+            started = time.perf_counter()
+            if pool is None:
+                searches = [_search_chunk(kb, queries, top_k)]
+            else:
+                futures = [
+                    pool.submit(_search_chunk, shipped_kb, chunk, top_k) for chunk in _chunks(queries, chunk_size)
+                ]
+                searches = [future.result() for future in futures]
+            state.retrieval_seconds += time.perf_counter() - started
+            batched_hits = [hits for chunk_hits in searches for hits in chunk_hits]
+            for index, hits in zip(retrieval_indices, batched_hits):
+                clause_hits[index] = hits
+        notify_progress(progress, WorkflowStage.RETRIEVE, retrieved=len(retrieval_indices))
+
+        advance_stage(state, WorkflowStage.ASSESS_RISK, total)
+        items = [
+            (prediction, skipped, hits, reused_evidence.get(index))
+            for index, (prediction, skipped, hits) in enumerate(zip(normalized_predictions, skip_flags, clause_hits))
+        ]
+        if pool is None:
+            assessments: Iterator[_ClauseAssessment] = (_assess_clause(*item, min_evidence_score) for item in items)
+        else:
+            futures = [pool.submit(_assess_chunk, chunk, min_evidence_score) for chunk in _chunks(items, chunk_size)]
+            assessments = (assessment for future in futures for assessment in future.result())
+        for index, assessment in enumerate(assessments):
+            notify_progress(progress, WorkflowStage.ASSESS_RISK, completed=index + 1, total=total)
+            if assessment.skipped:
+                state.skipped_retrievals.append(assessment.finding.clause_id)
+            if assessment.fallback_reason:
+                mark_fallback(state, assessment.fallback_reason)
+            state.evidence.extend(assessment.strong_evidence)
+            state.findings.append(assessment.finding)
 
     mark_mitigation(state)
+    notify_progress(progress, WorkflowStage.MITIGATE, finding_count=len(state.findings))
     complete_workflow(state)
-    return build_structured_report(state)
+    return state, True
+
+
+@instrumented("generate_legal_assistance_report", items=lambda report: len(report["identified_risks"]))
+@profiled("generate_legal_assistance_report")
+def generate_legal_assistance_report(
+    contract_text: str,
+    clause_predictions: ClausePredictionInput,
+    *,
+    knowledge_base: LegalKnowledgeBase | None = None,
+    contract_name: str = "Uploaded Contract",
+    top_k: int = 3,
+    min_evidence_score: float = MIN_EVIDENCE_SCORE,
+    low_risk_confidence: float | None = None,
+    progress: ProgressCallback | None = None,
+    stage_metrics: Sequence[StageMetrics] = (),
+    cascade_stats: Mapping[str, Any] | None = None,
+    reused_evidence: Mapping[int, Sequence[EvidenceItem]] | None = None,
+    executor: ReportExecutor | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Generate a structured draft legal risk report from clause predictions.
+
+    When ``low_risk_confidence`` is set, low-risk clauses whose prediction
+    confidence meets the threshold skip retrieval and are reported without
+    evidence; the skipped count and estimated time saved land in the report.
+    ``progress`` receives each workflow stage and may raise ``WorkflowCancelled``.
+    ``stage_metrics`` from upstream segmentation and prediction are carried into
+    the report's ``performance`` section alongside the assistant stages, and
+    ``cascade_stats`` from a rule-first classifier cascade land there too.
+    ``reused_evidence`` maps clause positions to supported evidence from an
+    earlier analysis of the same clause text; those clauses skip retrieval.
+    ``executor`` (``"thread"``, ``"process"``, or an ``Executor``) fans retrieval
+    and finding construction out in chunks of ``chunk_size`` clauses across
+    ``workers``; the report is identical to a serial run.
+    """
+    state, assessed = _run_assistant_workflow(
+        contract_text,
+        clause_predictions,
+        knowledge_base=knowledge_base,
+        contract_name=contract_name,
+        top_k=top_k,
+        min_evidence_score=min_evidence_score,
+        low_risk_confidence=low_risk_confidence,
+        progress=progress,
+        stage_metrics=stage_metrics,
+        cascade_stats=cascade_stats,
+        reused_evidence=reused_evidence,
+        executor=executor,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    if not assessed:
+        return build_structured_report(state)
+    report = build_structured_report(state, low_risk_confidence=low_risk_confidence)
+    notify_progress(progress, WorkflowStage.COMPLETE)
+    return report
+
+
+@instrumented("stream_legal_assistance_report", items=lambda state: len(state.findings))
+@profiled("stream_legal_assistance_report")
+def stream_legal_assistance_report(
+    fp: TextIO,
+    contract_text: str,
+    clause_predictions: ClausePredictionInput,
+    *,
+    knowledge_base: LegalKnowledgeBase | None = None,
+    contract_name: str = "Uploaded Contract",
+    top_k: int = 3,
+    min_evidence_score: float = MIN_EVIDENCE_SCORE,
+    low_risk_confidence: float | None = None,
+    progress: ProgressCallback | None = None,
+    stage_metrics: Sequence[StageMetrics] = (),
+    cascade_stats: Mapping[str, Any] | None = None,
+    reused_evidence: Mapping[int, Sequence[EvidenceItem]] | None = None,
+    executor: ReportExecutor | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    indent: int | str | None = None,
+) -> AgentState:
+    """Write the report for ``generate_legal_assistance_report`` as JSON to ``fp``.
+
+    Findings are encoded one at a time instead of building the report dict, so
+    memory stays flat for very long contracts. Returns the completed state for
+    callers that need the fallback reason or finding count.
+    """
+    state, assessed = _run_assistant_workflow(
+        contract_text,
+        clause_predictions,
+        knowledge_base=knowledge_base,
+        contract_name=contract_name,
+        top_k=top_k,
+        min_evidence_score=min_evidence_score,
+        low_risk_confidence=low_risk_confidence,
+        progress=progress,
+        stage_metrics=stage_metrics,
+        cascade_stats=cascade_stats,
+        reused_evidence=reused_evidence,
+        executor=executor,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    if not assessed:
+        write_report_json(state, fp, indent=indent)
+        return state
+    write_report_json(state, fp, low_risk_confidence=low_risk_confidence, indent=indent)
+    notify_progress(progress, WorkflowStage.COMPLETE)
+    return state
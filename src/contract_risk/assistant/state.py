@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from contract_risk.assistant.explanations import ClauseExplanation
 
 
 class WorkflowStage(str, Enum):
@@ -21,13 +25,19 @@ class WorkflowStage(str, Enum):
 
 @dataclass(frozen=True)
 class ClausePrediction:
-    """Normalized clause prediction used by the assistant."""
+    """Normalized clause prediction used by the assistant.
+
+    ``reused_from`` names the clause in another contract whose prediction was
+    reused instead of running the model, when that happened.
+    """
 
     clause_id: str
     clause_text: str
     predicted_type: str
     severity: str
     risk_score: int
+    confidence: float | None = None
+    reused_from: str | None = None
 
 
 @dataclass(frozen=True)
@@ -44,7 +54,11 @@ class EvidenceItem:
 
 @dataclass(frozen=True)
 class RiskFinding:
-    """Structured clause-level risk finding."""
+    """Structured clause-level risk finding.
+
+    ``clause_explanation`` holds the full explanation computed when the finding
+    was built, so report assembly does not format it a second time.
+    """
 
     clause_id: str
     clause_text: str
@@ -54,6 +68,8 @@ class RiskFinding:
     explanation: str
     mitigation_action: str
     evidence: tuple[EvidenceItem, ...] = field(default_factory=tuple)
+    clause_explanation: ClauseExplanation | None = field(default=None, compare=False, repr=False)
+    reused_from: str | None = None
 
 
 @dataclass(frozen=True)
@@ -68,6 +84,30 @@ class ContractSummary:
     overview: str
 
 
+@dataclass(frozen=True)
+class StageMetrics:
+    """Resource usage captured for one workflow stage."""
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_alloc_bytes: int | None
+    item_count: int
+
+
+@dataclass
+class StageClock:
+    """Start marks for a stage that is currently being measured."""
+
+    stage: str
+    wall_start: float
+    cpu_start: float
+    alloc_start: int | None
+    item_count: int
+    alloc_sequence: int | None = None
+    release: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+
+
 @dataclass
 class AgentState:
     """Mutable workflow state for the assistant pipeline."""
@@ -80,3 +120,8 @@ class AgentState:
     summary: ContractSummary | None = None
     fallback_reason: str | None = None
     errors: list[str] = field(default_factory=list)
+    skipped_retrievals: list[str] = field(default_factory=list)
+    retrieval_seconds: float = 0.0
+    stage_metrics: list[StageMetrics] = field(default_factory=list)
+    stage_clock: StageClock | None = None
+    cascade_stats: dict[str, Any] | None = None
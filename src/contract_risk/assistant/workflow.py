@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+import time
+import tracemalloc
+import weakref
 from collections import Counter
+from typing import Any, Callable, Mapping, Sequence
 
 from contract_risk.assistant.state import (
     AgentState,
@@ -10,21 +15,131 @@ from contract_risk.assistant.state import (
     ContractSummary,
     EvidenceItem,
     RiskFinding,
+    StageClock,
+    StageMetrics,
     WorkflowStage,
 )
 
+ProgressCallback = Callable[[WorkflowStage, Mapping[str, Any]], None]
 
-def create_agent_state(contract_text: str, clause_predictions: list[ClausePrediction]) -> AgentState:
-    """Create the initial workflow state."""
-    return AgentState(
+# tracemalloc keeps one process-wide peak, so a clock's peak is its own only
+# when no other traced clock was open at any point while it ran. Clocks that
+# are never stopped are released when they are garbage collected.
+_TRACED_CLOCK_LOCK = threading.Lock()
+_open_traced_clocks = 0
+_traced_clock_starts = 0
+
+
+class WorkflowCancelled(Exception):
+    """Raised by a progress callback to stop a running analysis early."""
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the service cannot accept more pending work.
+
+    Analyses let it propagate instead of recording it as a failure, so a
+    server can answer "retry later".
+    """
+
+
+def notify_progress(callback: ProgressCallback | None, stage: WorkflowStage, **details: Any) -> None:
+    """Forward a stage update to an optional progress callback."""
+    if callback is not None:
+        callback(stage, details)
+
+
+def _close_traced_clock() -> None:
+    """Forget one open traced clock."""
+    global _open_traced_clocks
+    with _TRACED_CLOCK_LOCK:
+        _open_traced_clocks -= 1
+
+
+def start_stage_clock(stage: str, item_count: int = 0) -> StageClock:
+    """Start measuring wall time, CPU time, and (when tracing) allocations.
+
+    Peak allocation is only valid for single-threaded runs: ``tracemalloc``
+    has one process-wide peak, so a clock that overlaps another traced clock,
+    for example in a concurrent server or a thread pool, reports None.
+    """
+    global _open_traced_clocks, _traced_clock_starts
+    clock = StageClock(
+        stage=stage,
+        wall_start=time.perf_counter(),
+        cpu_start=time.process_time(),
+        alloc_start=None,
+        item_count=item_count,
+    )
+    if not tracemalloc.is_tracing():
+        return clock
+    with _TRACED_CLOCK_LOCK:
+        _open_traced_clocks += 1
+        _traced_clock_starts += 1
+        alone = _open_traced_clocks == 1
+        if alone:
+            clock.alloc_sequence = _traced_clock_starts
+            tracemalloc.reset_peak()
+            clock.alloc_start = tracemalloc.get_traced_memory()[0]
+    clock.release = weakref.finalize(clock, _close_traced_clock)
+    return clock
+
+
+def stop_stage_clock(clock: StageClock, item_count: int | None = None) -> StageMetrics:
+    """Finish a stage measurement.
+
+    Peak allocation is known only under tracemalloc and only when no other
+    traced clock overlapped this one; otherwise it is None.
+    """
+    peak_alloc = None
+    if clock.alloc_start is not None and tracemalloc.is_tracing():
+        with _TRACED_CLOCK_LOCK:
+            overlapped = _traced_clock_starts != clock.alloc_sequence
+            if not overlapped:
+                peak_alloc = max(0, tracemalloc.get_traced_memory()[1] - clock.alloc_start)
+    if clock.release is not None:
+        clock.release()
+    return StageMetrics(
+        stage=clock.stage,
+        wall_seconds=round(time.perf_counter() - clock.wall_start, 6),
+        cpu_seconds=round(time.process_time() - clock.cpu_start, 6),
+        peak_alloc_bytes=peak_alloc,
+        item_count=clock.item_count if item_count is None else item_count,
+    )
+
+
+def _switch_stage_clock(state: AgentState, stage: WorkflowStage | None, item_count: int | None = None) -> None:
+    """Close the running stage measurement and start one for ``stage``."""
+    if state.stage_clock is not None:
+        state.stage_metrics.append(stop_stage_clock(state.stage_clock))
+        state.stage_clock = None
+    if stage is not None:
+        count = len(state.clause_predictions) if item_count is None else item_count
+        state.stage_clock = start_stage_clock(stage.value, count)
+
+
+def create_agent_state(
+    contract_text: str,
+    clause_predictions: list[ClausePrediction],
+    stage_metrics: Sequence[StageMetrics] = (),
+) -> AgentState:
+    """Create the initial workflow state.
+
+    ``stage_metrics`` carries measurements from work done before the assistant,
+    such as segmentation and prediction, so the report can show all stages.
+    """
+    state = AgentState(
         stage=WorkflowStage.INGEST,
         contract_text=contract_text,
         clause_predictions=list(clause_predictions),
+        stage_metrics=list(stage_metrics),
     )
+    _switch_stage_clock(state, WorkflowStage.INGEST)
+    return state
 
 
-def advance_stage(state: AgentState, stage: WorkflowStage) -> AgentState:
+def advance_stage(state: AgentState, stage: WorkflowStage, item_count: int | None = None) -> AgentState:
     """Move the workflow to the next stage."""
+    _switch_stage_clock(state, stage, item_count)
     state.stage = stage
     return state
 
@@ -60,14 +175,13 @@ def build_summary(state: AgentState, contract_name: str = "Uploaded Contract") -
         ),
     )
     state.summary = summary
-    state.stage = WorkflowStage.SUMMARIZE
+    advance_stage(state, WorkflowStage.SUMMARIZE)
     return summary
 
 
 def mark_mitigation(state: AgentState) -> AgentState:
     """Move the workflow into mitigation drafting."""
-    state.stage = WorkflowStage.MITIGATE
-    return state
+    return advance_stage(state, WorkflowStage.MITIGATE, len(state.findings))
 
 
 def mark_fallback(state: AgentState, reason: str) -> AgentState:
@@ -79,6 +193,7 @@ def mark_fallback(state: AgentState, reason: str) -> AgentState:
 
 
 def complete_workflow(state: AgentState) -> AgentState:
-    """Mark the workflow complete."""
+    """Mark the workflow complete and close the last stage measurement."""
+    _switch_stage_clock(state, None)
     state.stage = WorkflowStage.COMPLETE
     return state
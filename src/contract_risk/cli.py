@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
+import tracemalloc
 from pathlib import Path
-
-from sklearn.model_selection import train_test_split
+from urllib.request import urlopen
 
 from contract_risk.config import ProjectConfig, resolve_training_csv
-from contract_risk.data.loader import load_training_dataframe
-from contract_risk.models.comparison import compare_baseline_models
-from contract_risk.models.evaluation import evaluate_classifier
-from contract_risk.models.pipeline import load_model, save_model, train_logreg_model
+from contract_risk.metrics import REGISTRY, enable_metrics
+from contract_risk.profiling import PROFILER, enable_profiling
 
 
 def _safe_split(
@@ -20,6 +20,8 @@ def _safe_split(
     test_size: float,
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     """Split dataset while handling low-frequency labels."""
+    from sklearn.model_selection import train_test_split
+
     label_counts: dict[str, int] = {}
     for label in labels:
         label_counts[label] = label_counts.get(label, 0) + 1
@@ -38,6 +40,9 @@ def _safe_split(
 
 def run_train(args: argparse.Namespace) -> None:
     """Train and save the baseline logistic regression model."""
+    from contract_risk.data.loader import load_training_dataframe
+    from contract_risk.models.pipeline import save_model, train_logreg_model
+
     config = ProjectConfig()
     csv_path = resolve_training_csv(args.csv, config)
     dataset = load_training_dataframe(csv_path)
@@ -50,6 +55,11 @@ def run_train(args: argparse.Namespace) -> None:
 
 def run_eval(args: argparse.Namespace) -> None:
     """Evaluate the trained model and compare baseline models."""
+    from contract_risk.data.loader import load_training_dataframe
+    from contract_risk.models.comparison import compare_baseline_models
+    from contract_risk.models.evaluation import evaluate_classifier
+    from contract_risk.models.pipeline import load_model
+
     config = ProjectConfig()
     csv_path = resolve_training_csv(args.csv, config)
     dataset = load_training_dataframe(csv_path)
@@ -84,6 +94,190 @@ def run_eval(args: argparse.Namespace) -> None:
     print(comparison_df.to_string(index=False))
 
 
+def _configure_profiling(args: argparse.Namespace, min_gap_seconds: float) -> None:
+    """Turn on request profiling when ``--profile`` was passed."""
+    if not args.profile:
+        return
+    changes: dict[str, object] = {"min_gap_seconds": min_gap_seconds}
+    if args.profile_dir:
+        changes["output_dir"] = Path(args.profile_dir)
+    enable_profiling(**changes)
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    """Serve the analysis HTTP API with the model and KB kept resident."""
+    from contract_risk.assistant.corpus import load_legal_guidance_corpus
+    from contract_risk.assistant.retrieval import build_knowledge_base
+    from contract_risk.models.inference import load_or_train_model
+    from contract_risk.server import ServerConfig, serve
+
+    config = ServerConfig(
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        max_queue_size=args.max_queue_size,
+        worker_threads=args.workers,
+        rule_cascade=args.rule_cascade,
+    )
+    _configure_profiling(args, args.profile_min_gap)
+    model = load_or_train_model(args.model_path)
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    try:
+        asyncio.run(serve(model, knowledge_base, config))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Analyze many contracts in pre-forked workers sharing one loaded model."""
+    from contract_risk.prefork import run_prefork_batch
+
+    config = ProjectConfig()
+    output_dir = Path(args.output_dir) if args.output_dir else config.reports_dir / "batch"
+    summary = run_prefork_batch(
+        args.paths,
+        output_dir,
+        workers=args.workers,
+        model_path=args.model_path,
+        rule_cascade=args.rule_cascade,
+    )
+
+    for result in summary["results"]:
+        status = result.get("error") or f"{result['clause_count']} clauses -> {result['report_path']}"
+        print(f"{result['path']}: {status}")
+
+    memory = summary["memory"]
+    print(f"Workers: {len(memory['workers'])}")
+    for worker in memory["workers"]:
+        print(
+            f"  pid {worker['pid']}: RSS {worker['rss_kb']:,} KB, PSS {worker['pss_kb']:,} KB, "
+            f"shared {worker['shared_kb']:,} KB, saved {worker['shared_savings_kb']:,} KB"
+        )
+    print(f"Total saved by copy-on-write sharing: {memory['total_shared_savings_kb']:,} KB")
+    if "cascade" in summary:
+        cascade = summary["cascade"]
+        speedup = cascade["estimated_speedup"]
+        print(
+            f"Rule cascade: {cascade['rule_resolved']:,} clauses decided by rules, "
+            f"{cascade['model_resolved']:,} by the model ({cascade['rule_fraction']:.1%} by rules), "
+            f"estimated speedup {f'{speedup:.2f}x' if speedup else 'n/a'}"
+        )
+
+    if args.memory_report:
+        Path(args.memory_report).write_text(json.dumps(memory, indent=2), encoding="utf-8")
+
+
+def run_analyze(args: argparse.Namespace) -> None:
+    """Analyze one contract as a background job and stream its progress."""
+    from contract_risk.assistant.corpus import load_legal_guidance_corpus
+    from contract_risk.assistant.retrieval import build_knowledge_base
+    from contract_risk.data.ingestion import extract_text_from_path
+    from contract_risk.jobs import AnalysisJobQueue
+    from contract_risk.models.inference import load_or_train_model
+
+    if args.dump_metrics:
+        enable_metrics()
+    _configure_profiling(args, 0.0)
+    source = Path(args.path)
+    text = extract_text_from_path(source)
+    model = load_or_train_model(args.model_path)
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+
+    if args.trace_memory:
+        tracemalloc.start()
+    try:
+        queue = AnalysisJobQueue(workers=1)
+        job_id = queue.submit(
+            text,
+            model,
+            contract_name=source.name,
+            knowledge_base=knowledge_base,
+            generate_report=not args.no_report,
+            time_budget_seconds=args.time_budget,
+        )
+        clause_table_printed = False
+        try:
+            for update in queue.iter_updates(job_id):
+                print(f"[{update['progress']:6.1%}] {update['status']:<9} {update['stage']}")
+                job = queue.get(job_id)
+                if update["clause_table_ready"] and not clause_table_printed and job.clause_frame is not None:
+                    print(job.clause_frame[["clause_id", "predicted_type", "severity", "risk_score"]].to_string(index=False))
+                    clause_table_printed = True
+        except KeyboardInterrupt:
+            queue.cancel(job_id)
+            queue.wait(job_id)
+        finally:
+            queue.shutdown()
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+
+    job = queue.get(job_id)
+    if job.error:
+        print(f"Job {job.status.value}: {job.error}")
+    if job.result is not None and job.result.report is not None:
+        report = job.result.report
+        print(
+            f"Report ready: {report['severity_assessment']['overall_risk_level']} overall risk, "
+            f"{len(report['identified_risks'])} findings."
+        )
+        performance = report.get("performance")
+        if performance:
+            print("Stage timings:")
+            for stage in performance["stages"]:
+                peak = stage["peak_alloc_bytes"]
+                peak_text = f"{peak / 1024:,.0f} KiB" if peak is not None else "n/a"
+                print(
+                    f"  {stage['stage']:<12} wall {stage['wall_seconds'] * 1000:9.2f} ms  "
+                    f"cpu {stage['cpu_seconds'] * 1000:9.2f} ms  peak {peak_text:>10}  items {stage['item_count']}"
+                )
+            print(f"  {'total':<12} wall {performance['total_wall_seconds'] * 1000:9.2f} ms")
+        if args.output:
+            with Path(args.output).open("w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+            print(f"Report written to: {args.output}")
+        if args.portfolio_db:
+            from contract_risk.assistant.portfolio import PortfolioStore
+
+            with PortfolioStore(args.portfolio_db) as store:
+                store.add_analysis(job.result)
+                print(f"Stored in portfolio: {args.portfolio_db} ({len(store)} contracts)")
+    for artifact in PROFILER.recent:
+        print(f"Profile ({artifact.sample_count} samples): {artifact.collapsed_path} and {artifact.summary_path}")
+    if args.dump_metrics:
+        print(REGISTRY.render(), end="")
+
+
+def run_portfolio(args: argparse.Namespace) -> None:
+    """Print trend queries over the contracts stored in the portfolio database."""
+    from contract_risk.assistant.portfolio import PortfolioStore
+
+    db_path = Path(args.db) if args.db else ProjectConfig().portfolio_db_path
+    if not db_path.exists():
+        print(f"No portfolio database at {db_path}; analyze contracts with --portfolio-db first.")
+        return
+    with PortfolioStore(db_path) as store:
+        if args.type or args.severity or args.contract:
+            findings = store.findings(
+                predicted_type=args.type, severity=args.severity, contract_name=args.contract, limit=args.limit
+            )
+            print(json.dumps(findings, indent=2))
+            return
+        summary = {
+            "contract_count": len(store),
+            "severity_totals": store.severity_totals(),
+            "repeated_risk_patterns": store.repeated_risk_patterns(listed_contracts=args.limit),
+        }
+        print(json.dumps(summary, indent=2))
+
+
+def run_metrics(args: argparse.Namespace) -> None:
+    """Print Prometheus metrics scraped from a running analysis service."""
+    with urlopen(args.url, timeout=args.timeout) as response:
+        print(response.read().decode("utf-8"), end="")
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build CLI parser for project commands."""
     parser = argparse.ArgumentParser(description="Contract risk model tooling")
@@ -101,6 +295,64 @@ def build_parser() -> argparse.ArgumentParser:
     eval_parser.add_argument("--test-size", type=float, default=0.2, help="Test split ratio")
     eval_parser.set_defaults(func=run_eval)
 
+    serve_parser = subparsers.add_parser("serve", help="Serve the local analysis HTTP API")
+    serve_parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Bind port")
+    serve_parser.add_argument("--model-path", type=str, default=None, help="Path to model file")
+    serve_parser.add_argument("--max-batch-size", type=int, default=256, help="Max clauses per micro-batch")
+    serve_parser.add_argument("--max-wait-ms", type=float, default=5.0, help="Max wait before flushing a batch")
+    serve_parser.add_argument("--max-queue-size", type=int, default=128, help="Max pending requests before 429")
+    serve_parser.add_argument("--workers", type=int, default=4, help="Analysis worker threads")
+    serve_parser.add_argument(
+        "--rule-cascade", action="store_true", help="Decide unambiguous clauses by keyword rules before the model"
+    )
+    serve_parser.add_argument("--profile", action="store_true", help="Write sampled profiles of requests")
+    serve_parser.add_argument("--profile-dir", type=str, default=None, help="Profile output dir")
+    serve_parser.add_argument(
+        "--profile-min-gap",
+        type=float,
+        default=60.0,
+        help="Minimum seconds between profiled requests",
+    )
+    serve_parser.set_defaults(func=run_serve)
+
+    batch_parser = subparsers.add_parser("batch", help="Analyze many contracts with pre-forked workers")
+    batch_parser.add_argument("paths", nargs="+", help="Contract files (.txt or .pdf)")
+    batch_parser.add_argument("--output-dir", type=str, default=None, help="Report JSON output dir")
+    batch_parser.add_argument("--workers", type=int, default=2, help="Number of forked workers")
+    batch_parser.add_argument("--model-path", type=str, default=None, help="Path to model file")
+    batch_parser.add_argument("--memory-report", type=str, default=None, help="Write the memory report JSON here")
+    batch_parser.add_argument(
+        "--rule-cascade", action="store_true", help="Decide unambiguous clauses by keyword rules before the model"
+    )
+    batch_parser.set_defaults(func=run_batch)
+
+    analyze_parser = subparsers.add_parser("analyze", help="Analyze one contract with streamed progress")
+    analyze_parser.add_argument("path", help="Contract file (.txt or .pdf)")
+    analyze_parser.add_argument("--model-path", type=str, default=None, help="Path to model file")
+    analyze_parser.add_argument("--time-budget", type=float, default=None, help="Cancel after this many seconds")
+    analyze_parser.add_argument("--no-report", action="store_true", help="Only build the clause table")
+    analyze_parser.add_argument("--output", type=str, default=None, help="Write the report JSON here")
+    analyze_parser.add_argument("--trace-memory", action="store_true", help="Record peak allocations per stage")
+    analyze_parser.add_argument("--dump-metrics", action="store_true", help="Print Prometheus metrics afterwards")
+    analyze_parser.add_argument("--profile", action="store_true", help="Write a sampled profile of the run")
+    analyze_parser.add_argument("--profile-dir", type=str, default=None, help="Profile output dir")
+    analyze_parser.add_argument("--portfolio-db", type=str, default=None, help="Store the report in this portfolio")
+    analyze_parser.set_defaults(func=run_analyze)
+
+    portfolio_parser = subparsers.add_parser("portfolio", help="Query risk trends across stored contracts")
+    portfolio_parser.add_argument("--db", type=str, default=None, help="Path to the portfolio database")
+    portfolio_parser.add_argument("--type", type=str, default=None, help="List findings of this clause type")
+    portfolio_parser.add_argument("--severity", type=str, default=None, help="List findings of this severity")
+    portfolio_parser.add_argument("--contract", type=str, default=None, help="List findings of this contract")
+    portfolio_parser.add_argument("--limit", type=int, default=20, help="Max findings or contract names listed")
+    portfolio_parser.set_defaults(func=run_portfolio)
+
+    metrics_parser = subparsers.add_parser("metrics", help="Dump metrics from a running service")
+    metrics_parser.add_argument("--url", type=str, default="http://127.0.0.1:8765/metrics", help="Metrics URL")
+    metrics_parser.add_argument("--timeout", type=float, default=5.0, help="Request timeout in seconds")
+    metrics_parser.set_defaults(func=run_metrics)
+
     return parser
 
 
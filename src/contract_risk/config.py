@@ -34,6 +34,9 @@ class ProjectConfig:
     fallback_train_csv: Path = field(
         default_factory=lambda: _path_from_env("DABB_FALLBACK_TRAINING_CSV", "data/demo/sample_training.csv")
     )
+    portfolio_db_path: Path = field(
+        default_factory=lambda: _path_from_env("DABB_PORTFOLIO_DB", "reports/portfolio.sqlite3")
+    )
 
 
 def resolve_training_csv(requested_path: str | None, config: ProjectConfig) -> Path:
@@ -6,7 +6,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
-from pypdf import PdfReader
+from contract_risk.metrics import instrumented
 
 
 class UnsupportedFileTypeError(ValueError):
@@ -22,8 +22,11 @@ def extract_text_from_txt(path: str | Path, encoding: str = "utf-8") -> str:
     return Path(path).read_text(encoding=encoding).strip()
 
 
+@instrumented("extract_text_from_pdf", items=len)
 def extract_text_from_pdf(file_obj: BinaryIO) -> str:
     """Extract text from a PDF file-like object."""
+    from pypdf import PdfReader
+
     try:
         reader = PdfReader(file_obj)
         pages = [(page.extract_text() or "").strip() for page in reader.pages]
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 TEXT_COLUMN_CANDIDATES = ["text", "clause", "sentence", "content"]
 LABEL_COLUMN_CANDIDATES = ["label", "category", "clause_type", "type"]
@@ -26,6 +27,8 @@ def _first_existing_column(columns: Iterable[str], candidates: list[str]) -> str
 
 def load_training_dataframe(csv_path: str | Path) -> pd.DataFrame:
     """Load a training dataframe and normalize column names to text/label."""
+    import pandas as pd
+
     frame = pd.read_csv(csv_path)
 
     text_column = _first_existing_column(frame.columns, TEXT_COLUMN_CANDIDATES)
@@ -0,0 +1,60 @@
+"""Compiled multi-keyword matching for clause tagging rules."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+
+
+class KeywordMatcher:
+    """Match many keyword families against text with one lowercase pass.
+
+    Rules are compiled once into a flat, deduplicated keyword table, each entry
+    carrying the tags it implies. Matching lowercases the text once and runs one
+    substring scan per unique keyword, which for rule tables of this size is
+    faster in CPython than a regex alternation or a pure-Python automaton.
+
+    With ``whole_words=True`` a keyword only matches between word boundaries,
+    so "war" no longer hits "software" and "venue" no longer hits "revenue".
+    That mode compiles one alternation instead, since boundaries rule out a
+    plain substring scan. Use it wherever a match decides something on its own.
+    """
+
+    def __init__(self, rules: Mapping[str, Sequence[str]], *, whole_words: bool = False) -> None:
+        self.tags: tuple[str, ...] = tuple(rules)
+        self.whole_words = whole_words
+        self._tag_order = {tag: index for index, tag in enumerate(self.tags)}
+        keyword_tags: dict[str, set[str]] = {}
+        for tag, keywords in rules.items():
+            for keyword in keywords:
+                normalized = keyword.lower()
+                if normalized:
+                    keyword_tags.setdefault(normalized, set()).add(tag)
+        self._keywords: tuple[tuple[str, frozenset[str]], ...] = tuple(
+            (keyword, frozenset(tags)) for keyword, tags in keyword_tags.items()
+        )
+        self._keyword_tags = dict(self._keywords)
+        self._pattern: re.Pattern[str] | None = None
+        if whole_words and self._keywords:
+            # Longest first, so "late fee" wins over "fee" at the same position.
+            alternation = "|".join(re.escape(keyword) for keyword in sorted(keyword_tags, key=len, reverse=True))
+            self._pattern = re.compile(rf"\b(?:{alternation})\b")
+
+    def match_tags(self, text: str) -> tuple[str, ...]:
+        """Return the matched tags in rule order."""
+        if not text:
+            return ()
+
+        normalized = text.lower()
+        found: set[str] = set()
+        if self.whole_words:
+            if self._pattern is not None:
+                for keyword in set(self._pattern.findall(normalized)):
+                    found |= self._keyword_tags[keyword]
+        else:
+            for keyword, tags in self._keywords:
+                if keyword in normalized:
+                    found |= tags
+        if len(found) < 2:
+            return tuple(found)
+        return tuple(sorted(found, key=self._tag_order.__getitem__))
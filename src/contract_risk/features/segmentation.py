@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from typing import List
 
+from contract_risk.metrics import instrumented
+
 NUMBERED_PATTERN = re.compile(r"^\s*(?:\d+(?:\.\d+)*\s+|\([a-z]\)\s+)", re.IGNORECASE)
 SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
 
@@ -53,6 +55,7 @@ def _fallback_sentence_chunking(text: str, chunk_size: int = 2) -> List[str]:
     return grouped
 
 
+@instrumented("segment_clauses", items=len)
 def segment_clauses(text: str, min_chars: int = 30) -> List[str]:
     """Split legal text into likely clause units.
 
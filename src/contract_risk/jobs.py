@@ -0,0 +1,246 @@
+"""Background analysis jobs with stage progress, cancellation, and time budgets."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
+
+from contract_risk.assistant.state import WorkflowStage
+from contract_risk.assistant.workflow import WorkflowCancelled
+from contract_risk.ui_support import ContractAnalysisResult, analyze_contract_text
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+STAGE_PROGRESS: dict[WorkflowStage, float] = {
+    WorkflowStage.INGEST: 0.0,
+    WorkflowStage.PREPROCESS: 0.1,
+    WorkflowStage.SUMMARIZE: 0.35,
+    WorkflowStage.RETRIEVE: 0.5,
+    WorkflowStage.MITIGATE: 0.95,
+    WorkflowStage.COMPLETE: 1.0,
+}
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states for a background analysis job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Return True once the job can no longer change."""
+        return self not in {JobStatus.QUEUED, JobStatus.RUNNING}
+
+
+class UnknownJobError(KeyError):
+    """Raised when a job id is not known to the queue."""
+
+
+@dataclass
+class AnalysisJob:
+    """Mutable record of one queued contract analysis."""
+
+    job_id: str
+    contract_name: str
+    time_budget_seconds: float | None = None
+    status: JobStatus = JobStatus.QUEUED
+    stage: WorkflowStage = WorkflowStage.INGEST
+    progress: float = 0.0
+    clause_frame: pd.DataFrame | None = None
+    result: ContractAnalysisResult | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_requested: bool = False
+    version: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a lightweight, JSON-friendly view of the job state."""
+        end = self.finished_at or time.monotonic()
+        return {
+            "job_id": self.job_id,
+            "contract_name": self.contract_name,
+            "status": self.status.value,
+            "stage": self.stage.value,
+            "progress": round(self.progress, 4),
+            "clause_table_ready": self.clause_frame is not None,
+            "report_ready": self.result is not None and self.result.report is not None,
+            "error": self.error,
+            "elapsed_seconds": round(end - self.started_at, 4) if self.started_at else 0.0,
+            "version": self.version,
+        }
+
+
+def _stage_progress(stage: WorkflowStage, details: Mapping[str, Any]) -> float:
+    """Estimate overall progress for a stage update."""
+    if stage == WorkflowStage.ASSESS_RISK:
+        if "clause_frame" in details:
+            return 0.3
+        total = int(details.get("total") or 0)
+        completed = int(details.get("completed") or 0)
+        return 0.5 + 0.45 * (completed / total if total else 1.0)
+    return STAGE_PROGRESS.get(stage, 0.0)
+
+
+class AnalysisJobQueue:
+    """Run ``analyze_contract_text`` in background worker threads.
+
+    Jobs report progress through the workflow stages, publish the clause table
+    before the assistant report is built, and can be cancelled or bounded by a
+    time budget. Cancellation is checked at every stage update.
+    """
+
+    def __init__(self, workers: int = 2) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="analysis-job")
+        self._jobs: dict[str, AnalysisJob] = {}
+        self._changed = threading.Condition()
+
+    def submit(
+        self,
+        raw_text: str,
+        model: object | None,
+        *,
+        contract_name: str = "Uploaded Contract",
+        knowledge_base: object | None = None,
+        generate_report: bool = True,
+        time_budget_seconds: float | None = None,
+    ) -> str:
+        """Queue an analysis and return its job id."""
+        job = AnalysisJob(
+            job_id=uuid.uuid4().hex,
+            contract_name=contract_name,
+            time_budget_seconds=time_budget_seconds,
+        )
+        with self._changed:
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job, raw_text, model, knowledge_base, generate_report)
+        return job.job_id
+
+    def get(self, job_id: str) -> AnalysisJob:
+        """Return the job record for an id."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise UnknownJobError(job_id)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; returns False if the job already finished."""
+        job = self.get(job_id)
+        with self._changed:
+            if job.status.is_terminal:
+                return False
+            job.cancel_requested = True
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED, "Job was cancelled before it started.")
+            return True
+
+    def wait(self, job_id: str, timeout: float | None = None) -> AnalysisJob:
+        """Block until the job finishes or the timeout elapses."""
+        job = self.get(job_id)
+        with self._changed:
+            self._changed.wait_for(lambda: job.status.is_terminal, timeout=timeout)
+        return job
+
+    def iter_updates(self, job_id: str, timeout: float | None = None) -> Iterator[dict[str, Any]]:
+        """Yield a snapshot each time the job changes, ending at a terminal state."""
+        job = self.get(job_id)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        seen = -1
+        while True:
+            with self._changed:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                self._changed.wait_for(lambda: job.version != seen or job.status.is_terminal, timeout=remaining)
+                snapshot = job.snapshot()
+            if snapshot["version"] != seen:
+                seen = snapshot["version"]
+                yield snapshot
+            if job.status.is_terminal or (deadline is not None and time.monotonic() >= deadline):
+                return
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """Stop accepting work, optionally cancelling unfinished jobs."""
+        if cancel_pending:
+            with self._changed:
+                job_ids = [job.job_id for job in self._jobs.values() if not job.status.is_terminal]
+            for job_id in job_ids:
+                self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+
+    def _finish(self, job: AnalysisJob, status: JobStatus, error: str | None = None) -> None:
+        """Record a terminal state; caller must hold the condition."""
+        job.status = status
+        job.error = error
+        job.finished_at = time.monotonic()
+        job.version += 1
+        self._changed.notify_all()
+
+    def _run(
+        self,
+        job: AnalysisJob,
+        raw_text: str,
+        model: object | None,
+        knowledge_base: object | None,
+        generate_report: bool,
+    ) -> None:
+        """Execute one job on a worker thread."""
+        with self._changed:
+            if job.status.is_terminal:
+                return
+            job.status = JobStatus.RUNNING
+            job.started_at = time.monotonic()
+            job.version += 1
+            self._changed.notify_all()
+
+        deadline = job.started_at + job.time_budget_seconds if job.time_budget_seconds is not None else None
+
+        def _on_progress(stage: WorkflowStage, details: Mapping[str, Any]) -> None:
+            if job.cancel_requested:
+                raise WorkflowCancelled("Job was cancelled.")
+            if deadline is not None and stage != WorkflowStage.COMPLETE and time.monotonic() > deadline:
+                raise WorkflowCancelled(f"Time budget of {job.time_budget_seconds:g}s was exceeded.")
+            with self._changed:
+                job.stage = stage
+                job.progress = max(job.progress, _stage_progress(stage, details))
+                if "clause_frame" in details:
+                    job.clause_frame = details["clause_frame"]
+                job.version += 1
+                self._changed.notify_all()
+
+        try:
+            result = analyze_contract_text(
+                raw_text,
+                model,
+                contract_name=job.contract_name,
+                knowledge_base=knowledge_base,
+                generate_report=generate_report,
+                progress=_on_progress,
+            )
+        except WorkflowCancelled as exc:
+            status = JobStatus.CANCELLED if job.cancel_requested else JobStatus.TIMED_OUT
+            with self._changed:
+                self._finish(job, status, str(exc))
+            return
+        except Exception as exc:  # pragma: no cover - defensive guard for runtime failures
+            with self._changed:
+                self._finish(job, JobStatus.FAILED, f"Analysis failed: {exc}")
+            return
+
+        with self._changed:
+            job.result = result
+            job.clause_frame = result.clause_frame
+            job.stage = WorkflowStage.COMPLETE
+            job.progress = 1.0
+            self._finish(job, JobStatus.SUCCEEDED)
@@ -0,0 +1,286 @@
+"""Dependency-free metrics registry with Prometheus text exposition."""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Sequence, TypeVar
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a Prometheus label set."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value without trailing noise for integers."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Increase the counter for one label combination."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Return the current value for one label combination."""
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def snapshot(self) -> dict[tuple[str, ...], float]:
+        """Return a copy of the values keyed by label values."""
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self) -> list[str]:
+        """Render exposition lines for every label combination."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in items]
+
+    def clear(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = ([0] * (len(self.buckets) + 1), [0.0])
+                self._values[labelvalues] = entry
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Return the number of observations for one label combination."""
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[str]:
+        """Render bucket, sum, and count lines for every label combination."""
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._values.items())
+
+        lines: list[str] = []
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        """Drop all recorded observations."""
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """Collection of metrics that renders to the Prometheus text format.
+
+    Instrumentation checks ``enabled`` before doing any work, so a disabled
+    registry costs one attribute lookup per instrumented call.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create or return a registered counter."""
+        return self._register(name, lambda: Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create or return a registered histogram."""
+        return self._register(name, lambda: Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Register a metric once by name."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def reset(self) -> None:
+        """Clear every recorded value while keeping registrations."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        """Render all metrics, plus derived cache hit ratios, as exposition text."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda item: item.name)
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+
+        ratios = _cache_hit_ratios()
+        if ratios:
+            lines.append("# HELP contract_risk_cache_hit_ratio Share of cache lookups that were hits.")
+            lines.append("# TYPE contract_risk_cache_hit_ratio gauge")
+            for cache_name, ratio in sorted(ratios.items()):
+                lines.append(f'contract_risk_cache_hit_ratio{{cache="{_escape(cache_name)}"}} {_format_value(ratio)}')
+        return "\n".join(lines) + "\n"
+
+
+def _env_enabled() -> bool:
+    """Return True when metrics are switched on through the environment."""
+    return os.getenv("DABB_METRICS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+REGISTRY = MetricsRegistry(enabled=_env_enabled())
+
+OPERATION_SECONDS = REGISTRY.histogram(
+    "contract_risk_operation_seconds",
+    "Latency of instrumented analysis operations in seconds.",
+    ("operation",),
+)
+OPERATION_ITEMS = REGISTRY.counter(
+    "contract_risk_operation_items_total",
+    "Items processed by instrumented operations (clauses, findings, or characters).",
+    ("operation",),
+)
+OPERATION_ERRORS = REGISTRY.counter(
+    "contract_risk_operation_errors_total",
+    "Instrumented operations that raised an exception.",
+    ("operation",),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "contract_risk_cache_requests_total",
+    "Cache lookups by cache name and result (hit or miss).",
+    ("cache", "result"),
+)
+
+
+def _cache_hit_ratios() -> dict[str, float]:
+    """Derive hit ratios from the cache request counter."""
+    totals: dict[str, list[float]] = {}
+    for (cache_name, result), value in CACHE_REQUESTS.snapshot().items():
+        entry = totals.setdefault(cache_name, [0.0, 0.0])
+        entry[1] += value
+        if result == "hit":
+            entry[0] += value
+    return {name: hits / total for name, (hits, total) in totals.items() if total}
+
+
+def enable_metrics(enabled: bool = True) -> None:
+    """Switch instrumentation on or off at runtime."""
+    REGISTRY.enabled = enabled
+
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """Count one cache lookup when metrics are enabled."""
+    if REGISTRY.enabled:
+        CACHE_REQUESTS.inc(cache_name, "hit" if hit else "miss")
+
+
+def instrumented(operation: str, items: Callable[[Any], int] | None = None) -> Callable[[FuncT], FuncT]:
+    """Decorate a function with latency, throughput, and error metrics.
+
+    ``items`` maps the return value to the number of items processed.
+    """
+
+    def decorator(func: FuncT) -> FuncT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not REGISTRY.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                OPERATION_ERRORS.inc(operation)
+                raise
+            finally:
+                OPERATION_SECONDS.observe(time.perf_counter() - started, operation)
+            if items is not None:
+                OPERATION_ITEMS.inc(operation, amount=items(result))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,188 @@
+"""Rule-first cascade that only sends ambiguous clauses to the ML classifier."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from contract_risk.features.keywords import KeywordMatcher
+from contract_risk.risk.mapping import normalize_label
+
+# Whole-word phrases for every clause family the rules know about. Short or
+# ambiguous retrieval tags such as "war", "nda", "venue", "fee", and "forum"
+# are left out: they either hide inside longer words or turn up in clauses of
+# several types. "liability" is matched only to detect ambiguity; it has no
+# rule label because its keywords cover both liability caps and indemnities.
+RULE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "liability": (
+        "liability",
+        "liabilities",
+        "liable",
+        "indemnify",
+        "indemnifies",
+        "indemnified",
+        "indemnification",
+        "indemnity",
+        "indemnities",
+        "damages",
+    ),
+    "termination": ("terminate", "terminates", "terminated", "termination"),
+    "confidentiality": ("confidential", "confidentiality", "non-disclosure"),
+    "payment": ("payment", "payments", "invoice", "invoices", "late fee", "late fees"),
+    "arbitration": ("arbitration", "arbitrator", "mediation", "dispute resolution"),
+    "force majeure": ("force majeure", "act of god", "acts of god"),
+    "governing law": ("governing law", "governed by the laws"),
+}
+
+RULE_TAG_MATCHER = KeywordMatcher(RULE_KEYWORDS, whole_words=True)
+
+# Probability reported for a rule-decided label. Keyword rules are a strong
+# hint, not proof, so a rule decision never scores as certain.
+DEFAULT_RULE_CONFIDENCE = 0.8
+
+# Clause tags that identify exactly one model label. A rule decides only when
+# one of these is the sole family matched in the clause.
+RULE_TAG_LABELS: dict[str, str] = {
+    "termination": "termination",
+    "confidentiality": "confidentiality",
+    "payment": "payment terms",
+    "arbitration": "dispute resolution",
+    "force majeure": "force majeure",
+    "governing law": "governing law",
+}
+
+
+@dataclass
+class CascadeStats:
+    """Running counters for how clauses were resolved by the cascade."""
+
+    rule_resolved: int = 0
+    model_resolved: int = 0
+    rule_seconds: float = 0.0
+    model_seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Return the number of clauses classified so far."""
+        return self.rule_resolved + self.model_resolved
+
+    @property
+    def rule_fraction(self) -> float:
+        """Return the share of clauses decided by rules alone."""
+        return self.rule_resolved / self.total if self.total else 0.0
+
+    @property
+    def estimated_speedup(self) -> float | None:
+        """Estimate throughput gain versus sending every clause to the model."""
+        if not self.model_resolved or not self.model_seconds:
+            return None
+        model_only_seconds = self.model_seconds / self.model_resolved * self.total
+        return model_only_seconds / (self.model_seconds + self.rule_seconds)
+
+    def asdict(self) -> dict[str, Any]:
+        """Serialize the counters and derived ratios."""
+        return {
+            "rule_resolved": self.rule_resolved,
+            "model_resolved": self.model_resolved,
+            "rule_fraction": round(self.rule_fraction, 4),
+            "rule_seconds": round(self.rule_seconds, 6),
+            "model_seconds": round(self.model_seconds, 6),
+            "estimated_speedup": round(self.estimated_speedup, 3) if self.estimated_speedup else None,
+        }
+
+
+class RuleCascadeClassifier:
+    """Classifier wrapper that decides unambiguous clauses from keyword rules.
+
+    A clause is unambiguous when the matcher finds exactly one tag and that tag
+    maps to a label the wrapped model knows. Everything else is batched through
+    the wrapped model, so the wrapper is a drop-in for ``predict_clauses``.
+
+    Rule decisions score ``rule_confidence`` for their label, with the rest
+    spread evenly over the other classes, so they never read as certain.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        matcher: KeywordMatcher = RULE_TAG_MATCHER,
+        tag_labels: Mapping[str, str] = RULE_TAG_LABELS,
+        rule_confidence: float = DEFAULT_RULE_CONFIDENCE,
+    ) -> None:
+        if not 0.0 < rule_confidence < 1.0:
+            raise ValueError("rule_confidence must be between 0 and 1 (exclusive).")
+        self.model = model
+        self.matcher = matcher
+        self.rule_confidence = rule_confidence
+        self.stats = CascadeStats()
+
+        known_labels = getattr(model, "classes_", None)
+        if known_labels is None:
+            self._tag_labels = dict(tag_labels)
+        else:
+            by_normalized = {normalize_label(str(label)): str(label) for label in known_labels}
+            self._tag_labels = {
+                tag: by_normalized[normalize_label(label)]
+                for tag, label in tag_labels.items()
+                if normalize_label(label) in by_normalized
+            }
+
+    @property
+    def classes_(self) -> Any:
+        """Expose the wrapped model classes."""
+        return self.model.classes_
+
+    @property
+    def predict_proba(self) -> Callable[[Sequence[str]], np.ndarray]:
+        """Expose probability scores only when the wrapped model has them."""
+        if not hasattr(self.model, "predict_proba"):
+            raise AttributeError("Wrapped model does not provide predict_proba.")
+        return self._predict_proba
+
+    def rule_label(self, text: str) -> str | None:
+        """Return the rule-decided label for a clause, or None when ambiguous."""
+        tags = self.matcher.match_tags(text)
+        if len(tags) != 1:
+            return None
+        return self._tag_labels.get(tags[0])
+
+    def _split(self, texts: Sequence[str]) -> tuple[list[str | None], list[int]]:
+        """Resolve rule labels and collect the indices left for the model."""
+        started = time.perf_counter()
+        labels = [self.rule_label(text) for text in texts]
+        self.stats.rule_seconds += time.perf_counter() - started
+        pending = [index for index, label in enumerate(labels) if label is None]
+        self.stats.rule_resolved += len(labels) - len(pending)
+        self.stats.model_resolved += len(pending)
+        return labels, pending
+
+    def predict(self, texts: Sequence[str]) -> list[str]:
+        """Predict clause labels, calling the model only for ambiguous clauses."""
+        labels, pending = self._split(texts)
+        if pending:
+            started = time.perf_counter()
+            model_labels = self.model.predict([texts[index] for index in pending])
+            self.stats.model_seconds += time.perf_counter() - started
+            for index, label in zip(pending, model_labels):
+                labels[index] = str(label)
+        return [str(label) for label in labels]
+
+    def _predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """Return rule-confidence rows for rule decisions and model scores otherwise."""
+        classes = [str(label) for label in self.model.classes_]
+        labels, pending = self._split(texts)
+        remainder = (1.0 - self.rule_confidence) / (len(classes) - 1) if len(classes) > 1 else 0.0
+        probabilities = np.zeros((len(texts), len(classes)), dtype=float)
+        for index, label in enumerate(labels):
+            if label is not None:
+                probabilities[index] = remainder
+                probabilities[index, classes.index(label)] = self.rule_confidence
+        if pending:
+            started = time.perf_counter()
+            probabilities[pending] = self.model.predict_proba([texts[index] for index in pending])
+            self.stats.model_seconds += time.perf_counter() - started
+        return probabilities
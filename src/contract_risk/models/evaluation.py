@@ -5,12 +5,34 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 from sklearn.metrics import classification_report, confusion_matrix
 
 
+def _save_confusion_matrix(matrix: Any, labels: list[str], prefix: str, destination: Path) -> None:
+    """Plot the confusion matrix heatmap; plotting libraries load on first use."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(10, 6))
+    sns.heatmap(
+        matrix,
+        annot=True,
+        fmt="d",
+        cmap="Blues",
+        xticklabels=labels,
+        yticklabels=labels,
+    )
+    plt.title(f"Confusion Matrix - {prefix}")
+    plt.xlabel("Predicted")
+    plt.ylabel("Actual")
+    plt.xticks(rotation=45, ha="right")
+    plt.yticks(rotation=0)
+    plt.tight_layout()
+    plt.savefig(destination, dpi=200)
+    plt.close()
+
+
 def evaluate_classifier(
     model: Any,
     texts: list[str],
@@ -38,25 +60,7 @@ def evaluate_classifier(
     labels_sorted = sorted(set(labels) | set(predictions))
     matrix = confusion_matrix(labels, predictions, labels=labels_sorted)
 
-    plt.figure(figsize=(10, 6))
-    sns.heatmap(
-        matrix,
-        annot=True,
-        fmt="d",
-        cmap="Blues",
-        xticklabels=labels_sorted,
-        yticklabels=labels_sorted,
-    )
-    plt.title(f"Confusion Matrix - {prefix}")
-    plt.xlabel("Predicted")
-    plt.ylabel("Actual")
-    plt.xticks(rotation=45, ha="right")
-    plt.yticks(rotation=0)
-    plt.tight_layout()
-
-    matrix_file = output_path / f"{prefix}_confusion_matrix.png"
-    plt.savefig(matrix_file, dpi=200)
-    plt.close()
+    _save_confusion_matrix(matrix, labels_sorted, prefix, output_path / f"{prefix}_confusion_matrix.png")
 
     summary_file = output_path / f"{prefix}_summary_metrics.csv"
     pd.DataFrame([summary_metrics]).to_csv(summary_file, index=False)
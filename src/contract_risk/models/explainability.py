@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
-from sklearn.pipeline import Pipeline
+
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
 
 
 class ExplainabilityError(ValueError):
     """Raised when a model cannot be explained with linear coefficients."""
 
 
+# Feature names per fitted vectorizer, with the vocabulary they were read from
+# so a refit vectorizer is not served stale names.
+_FEATURE_NAMES: WeakKeyDictionary[Any, tuple[Any, np.ndarray]] = WeakKeyDictionary()
+
+# Depth of the per-class top-feature table computed when a model is loaded or
+# saved; requests for up to this many features per class are served from it.
+TOP_FEATURES_DEPTH = 25
+# Per model: the coefficients and depth the table was computed for, the table,
+# and the ``top_n`` slices already served from it.
+_TOP_FEATURES: WeakKeyDictionary[Any, tuple[Any, int, pd.DataFrame, dict[int, pd.DataFrame]]] = WeakKeyDictionary()
+
+
 def _extract_components(model: Pipeline) -> tuple[Any, Any]:
     """Extract vectorizer and classifier from sklearn pipeline."""
     if not hasattr(model, "named_steps"):
@@ -30,66 +48,197 @@ def _extract_components(model: Pipeline) -> tuple[Any, Any]:
     return vectorizer, classifier
 
 
-def top_features_by_class(model: Pipeline, top_n: int = 10) -> pd.DataFrame:
-    """Return top weighted features per class for linear classifiers."""
-    vectorizer, classifier = _extract_components(model)
+def _feature_names(vectorizer: Any) -> np.ndarray:
+    """Return the vectorizer's feature names, computed once per fitted vocabulary."""
+    vocabulary = getattr(vectorizer, "vocabulary_", None)
+    cached = _FEATURE_NAMES.get(vectorizer)
+    if cached is not None and cached[0] is vocabulary:
+        return cached[1]
+    names = np.asarray(vectorizer.get_feature_names_out())
+    _FEATURE_NAMES[vectorizer] = (vocabulary, names)
+    return names
 
-    feature_names = np.asarray(vectorizer.get_feature_names_out())
-    class_names = np.asarray(classifier.classes_)
 
-    rows: list[dict[str, str | float]] = []
+def _class_coefficients(classifier: Any) -> np.ndarray:
+    """Return one coefficient row per class, expanding binary models to two rows."""
+    coef = np.asarray(classifier.coef_)
+    if coef.shape[0] == 1 and len(classifier.classes_) == 2:
+        return np.vstack([-coef[0], coef[0]])
+    return coef
 
-    for class_index, class_name in enumerate(class_names):
-        coef = classifier.coef_[class_index]
-        top_indices = np.argsort(coef)[-top_n:][::-1]
-        for rank, idx in enumerate(top_indices, start=1):
-            rows.append(
-                {
-                    "class_label": str(class_name),
-                    "rank": rank,
-                    "feature": str(feature_names[idx]),
-                    "weight": float(coef[idx]),
-                }
-            )
 
-    return pd.DataFrame(rows)
-
-
-def explain_text_prediction(model: Pipeline, text: str, top_n: int = 5) -> pd.DataFrame:
-    """Return top contributing features for a single predicted class."""
+def _top_feature_table(model: Pipeline, top_n: int) -> pd.DataFrame:
+    """Rank each class's largest coefficients with a partial sort."""
     vectorizer, classifier = _extract_components(model)
+    coefficients = _class_coefficients(classifier)
+    feature_names = _feature_names(vectorizer)
+    depth = max(1, min(top_n, coefficients.shape[1]))
+
+    top = np.argpartition(coefficients, -depth, axis=1)[:, -depth:]
+    weights = np.take_along_axis(coefficients, top, axis=1)
+    order = np.argsort(-weights, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    weights = np.take_along_axis(weights, order, axis=1)
+
+    class_count = coefficients.shape[0]
+    return pd.DataFrame(
+        {
+            "class_label": np.repeat(np.asarray(classifier.classes_).astype(str), depth),
+            "rank": np.tile(np.arange(1, depth + 1), class_count),
+            "feature": feature_names[top.ravel()].astype(str),
+            "weight": weights.ravel().astype(float),
+        }
+    )
+
+
+def precompute_top_features(model: Pipeline, top_n: int = TOP_FEATURES_DEPTH) -> pd.DataFrame:
+    """Compute and cache the per-class top-feature table for a model."""
+    _, classifier = _extract_components(model)
+    table = _top_feature_table(model, top_n)
+    _TOP_FEATURES[model] = (classifier.coef_, top_n, table, {})
+    return table
 
-    text_vector = vectorizer.transform([text])
-    prediction = model.predict([text])[0]
-
-    class_indices = np.where(classifier.classes_ == prediction)[0]
-    if len(class_indices) == 0:
-        raise ExplainabilityError("Predicted class not found in classifier classes.")
 
-    class_index = int(class_indices[0])
-    coef = classifier.coef_[class_index]
-
-    row = text_vector.toarray()[0]
-    non_zero_indices = np.where(row > 0)[0]
-    if len(non_zero_indices) == 0:
-        return pd.DataFrame(
-            [{"prediction": str(prediction), "feature": "<none>", "contribution": 0.0}]
-        )
-
-    contributions = row[non_zero_indices] * coef[non_zero_indices]
-    ranked = np.argsort(contributions)[-top_n:][::-1]
-
-    feature_names = np.asarray(vectorizer.get_feature_names_out())
-    rows: list[dict[str, str | float]] = []
-
-    for idx in ranked:
-        feature_idx = int(non_zero_indices[idx])
-        rows.append(
+def top_features_by_class(model: Pipeline, top_n: int = 10) -> pd.DataFrame:
+    """Return top weighted features per class for linear classifiers.
+
+    Served from the table computed at model load or save when it is deep
+    enough; otherwise the table is computed once and cached for the model.
+    """
+    _, classifier = _extract_components(model)
+    cached = _TOP_FEATURES.get(model)
+    if cached is None or cached[0] is not classifier.coef_ or cached[1] < top_n:
+        depth = max(top_n, TOP_FEATURES_DEPTH)
+        cached = (classifier.coef_, depth, _top_feature_table(model, depth), {})
+        _TOP_FEATURES[model] = cached
+    _, _, table, slices = cached
+    if top_n not in slices:
+        slices[top_n] = table[table["rank"] <= top_n].reset_index(drop=True)
+    return slices[top_n].copy()
+
+
+def top_features_path(model_path: str | Path) -> Path:
+    """Return the sidecar file that stores a model artifact's top-feature table."""
+    return Path(model_path).with_suffix(".top_features.json")
+
+
+def _artifact_digest(model_path: Path) -> str:
+    """Return the SHA-256 of a model artifact file."""
+    return hashlib.sha256(model_path.read_bytes()).hexdigest()
+
+
+def save_top_features(model: Pipeline, model_path: str | Path, top_n: int = TOP_FEATURES_DEPTH) -> Path:
+    """Compute the top-feature table and write it next to a saved model artifact."""
+    model_path = Path(model_path)
+    table = precompute_top_features(model, top_n)
+    destination = top_features_path(model_path)
+    payload = {
+        "artifact_sha256": _artifact_digest(model_path),
+        "top_n": top_n,
+        "columns": {column: table[column].tolist() for column in table.columns},
+    }
+    destination.write_text(json.dumps(payload), encoding="utf-8")
+    return destination
+
+
+def load_top_features(model: Pipeline, model_path: str | Path, top_n: int = TOP_FEATURES_DEPTH) -> pd.DataFrame:
+    """Serve a loaded model's top features from its sidecar file.
+
+    A missing, unreadable, or stale sidecar (written for a different artifact)
+    is recomputed and rewritten when the directory is writable.
+    """
+    model_path = Path(model_path)
+    _, classifier = _extract_components(model)
+    destination = top_features_path(model_path)
+    try:
+        payload = json.loads(destination.read_text(encoding="utf-8"))
+        if payload["artifact_sha256"] == _artifact_digest(model_path) and payload["top_n"] >= top_n:
+            table = pd.DataFrame(payload["columns"], columns=["class_label", "rank", "feature", "weight"])
+            _TOP_FEATURES[model] = (classifier.coef_, payload["top_n"], table, {})
+            return table
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    try:
+        save_top_features(model, model_path, top_n)
+    except OSError:
+        # Read-only deployments still get the in-memory table.
+        pass
+    return _TOP_FEATURES[model][2]
+
+
+def explain_predictions_batch(model: Pipeline, texts: Sequence[str], top_n: int = 5) -> pd.DataFrame:
+    """Return the top contributing features for each text's predicted class.
+
+    The texts are vectorized once. Contributions are computed on the sparse
+    nonzeros against the predicted class's coefficients, and each row keeps
+    its ``top_n`` with a partial sort. Texts with no known features get a
+    single ``<none>`` row. Columns: ``text_index``, ``prediction``, ``rank``,
+    ``feature``, ``contribution``.
+    """
+    vectorizer, classifier = _extract_components(model)
+    matrix = vectorizer.transform(list(texts)).tocsr()
+    if [name for name, _ in model.steps] == ["tfidf", "classifier"]:
+        predictions = classifier.predict(matrix)
+    else:
+        predictions = model.predict(list(texts))
+
+    class_lookup = {label: index for index, label in enumerate(classifier.classes_)}
+    try:
+        class_indices = np.array([class_lookup[label] for label in predictions], dtype=np.intp)
+    except KeyError as exc:
+        raise ExplainabilityError("Predicted class not found in classifier classes.") from exc
+
+    coefficients = _class_coefficients(classifier)
+    row_counts = np.diff(matrix.indptr)
+    rows = np.repeat(np.arange(matrix.shape[0]), row_counts)
+    contributions = matrix.data * coefficients[class_indices[rows], matrix.indices]
+    feature_names = _feature_names(vectorizer)
+
+    text_index: list[int] = []
+    ranks: list[int] = []
+    positions: list[np.ndarray] = []
+    for row, (start, end) in enumerate(zip(matrix.indptr[:-1], matrix.indptr[1:])):
+        if start == end:
+            continue
+        values = contributions[start:end]
+        if end - start > top_n:
+            top = np.argpartition(values, -top_n)[-top_n:]
+            top = top[np.argsort(values[top])[::-1]]
+        else:
+            top = np.argsort(values)[::-1]
+        positions.append(top + start)
+        text_index.extend([row] * len(top))
+        ranks.extend(range(1, len(top) + 1))
+
+    selected = np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+    frame = pd.DataFrame(
+        {
+            "text_index": np.asarray(text_index, dtype=np.int64),
+            "prediction": np.asarray(predictions, dtype=object)[np.asarray(text_index, dtype=np.intp)].astype(str),
+            "rank": np.asarray(ranks, dtype=np.int64),
+            "feature": feature_names[matrix.indices[selected]].astype(str),
+            "contribution": contributions[selected].astype(float),
+        }
+    )
+
+    empty_rows = np.flatnonzero(row_counts == 0)
+    if len(empty_rows):
+        placeholders = pd.DataFrame(
             {
-                "prediction": str(prediction),
-                "feature": str(feature_names[feature_idx]),
-                "contribution": float(contributions[idx]),
+                "text_index": empty_rows.astype(np.int64),
+                "prediction": np.asarray(predictions, dtype=object)[empty_rows].astype(str),
+                "rank": 1,
+                "feature": "<none>",
+                "contribution": 0.0,
             }
         )
+        frame = pd.concat([frame, placeholders], ignore_index=True).sort_values(
+            ["text_index", "rank"], kind="stable", ignore_index=True
+        )
+    return frame
+
 
-    return pd.DataFrame(rows)
+def explain_text_prediction(model: Pipeline, text: str, top_n: int = 5) -> pd.DataFrame:
+    """Return top contributing features for a single predicted class."""
+    explanation = explain_predictions_batch(model, [text], top_n=top_n)
+    return explanation[["prediction", "feature", "contribution"]].reset_index(drop=True)
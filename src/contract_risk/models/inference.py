@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
 
+import numpy as np
+
 from contract_risk.config import ProjectConfig
 from contract_risk.data.loader import load_training_dataframe
+from contract_risk.metrics import instrumented, record_cache_lookup
 from contract_risk.models.pipeline import load_model, save_model, train_logreg_model
 
 
@@ -16,7 +20,9 @@ def load_or_train_model(model_path: str | Path | None = None) -> object:
     resolved_model_path = Path(model_path) if model_path else config.model_path
 
     if resolved_model_path.exists():
+        record_cache_lookup("model_artifact", hit=True)
         return load_model(resolved_model_path)
+    record_cache_lookup("model_artifact", hit=False)
 
     csv_path = config.default_train_csv if config.default_train_csv.exists() else config.fallback_train_csv
     dataset = load_training_dataframe(csv_path)
@@ -29,6 +35,7 @@ def load_or_train_model(model_path: str | Path | None = None) -> object:
     return model
 
 
+@instrumented("predict_clauses", items=len)
 def predict_clauses(model: object, clauses: Sequence[str], batch_size: int = 256) -> list[str]:
     """Predict clause types in batches to support long documents."""
     predictions: list[str] = []
@@ -37,3 +44,46 @@ def predict_clauses(model: object, clauses: Sequence[str], batch_size: int = 256
         batch_preds = model.predict(batch)
         predictions.extend(str(item) for item in batch_preds)
     return predictions
+
+
+@dataclass(frozen=True)
+class ClauseScore:
+    """Predicted clause type with its class probability and top-2 margin."""
+
+    label: str
+    probability: float | None
+    margin: float | None
+
+
+def predict_clauses_with_scores(
+    model: object,
+    clauses: Sequence[str],
+    batch_size: int = 256,
+) -> list[ClauseScore]:
+    """Predict clause types with confidence scores in one pass per batch.
+
+    Labels are taken from the argmax of ``predict_proba`` so they agree with the
+    reported probability. Models without ``predict_proba`` fall back to hard
+    labels with ``None`` scores, which downstream code treats as not confident.
+    """
+    if not hasattr(model, "predict_proba"):
+        labels = predict_clauses(model, clauses, batch_size=batch_size)
+        return [ClauseScore(label=label, probability=None, margin=None) for label in labels]
+
+    classes = np.asarray(model.classes_)
+    scores: list[ClauseScore] = []
+    for start in range(0, len(clauses), batch_size):
+        batch = list(clauses[start : start + batch_size])
+        probabilities = np.asarray(model.predict_proba(batch))
+        if probabilities.shape[1] > 1:
+            top_two = np.partition(probabilities, -2, axis=1)[:, -2:]
+            margins = top_two[:, 1] - top_two[:, 0]
+        else:
+            margins = probabilities[:, 0]
+        best = probabilities.argmax(axis=1)
+        best_probabilities = probabilities[np.arange(len(batch)), best]
+        scores.extend(
+            ClauseScore(label=str(classes[index]), probability=float(probability), margin=float(margin))
+            for index, probability, margin in zip(best, best_probabilities, margins)
+        )
+    return scores
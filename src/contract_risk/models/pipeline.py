@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import joblib
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
 
 DEFAULT_MODEL_PATH = Path("models/model.joblib")
 
 
 def build_logreg_pipeline() -> Pipeline:
     """Build the baseline TF-IDF + Logistic Regression pipeline."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+
     return Pipeline(
         steps=[
             (
@@ -46,13 +48,33 @@ def train_logreg_model(texts: list[str], labels: list[str]) -> Pipeline:
 
 
 def save_model(model: Any, path: str | Path = DEFAULT_MODEL_PATH) -> Path:
-    """Persist model to disk in joblib format."""
+    """Persist model to disk in joblib format.
+
+    Linear models also get their per-class top-feature table written alongside.
+    """
+    import joblib
+
+    from contract_risk.models.explainability import ExplainabilityError, save_top_features
+
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
     joblib.dump(model, destination)
+    try:
+        save_top_features(model, destination)
+    except ExplainabilityError:
+        pass
     return destination
 
 
 def load_model(path: str | Path = DEFAULT_MODEL_PATH) -> Any:
-    """Load a previously trained model."""
-    return joblib.load(path)
+    """Load a previously trained model and its cached top-feature table."""
+    import joblib
+
+    from contract_risk.models.explainability import ExplainabilityError, load_top_features
+
+    model = joblib.load(path)
+    try:
+        load_top_features(model, path)
+    except ExplainabilityError:
+        pass
+    return model
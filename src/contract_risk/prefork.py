@@ -0,0 +1,225 @@
+"""Pre-fork batch analysis that shares the model and KB copy-on-write."""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from contract_risk.assistant.corpus import LegalGuidanceRecord, load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import LegalKnowledgeBase, build_knowledge_base
+from contract_risk.data.ingestion import extract_text_from_path
+from contract_risk.models.cascade import CascadeStats
+from contract_risk.models.inference import load_or_train_model
+from contract_risk.ui_support import analyze_contract_text
+
+SMAPS_FIELDS = {
+    "Rss": "rss_kb",
+    "Pss": "pss_kb",
+    "Shared_Clean": "shared_kb",
+    "Shared_Dirty": "shared_kb",
+    "Private_Clean": "private_kb",
+    "Private_Dirty": "private_kb",
+}
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Process memory split into shared and private pages, in kilobytes."""
+
+    rss_kb: int
+    pss_kb: int
+    shared_kb: int
+    private_kb: int
+
+
+@dataclass(frozen=True)
+class ResidentResources:
+    """Read-only analysis resources loaded once in the parent process."""
+
+    model: object
+    knowledge_base: LegalKnowledgeBase
+    corpus: tuple[LegalGuidanceRecord, ...]
+
+
+_RESOURCES: ResidentResources | None = None
+
+
+def read_memory_usage(pid: int | str = "self") -> MemoryUsage | None:
+    """Read RSS/PSS from ``/proc/<pid>/smaps_rollup``; None where unsupported."""
+    try:
+        lines = Path(f"/proc/{pid}/smaps_rollup").read_text(encoding="ascii").splitlines()
+    except OSError:
+        return None
+
+    totals = {"rss_kb": 0, "pss_kb": 0, "shared_kb": 0, "private_kb": 0}
+    for line in lines:
+        name, _, value = line.partition(":")
+        field_name = SMAPS_FIELDS.get(name.strip())
+        if field_name is not None:
+            totals[field_name] += int(value.split()[0])
+    return MemoryUsage(**totals)
+
+
+def load_resident_resources(model_path: str | Path | None = None) -> ResidentResources:
+    """Load the model, guidance corpus, and knowledge base once."""
+    corpus = tuple(load_legal_guidance_corpus())
+    return ResidentResources(
+        model=load_or_train_model(model_path),
+        knowledge_base=build_knowledge_base(list(corpus)),
+        corpus=corpus,
+    )
+
+
+def freeze_resources(resources: ResidentResources) -> ResidentResources:
+    """Install resources for forked workers and move them out of GC tracking.
+
+    ``gc.freeze`` parks every live object in the permanent generation, so the
+    collector in the workers never writes to those pages and they stay shared.
+    """
+    global _RESOURCES
+    _RESOURCES = resources
+    gc.collect()
+    gc.freeze()
+    return resources
+
+
+def report_filenames(paths: Sequence[str | Path]) -> list[str]:
+    """Return one distinct report file name per input path.
+
+    Each report is named after its input's stem. When several inputs share a
+    stem, for example ``a/msa.pdf`` and ``b/msa.txt``, each of them gets its
+    1-based input position appended instead, so no report overwrites another.
+    """
+    stems = [Path(path).stem for path in paths]
+    shared = {stem.casefold() for stem, count in Counter(stem.casefold() for stem in stems).items() if count > 1}
+    taken = {stem.casefold() for stem in stems if stem.casefold() not in shared}
+    names = []
+    for position, stem in enumerate(stems, start=1):
+        name = stem
+        if stem.casefold() in shared:
+            name = f"{stem}-{position}"
+            while name.casefold() in taken:
+                name = f"{name}-{position}"
+        taken.add(name.casefold())
+        names.append(f"{name}.json")
+    return names
+
+
+def _analyze_path(path: str, report_path: str, rule_cascade: bool = False) -> dict[str, Any]:
+    """Analyze one contract in a worker and stream its report JSON to ``report_path``."""
+    assert _RESOURCES is not None, "freeze_resources must run before workers start"
+    source = Path(path)
+    try:
+        text = extract_text_from_path(source)
+    except (OSError, ValueError) as exc:
+        return {"path": path, "pid": os.getpid(), "error": str(exc), "memory": None}
+
+    destination = Path(report_path)
+    with destination.open("w", encoding="utf-8") as handle:
+        analysis = analyze_contract_text(
+            text,
+            _RESOURCES.model,
+            contract_name=source.name,
+            knowledge_base=_RESOURCES.knowledge_base,
+            report_stream=handle,
+            rule_cascade=rule_cascade,
+        )
+        if analysis.report_error is not None or not handle.tell():
+            handle.seek(0)
+            handle.truncate()
+            handle.write("null")
+    usage = read_memory_usage()
+    return {
+        "path": path,
+        "pid": os.getpid(),
+        "report_path": str(destination),
+        "clause_count": len(analysis.clauses),
+        "errors": list(analysis.errors),
+        "cascade": analysis.cascade_stats,
+        "memory": asdict(usage) if usage else None,
+    }
+
+
+def summarize_cascade_stats(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Total the per-contract rule cascade counters of a batch."""
+    stats = CascadeStats()
+    for result in results:
+        counters = result.get("cascade")
+        if counters:
+            stats.rule_resolved += counters["rule_resolved"]
+            stats.model_resolved += counters["model_resolved"]
+            stats.rule_seconds += counters["rule_seconds"]
+            stats.model_seconds += counters["model_seconds"]
+    return stats.asdict()
+
+
+def build_memory_report(parent: MemoryUsage | None, results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Summarize per-worker RSS/PSS and the memory saved by page sharing."""
+    latest_by_pid: dict[int, dict[str, int]] = {}
+    for result in results:
+        if result.get("memory"):
+            latest_by_pid[result["pid"]] = result["memory"]
+
+    workers = [
+        {
+            "pid": pid,
+            **usage,
+            "shared_savings_kb": usage["rss_kb"] - usage["pss_kb"],
+        }
+        for pid, usage in sorted(latest_by_pid.items())
+    ]
+    return {
+        "parent": asdict(parent) if parent else None,
+        "workers": workers,
+        "total_rss_kb": sum(item["rss_kb"] for item in workers),
+        "total_pss_kb": sum(item["pss_kb"] for item in workers),
+        "total_shared_savings_kb": sum(item["shared_savings_kb"] for item in workers),
+    }
+
+
+def run_prefork_batch(
+    paths: Sequence[str | Path],
+    output_dir: str | Path,
+    *,
+    workers: int = 2,
+    resources: ResidentResources | None = None,
+    model_path: str | Path | None = None,
+    rule_cascade: bool = False,
+) -> dict[str, Any]:
+    """Analyze many contracts in forked workers that share parent memory.
+
+    Reports are named by ``report_filenames``. With ``rule_cascade``, clauses
+    decided by keyword rules skip the model and the summary totals the cascade
+    counters under ``cascade``. Falls back to in-process analysis on platforms
+    without ``fork``.
+    """
+    destination = Path(output_dir)
+    destination.mkdir(parents=True, exist_ok=True)
+    freeze_resources(resources or load_resident_resources(model_path))
+    parent_usage = read_memory_usage()
+
+    jobs = [
+        (str(path), str(destination / name), rule_cascade) for path, name in zip(paths, report_filenames(paths))
+    ]
+    try:
+        if "fork" in multiprocessing.get_all_start_methods() and workers > 1:
+            with multiprocessing.get_context("fork").Pool(processes=workers) as pool:
+                results = pool.starmap(_analyze_path, jobs, chunksize=1)
+        else:
+            results = [_analyze_path(*job) for job in jobs]
+    finally:
+        gc.unfreeze()
+
+    summary = {
+        "workers": workers,
+        "results": results,
+        "memory": build_memory_report(parent_usage, results),
+    }
+    if rule_cascade:
+        summary["cascade"] = summarize_cascade_stats(results)
+    return summary
@@ -0,0 +1,286 @@
+"""Opt-in, rate-limited sampling profiler for per-request flamegraphs."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Iterator, TypeVar
+
+from contract_risk.config import ProjectConfig
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 0.005
+DEFAULT_MIN_GAP_SECONDS = 60.0
+DEFAULT_TOP_N = 25
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    """Settings for the request profiler."""
+
+    enabled: bool = False
+    output_dir: Path = Path("reports") / "profiles"
+    interval_seconds: float = DEFAULT_INTERVAL_SECONDS
+    min_gap_seconds: float = DEFAULT_MIN_GAP_SECONDS
+    top_n: int = DEFAULT_TOP_N
+
+
+@dataclass(frozen=True)
+class ProfileArtifact:
+    """Files written for one profiled call."""
+
+    operation: str
+    collapsed_path: Path
+    summary_path: Path
+    sample_count: int
+    wall_seconds: float
+
+
+def _float_from_env(name: str, default: float) -> float:
+    """Read a float override from the environment."""
+    raw = os.getenv(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def profiler_config_from_env() -> ProfilerConfig:
+    """Build the profiler settings from ``DABB_PROFILE*`` environment variables."""
+    return ProfilerConfig(
+        enabled=os.getenv("DABB_PROFILE", "").strip().lower() in {"1", "true", "yes", "on"},
+        output_dir=ProjectConfig().reports_dir / "profiles",
+        interval_seconds=_float_from_env("DABB_PROFILE_INTERVAL_MS", DEFAULT_INTERVAL_SECONDS * 1000) / 1000,
+        min_gap_seconds=_float_from_env("DABB_PROFILE_MIN_GAP_SECONDS", DEFAULT_MIN_GAP_SECONDS),
+        top_n=int(_float_from_env("DABB_PROFILE_TOP_N", DEFAULT_TOP_N)),
+    )
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Return ``module:qualname`` for a frame, safe for collapsed-stack lines."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{module}:{name}".replace(";", ",").replace(" ", "_")
+
+
+class StackSampler:
+    """Sample one thread's Python stack from a background thread.
+
+    Stacks are recorded root-first and cut at ``root`` when it is on the stack,
+    so samples only cover the profiled call and not the caller's frames.
+    """
+
+    def __init__(self, thread_id: int, root: FrameType | None = None, interval: float = DEFAULT_INTERVAL_SECONDS) -> None:
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        """Begin sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Collect one stack per interval until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            labels: list[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                if frame is self.root:
+                    break
+                frame = frame.f_back
+            labels.reverse()
+            self.stacks[tuple(labels)] += 1
+
+
+def render_collapsed(stacks: Counter[tuple[str, ...]]) -> str:
+    """Render stacks in the collapsed format read by ``flamegraph.pl`` and speedscope."""
+    lines = [f"{';'.join(stack)} {count}" for stack, count in sorted(stacks.items())]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def summarize_hotspots(stacks: Counter[tuple[str, ...]], top_n: int = DEFAULT_TOP_N) -> list[dict[str, Any]]:
+    """Rank functions by self samples, with inclusive samples alongside."""
+    total = sum(stacks.values())
+    self_counts: Counter[str] = Counter()
+    inclusive_counts: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        if not stack:
+            continue
+        self_counts[stack[-1]] += count
+        for label in set(stack):
+            inclusive_counts[label] += count
+
+    return [
+        {
+            "function": label,
+            "self_samples": count,
+            "self_share": count / total if total else 0.0,
+            "total_samples": inclusive_counts[label],
+            "total_share": inclusive_counts[label] / total if total else 0.0,
+        }
+        for label, count in self_counts.most_common(top_n)
+    ]
+
+
+def _render_summary(operation: str, stacks: Counter[tuple[str, ...]], wall_seconds: float, config: ProfilerConfig) -> str:
+    """Render the top-N hotspot table as plain text."""
+    sample_count = sum(stacks.values())
+    rows = [
+        f"Profile: {operation}",
+        f"Wall time: {wall_seconds:.4f}s",
+        f"Samples: {sample_count} at {config.interval_seconds * 1000:g} ms intervals",
+        "",
+        f"Top {config.top_n} functions by self samples:",
+        f"{'self %':>7} {'total %':>8} {'self':>6}  function",
+    ]
+    for item in summarize_hotspots(stacks, config.top_n):
+        rows.append(
+            f"{item['self_share']:>7.1%} {item['total_share']:>8.1%} {item['self_samples']:>6}  {item['function']}"
+        )
+    return "\n".join(rows) + "\n"
+
+
+class RequestProfiler:
+    """Profile whole calls, at most one at a time and one per ``min_gap_seconds``.
+
+    The gap and the single-flight rule are what make it safe to leave enabled
+    in a service: most calls skip profiling after one lock-free check.
+    """
+
+    def __init__(self, config: ProfilerConfig) -> None:
+        self.config = config
+        self.recent: deque[ProfileArtifact] = deque(maxlen=20)
+        self._lock = threading.Lock()
+        self._busy = False
+        self._last_started: float | None = None
+        self._sequence = 0
+
+    def configure(self, **changes: Any) -> None:
+        """Replace settings and reset the rate limit."""
+        with self._lock:
+            self.config = replace(self.config, **changes)
+            self._last_started = None
+
+    def _acquire(self) -> int | None:
+        """Claim the profiling slot; returns a sequence number or None when rate limited."""
+        with self._lock:
+            now = time.monotonic()
+            if self._busy:
+                return None
+            if self._last_started is not None and now - self._last_started < self.config.min_gap_seconds:
+                return None
+            self._busy = True
+            self._last_started = now
+            self._sequence += 1
+            return self._sequence
+
+    def _release(self) -> None:
+        """Free the profiling slot."""
+        with self._lock:
+            self._busy = False
+
+    @contextmanager
+    def profile(self, operation: str, root: FrameType | None = None) -> Iterator[bool]:
+        """Sample the current thread for the duration of the block.
+
+        Yields True when this call is being profiled.
+        """
+        sequence = self._acquire() if self.config.enabled else None
+        if sequence is None:
+            yield False
+            return
+
+        config = self.config
+        sampler = StackSampler(threading.get_ident(), root, config.interval_seconds)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            yield True
+        finally:
+            sampler.stop()
+            wall_seconds = time.perf_counter() - started
+            try:
+                self._write(operation, sequence, sampler.stacks, wall_seconds, config)
+            except OSError as exc:
+                # A failed profile write must never fail the request being profiled.
+                LOGGER.warning("Could not write %s profile to %s: %s", operation, config.output_dir, exc)
+            finally:
+                self._release()
+
+    def _write(
+        self,
+        operation: str,
+        sequence: int,
+        stacks: Counter[tuple[str, ...]],
+        wall_seconds: float,
+        config: ProfilerConfig,
+    ) -> ProfileArtifact:
+        """Write the collapsed stacks and hotspot summary for one call."""
+        config.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        stem = f"{stamp}_{operation}_{os.getpid()}_{sequence}"
+        collapsed_path = config.output_dir / f"{stem}.collapsed"
+        summary_path = config.output_dir / f"{stem}.txt"
+        collapsed_path.write_text(render_collapsed(stacks), encoding="utf-8")
+        summary_path.write_text(_render_summary(operation, stacks, wall_seconds, config), encoding="utf-8")
+        artifact = ProfileArtifact(operation, collapsed_path, summary_path, sum(stacks.values()), wall_seconds)
+        self.recent.append(artifact)
+        return artifact
+
+
+PROFILER = RequestProfiler(profiler_config_from_env())
+_ACTIVE = threading.local()
+
+
+def enable_profiling(enabled: bool = True, **changes: Any) -> None:
+    """Switch request profiling on or off at runtime, optionally changing settings."""
+    PROFILER.configure(enabled=enabled, **changes)
+
+
+def profiled(operation: str) -> Callable[[FuncT], FuncT]:
+    """Profile calls to the decorated function when profiling is enabled.
+
+    Calls nested inside an already profiled call on the same thread are part
+    of the outer profile and are not profiled separately.
+    """
+
+    def decorator(func: FuncT) -> FuncT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not PROFILER.config.enabled or getattr(_ACTIVE, "depth", 0):
+                return func(*args, **kwargs)
+            _ACTIVE.depth = 1
+            try:
+                with PROFILER.profile(operation, root=sys._getframe()):
+                    return func(*args, **kwargs)
+            finally:
+                _ACTIVE.depth = 0
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,178 @@
+"""Clause alignment and risk deltas between revisions of the same contract."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DELTA_FIELDS = ("clause_id", "predicted_type", "severity", "risk_score", "clause_text")
+# Replaced clauses are paired as edits of one another when their word-level
+# similarity reaches this ratio; blocks larger than the limit pair by position.
+PAIRING_THRESHOLD = 0.5
+MAX_PAIRING_BLOCK = 64
+
+
+@lru_cache(maxsize=16384)
+def clause_fingerprint(text: str) -> str:
+    """Return a hash of a clause with whitespace and case normalized.
+
+    Results are memoized because each revision re-reads the previous one's clauses.
+    """
+    normalized = " ".join(text.casefold().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ClauseAlignment:
+    """How the clauses of a revision line up with the previous version.
+
+    Pairs are ``(previous_index, current_index)``. ``unchanged`` clauses hash
+    equal, ``changed`` clauses replace one another in place, and the rest were
+    ``added`` to the revision or ``removed`` from the previous version.
+    """
+
+    unchanged: tuple[tuple[int, int], ...] = ()
+    changed: tuple[tuple[int, int], ...] = ()
+    added: tuple[int, ...] = ()
+    removed: tuple[int, ...] = ()
+
+
+def _pair_replaced(
+    previous: Sequence[str],
+    current: Sequence[str],
+    previous_range: range,
+    current_range: range,
+) -> list[tuple[int, int]]:
+    """Pair clauses of a replaced run that are edits of one another, keeping their order."""
+    if len(previous_range) * len(current_range) > MAX_PAIRING_BLOCK**2:
+        return list(zip(previous_range, current_range))
+    previous_words = {index: previous[index].casefold().split() for index in previous_range}
+    pairs: list[tuple[int, int]] = []
+    start = previous_range.start
+    for current_index in current_range:
+        matcher = SequenceMatcher(None, b=current[current_index].casefold().split(), autojunk=False)
+        best, best_ratio = None, PAIRING_THRESHOLD
+        for previous_index in range(start, previous_range.stop):
+            matcher.set_seq1(previous_words[previous_index])
+            if matcher.quick_ratio() >= best_ratio and matcher.ratio() >= best_ratio:
+                best, best_ratio = previous_index, matcher.ratio()
+        if best is not None:
+            pairs.append((best, current_index))
+            start = best + 1
+    return pairs
+
+
+def align_clauses(previous: Sequence[str], current: Sequence[str]) -> ClauseAlignment:
+    """Align two clause lists by fingerprint.
+
+    Runs of equal fingerprints are matched with ``difflib.SequenceMatcher``, so
+    inserting or deleting a clause does not disturb the matches after it.
+    Within replaced runs, clauses similar enough to be edits of one another
+    are paired as changed; the rest are added or removed.
+    """
+    matcher = SequenceMatcher(
+        None,
+        [clause_fingerprint(text) for text in previous],
+        [clause_fingerprint(text) for text in current],
+        autojunk=False,
+    )
+    unchanged: list[tuple[int, int]] = []
+    changed: list[tuple[int, int]] = []
+    added: list[int] = []
+    removed: list[int] = []
+    for tag, prev_start, prev_end, cur_start, cur_end in matcher.get_opcodes():
+        if tag == "equal":
+            unchanged.extend(zip(range(prev_start, prev_end), range(cur_start, cur_end)))
+            continue
+        pairs = _pair_replaced(previous, current, range(prev_start, prev_end), range(cur_start, cur_end))
+        changed.extend(pairs)
+        paired_previous = {earlier for earlier, _ in pairs}
+        paired_current = {later for _, later in pairs}
+        removed.extend(index for index in range(prev_start, prev_end) if index not in paired_previous)
+        added.extend(index for index in range(cur_start, cur_end) if index not in paired_current)
+    return ClauseAlignment(tuple(unchanged), tuple(changed), tuple(added), tuple(removed))
+
+
+@dataclass(frozen=True)
+class RiskDelta:
+    """Findings that appeared, disappeared, or changed between two revisions.
+
+    ``changed`` entries hold the ``previous`` and ``current`` clause records.
+    Unchanged clauses reuse their prediction, so they are only counted.
+    """
+
+    added: tuple[dict[str, Any], ...]
+    removed: tuple[dict[str, Any], ...]
+    changed: tuple[dict[str, Any], ...]
+    unchanged_count: int
+    risk_score_change: int
+    severity_changes: dict[str, int]
+
+    def asdict(self) -> dict[str, Any]:
+        """Serialize the delta into JSON-friendly structures."""
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": list(self.changed),
+            "unchanged_count": self.unchanged_count,
+            "risk_score_change": self.risk_score_change,
+            "severity_changes": dict(self.severity_changes),
+        }
+
+
+def _clause_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Return the delta fields of each clause row as plain Python values."""
+    if frame.empty:
+        return []
+    columns = {name: frame[name].tolist() for name in DELTA_FIELDS}
+    return [
+        {
+            "clause_id": str(clause_id),
+            "predicted_type": str(predicted_type),
+            "severity": str(severity),
+            "risk_score": int(risk_score),
+            "clause_text": str(clause_text),
+        }
+        for clause_id, predicted_type, severity, risk_score, clause_text in zip(*(columns[name] for name in DELTA_FIELDS))
+    ]
+
+
+def compute_risk_delta(previous: pd.DataFrame, current: pd.DataFrame, alignment: ClauseAlignment) -> RiskDelta:
+    """Compare two clause tables through their alignment."""
+    previous_records = _clause_records(previous)
+    current_records = _clause_records(current)
+
+    # Unchanged text keeps its prediction, but a replaced risk table can still move its risk.
+    rescored = [
+        (prev_index, cur_index)
+        for prev_index, cur_index in alignment.unchanged
+        if previous_records[prev_index]["risk_score"] != current_records[cur_index]["risk_score"]
+        or previous_records[prev_index]["severity"] != current_records[cur_index]["severity"]
+    ]
+    # Order by position in the current revision; clause ids sort as strings ("C1000" < "C999").
+    changed = [
+        {"previous": previous_records[prev_index], "current": current_records[cur_index]}
+        for prev_index, cur_index in sorted([*alignment.changed, *rescored], key=lambda pair: pair[1])
+    ]
+
+    severity_changes: dict[str, int] = {}
+    for record in previous_records:
+        severity_changes[record["severity"]] = severity_changes.get(record["severity"], 0) - 1
+    for record in current_records:
+        severity_changes[record["severity"]] = severity_changes.get(record["severity"], 0) + 1
+
+    return RiskDelta(
+        added=tuple(current_records[index] for index in alignment.added),
+        removed=tuple(previous_records[index] for index in alignment.removed),
+        changed=tuple(changed),
+        unchanged_count=len(alignment.unchanged) - len(rescored),
+        risk_score_change=sum(record["risk_score"] for record in current_records)
+        - sum(record["risk_score"] for record in previous_records),
+        severity_changes={severity: count for severity, count in sorted(severity_changes.items()) if count},
+    )
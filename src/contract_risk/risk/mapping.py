@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+RISK_TABLE_ENV = "DABB_RISK_TABLE"
+
+# Severity labels the report, badges, and trend summaries know how to rank.
+SEVERITY_LEVELS: tuple[str, ...] = ("High", "Medium", "Low")
 
 
 @dataclass(frozen=True)
@@ -27,15 +41,135 @@ RISK_MAPPING: dict[str, RiskProfile] = {
 DEFAULT_RISK = RiskProfile("Medium", 50)
 
 
+@lru_cache(maxsize=4096)
 def normalize_label(label: str) -> str:
-    """Normalize model labels for stable risk lookup."""
+    """Normalize model labels for stable risk lookup.
+
+    Results are memoized because models emit the same few labels repeatedly.
+    """
     return " ".join(label.lower().strip().split())
 
 
+@dataclass(frozen=True)
+class RiskTable:
+    """Immutable lookup from normalized clause type to risk profile."""
+
+    profiles: Mapping[str, RiskProfile] = field(default_factory=lambda: MappingProxyType({}))
+    default: RiskProfile = DEFAULT_RISK
+
+    def lookup(self, clause_type: str) -> RiskProfile:
+        """Return the risk profile for a raw clause type label."""
+        return self.profiles.get(normalize_label(clause_type), self.default)
+
+
+class RiskArrays(NamedTuple):
+    """Severity labels and risk scores aligned with a batch of clause types."""
+
+    severity: np.ndarray
+    score: np.ndarray
+
+
+def _parse_profile(value: RiskProfile | Mapping[str, Any], label: str) -> RiskProfile:
+    """Validate one risk table entry and title-case its severity."""
+    if isinstance(value, RiskProfile):
+        severity, score = value.severity, value.score
+    else:
+        try:
+            severity = str(value["severity"])
+            score = int(value["score"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Risk table entry {label!r} needs a 'severity' and an integer 'score'.") from exc
+    normalized = severity.strip().title()
+    if normalized not in SEVERITY_LEVELS:
+        raise ValueError(
+            f"Risk table entry {label!r} has severity {severity!r}; expected one of {', '.join(SEVERITY_LEVELS)}."
+        )
+    if isinstance(value, RiskProfile) and normalized == severity:
+        return value
+    return RiskProfile(normalized, score)
+
+
+def compile_risk_table(
+    mapping: Mapping[str, RiskProfile | Mapping[str, Any]],
+    default: RiskProfile | Mapping[str, Any] = DEFAULT_RISK,
+) -> RiskTable:
+    """Normalize labels and freeze a risk table into an immutable lookup."""
+    profiles = {normalize_label(label): _parse_profile(value, label) for label, value in mapping.items()}
+    return RiskTable(MappingProxyType(profiles), _parse_profile(default, "default"))
+
+
+def load_risk_table(path: str | Path, *, extend_defaults: bool = True) -> RiskTable:
+    """Load a JSON risk table file and compile it.
+
+    The file holds ``{"clause_types": {"<label>": {"severity": ..., "score": ...}},
+    "default": {...}}``. Entries override the built-in ``RISK_MAPPING``; with
+    ``extend_defaults=False`` only the file's clause types are known.
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or not isinstance(payload.get("clause_types", {}), dict):
+        raise ValueError(f"Risk table {path} must be a JSON object with a 'clause_types' object.")
+    mapping: dict[str, RiskProfile | Mapping[str, Any]] = dict(RISK_MAPPING) if extend_defaults else {}
+    mapping.update({normalize_label(label): value for label, value in payload.get("clause_types", {}).items()})
+    return compile_risk_table(mapping, payload.get("default", DEFAULT_RISK))
+
+
+def risk_table_from_env() -> RiskTable:
+    """Compile the table named by ``DABB_RISK_TABLE``, or the built-in mapping."""
+    override = os.getenv(RISK_TABLE_ENV, "").strip()
+    if override:
+        return load_risk_table(Path(override).expanduser())
+    return compile_risk_table(RISK_MAPPING)
+
+
+_ACTIVE_TABLE = risk_table_from_env()
+
+
+def get_risk_table() -> RiskTable:
+    """Return the risk table used by the mapping helpers."""
+    return _ACTIVE_TABLE
+
+
+def set_risk_table(table: RiskTable) -> RiskTable:
+    """Replace the active risk table and return the previous one."""
+    global _ACTIVE_TABLE
+    previous, _ACTIVE_TABLE = _ACTIVE_TABLE, table
+    return previous
+
+
 def map_clause_type_to_risk(clause_type: str) -> RiskProfile:
     """Return the risk profile associated with a clause type."""
-    normalized = normalize_label(clause_type)
-    return RISK_MAPPING.get(normalized, DEFAULT_RISK)
+    return _ACTIVE_TABLE.lookup(clause_type)
+
+
+def map_clause_types_to_risk(labels: Iterable[Any], table: RiskTable | None = None) -> RiskArrays:
+    """Map a batch of clause types to aligned severity and score arrays.
+
+    Each distinct label is looked up once and the results are broadcast
+    through integer codes. Categorical Series and ``pd.Categorical`` inputs
+    reuse their existing codes.
+    """
+    import numpy as np
+
+    table = table or _ACTIVE_TABLE
+    values = getattr(labels, "array", labels)  # unwrap a pandas Series
+    if hasattr(values, "categories") and hasattr(values, "codes"):
+        uniques = [str(label) for label in values.categories]
+        codes = np.asarray(values.codes, dtype=np.intp)
+    else:
+        index: dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(str(label), len(index)) for label in values),
+            dtype=np.intp,
+        )
+        uniques = list(index)
+
+    profiles = [table.lookup(label) for label in uniques]
+    if (codes < 0).any():  # missing values in a categorical map to the default
+        profiles.append(table.default)
+        codes = np.where(codes < 0, len(profiles) - 1, codes)
+    severities = np.array([profile.severity for profile in profiles], dtype=object)
+    scores = np.array([profile.score for profile in profiles], dtype=np.int64)
+    return RiskArrays(severities[codes], scores[codes])
 
 
 def risk_badge_color(severity: str) -> str:
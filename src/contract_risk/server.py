@@ -0,0 +1,400 @@
+"""Local asyncio HTTP service with micro-batched inference and retrieval."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from contract_risk.assistant.retrieval import LegalKnowledgeBase, RetrievalHit
+from contract_risk.assistant.workflow import QueueFullError
+from contract_risk.metrics import REGISTRY, enable_metrics
+from contract_risk.models.cascade import RuleCascadeClassifier
+from contract_risk.models.inference import predict_clauses
+from contract_risk.risk.mapping import map_clause_types_to_risk
+from contract_risk.ui_support import analyze_contract_text
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+MAX_BODY_BYTES = 2_000_000
+
+
+class RequestError(ValueError):
+    """Raised when an HTTP request is malformed."""
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Tuning knobs for the local analysis service."""
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    max_batch_size: int = 256
+    max_wait_ms: float = 5.0
+    max_queue_size: int = 128
+    worker_threads: int = 4
+    metrics_enabled: bool = True
+    rule_cascade: bool = False
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """Coalesce concurrent submissions into batched handler calls.
+
+    Each submission is a list of items (for example the clauses of one request).
+    Submissions are queued in a bounded queue and flushed together once the batch
+    reaches ``max_batch_size`` items or the oldest entry waited ``max_wait_ms``.
+    The handler runs in an executor so the event loop keeps accepting requests.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[ItemT]], Sequence[ResultT]],
+        *,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self._handler = handler
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: asyncio.Queue[tuple[list[ItemT], asyncio.Future[list[ResultT]]]] = asyncio.Queue(
+            maxsize=max(1, max_queue_size)
+        )
+        self._executor = executor
+        self._task: asyncio.Task[None] | None = None
+        self.batches_run = 0
+        self.items_processed = 0
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the flush loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, items: Sequence[ItemT]) -> list[ResultT]:
+        """Queue items for the next batch and wait for their results."""
+        if not items:
+            return []
+        future: asyncio.Future[list[ResultT]] = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((list(items), future))
+        except asyncio.QueueFull as exc:
+            raise QueueFullError("The batching queue is full; retry later.") from exc
+        return await future
+
+    async def _collect(self) -> list[tuple[list[ItemT], asyncio.Future[list[ResultT]]]]:
+        """Wait for one entry, then gather more until the batch is full or the wait expires."""
+        entries = [await self._queue.get()]
+        size = len(entries[0][0])
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+        while size < self._max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            entries.append(entry)
+            size += len(entry[0])
+        return entries
+
+    async def _run(self) -> None:
+        """Flush batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            entries = await self._collect()
+            flat = [item for items, _ in entries for item in items]
+            try:
+                results = await loop.run_in_executor(self._executor, self._handler, flat)
+            except Exception as exc:  # pragma: no cover - forwarded to every waiting request
+                for _, future in entries:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            self.batches_run += 1
+            self.items_processed += len(flat)
+            offset = 0
+            for items, future in entries:
+                if not future.done():
+                    future.set_result(list(results[offset : offset + len(items)]))
+                offset += len(items)
+
+
+class _BatchedModel:
+    """Model facade that routes ``predict`` calls from worker threads into a batcher."""
+
+    def __init__(self, batcher: MicroBatcher[str, str], loop: asyncio.AbstractEventLoop) -> None:
+        self._batcher = batcher
+        self._loop = loop
+
+    def predict(self, batch: Sequence[str]) -> list[str]:
+        """Block the calling worker thread until the batched prediction returns."""
+        return asyncio.run_coroutine_threadsafe(self._batcher.submit(list(batch)), self._loop).result()
+
+
+class _BatchedKnowledgeBase:
+    """Knowledge-base facade that coalesces searches from concurrent reports."""
+
+    def __init__(
+        self,
+        knowledge_base: LegalKnowledgeBase,
+        batcher: MicroBatcher[tuple[str, int], list[RetrievalHit]],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._knowledge_base = knowledge_base
+        self._batcher = batcher
+        self._loop = loop
+
+    @property
+    def records(self) -> list[Any]:
+        """Expose the resident guidance records."""
+        return self._knowledge_base.records
+
+    def search(self, query: str, top_k: int = 5) -> list[RetrievalHit]:
+        """Search one query through the shared batch."""
+        return self.search_many([query], top_k=top_k)[0]
+
+    def search_many(self, queries: Sequence[str], top_k: int = 5) -> list[list[RetrievalHit]]:
+        """Search several queries through the shared batch."""
+        items = [(query, top_k) for query in queries]
+        return asyncio.run_coroutine_threadsafe(self._batcher.submit(items), self._loop).result()
+
+
+def _search_batch(knowledge_base: LegalKnowledgeBase, items: list[tuple[str, int]]) -> list[list[RetrievalHit]]:
+    """Run one similarity pass for mixed ``top_k`` queries and trim per item."""
+    widest = max(top_k for _, top_k in items)
+    hits = knowledge_base.search_many([query for query, _ in items], top_k=widest)
+    return [item_hits[:top_k] for item_hits, (_, top_k) in zip(hits, items)]
+
+
+class AnalysisServer:
+    """Keep the model and knowledge base resident and serve JSON over HTTP."""
+
+    def __init__(self, model: object, knowledge_base: LegalKnowledgeBase, config: ServerConfig | None = None) -> None:
+        self.model = model
+        self.knowledge_base = knowledge_base
+        self.config = config or ServerConfig()
+        # With the rule cascade, batches only send ambiguous clauses to the model.
+        self.cascade = RuleCascadeClassifier(model) if self.config.rule_cascade else None
+        self._executor = ThreadPoolExecutor(max_workers=self.config.worker_threads)
+        # Analysis threads block on batch results, so batch handlers need their own threads.
+        self._batch_executor = ThreadPoolExecutor(max_workers=2)
+        self._pending = 0
+        self._server: asyncio.base_events.Server | None = None
+        self._prediction_batcher: MicroBatcher[str, str] | None = None
+        self._retrieval_batcher: MicroBatcher[tuple[str, int], list[RetrievalHit]] | None = None
+
+    async def start(self) -> asyncio.base_events.Server:
+        """Start the batchers and bind the listening socket."""
+        if self.config.metrics_enabled:
+            enable_metrics()
+        batch_options = {
+            "max_batch_size": self.config.max_batch_size,
+            "max_wait_ms": self.config.max_wait_ms,
+            "max_queue_size": self.config.max_queue_size,
+            "executor": self._batch_executor,
+        }
+        self._prediction_batcher = MicroBatcher(
+            lambda clauses: predict_clauses(
+                self.cascade or self.model, clauses, batch_size=self.config.max_batch_size
+            ),
+            **batch_options,
+        )
+        self._retrieval_batcher = MicroBatcher(
+            lambda items: _search_batch(self.knowledge_base, items),
+            **batch_options,
+        )
+        self._prediction_batcher.start()
+        self._retrieval_batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.config.host, self.config.port)
+        return self._server
+
+    async def stop(self) -> None:
+        """Close the socket, stop the batchers, and release worker threads."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for batcher in (self._prediction_batcher, self._retrieval_batcher):
+            if batcher is not None:
+                await batcher.stop()
+        self._executor.shutdown(wait=False)
+        self._batch_executor.shutdown(wait=False)
+
+    @property
+    def port(self) -> int:
+        """Return the bound port, which differs from the config when it was 0."""
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def predict(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Predict clause types and risk for a list of clause strings."""
+        clauses = payload.get("clauses")
+        if not isinstance(clauses, list) or not all(isinstance(item, str) for item in clauses):
+            raise RequestError("'clauses' must be a list of strings.")
+
+        assert self._prediction_batcher is not None
+        labels = await self._prediction_batcher.submit(clauses)
+        risk = map_clause_types_to_risk(labels)
+        predictions = [
+            {
+                "clause_text": clause_text,
+                "predicted_type": label,
+                "severity": severity,
+                "risk_score": score,
+            }
+            for clause_text, label, severity, score in zip(clauses, labels, risk.severity.tolist(), risk.score.tolist())
+        ]
+        return {"predictions": predictions}
+
+    async def analyze(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run the full contract analysis with batched prediction and retrieval."""
+        text = payload.get("text")
+        if not isinstance(text, str):
+            raise RequestError("'text' must be a string.")
+        contract_name = str(payload.get("contract_name") or "Uploaded Contract")
+        generate_report = bool(payload.get("generate_report", True))
+
+        assert self._prediction_batcher is not None and self._retrieval_batcher is not None
+        loop = asyncio.get_running_loop()
+        model = _BatchedModel(self._prediction_batcher, loop)
+        knowledge_base = _BatchedKnowledgeBase(self.knowledge_base, self._retrieval_batcher, loop)
+        analysis = await loop.run_in_executor(
+            self._executor,
+            lambda: analyze_contract_text(
+                text,
+                model,
+                contract_name=contract_name,
+                knowledge_base=knowledge_base,
+                generate_report=generate_report,
+            ),
+        )
+        return {
+            "contract_name": analysis.contract_name,
+            "clauses": analysis.clause_frame.to_dict(orient="records"),
+            "report": analysis.report,
+            "warnings": list(analysis.warnings),
+            "errors": list(analysis.errors),
+            "report_error": analysis.report_error,
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict[str, Any] | str]:
+        """Route one request and map failures to HTTP status codes.
+
+        JSON endpoints return a dict; ``/metrics`` returns Prometheus text.
+        """
+        if method == "GET" and path == "/health":
+            health: dict[str, Any] = {"status": "ok", "pending": self._pending}
+            if self.cascade is not None:
+                health["cascade"] = self.cascade.stats.asdict()
+            return HTTPStatus.OK, health
+        if method == "GET" and path == "/metrics":
+            return HTTPStatus.OK, REGISTRY.render()
+
+        routes = {"/predict": self.predict, "/analyze": self.analyze}
+        handler = routes.get(path)
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST with a JSON body."}
+        if self._pending >= self.config.max_queue_size:
+            return HTTPStatus.TOO_MANY_REQUESTS, {"error": "Server is busy; retry later."}
+
+        self._pending += 1
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise RequestError("Request body must be a JSON object.")
+            return HTTPStatus.OK, await handler(payload)
+        except QueueFullError as exc:
+            return HTTPStatus.TOO_MANY_REQUESTS, {"error": str(exc)}
+        except (RequestError, json.JSONDecodeError) as exc:
+            return HTTPStatus.BAD_REQUEST, {"error": str(exc)}
+        except UnicodeDecodeError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Request body must be UTF-8 encoded JSON."}
+        finally:
+            self._pending -= 1
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one HTTP/1.1 request per connection."""
+        try:
+            method, path, body = await _read_request(reader)
+            status, response = await self.dispatch(method, path, body)
+        except RequestError as exc:
+            status, response = HTTPStatus.BAD_REQUEST, {"error": str(exc)}
+        except Exception as exc:  # pragma: no cover - defensive guard for runtime failures
+            status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+
+        if isinstance(response, str):
+            payload = response.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            payload = json.dumps(response).encode("utf-8")
+            content_type = "application/json"
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode("ascii")
+            + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    """Parse the request line, headers, and body of a minimal HTTP request."""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    parts = request_line.split()
+    if len(parts) < 2:
+        raise RequestError("Malformed request line.")
+
+    content_length = 0
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                content_length = int(value.strip())
+            except ValueError as exc:
+                raise RequestError("Invalid Content-Length header.") from exc
+
+    if content_length > MAX_BODY_BYTES:
+        raise RequestError("Request body is too large.")
+    try:
+        body = await reader.readexactly(content_length) if content_length else b""
+    except asyncio.IncompleteReadError as exc:
+        raise RequestError("Request body is shorter than Content-Length.") from exc
+    return parts[0].upper(), parts[1].split("?", 1)[0], body
+
+
+async def serve(model: object, knowledge_base: LegalKnowledgeBase, config: ServerConfig | None = None) -> None:
+    """Run the analysis service until cancelled."""
+    server = AnalysisServer(model, knowledge_base, config)
+    await server.start()
+    print(f"Serving contract analysis on http://{server.config.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
@@ -2,23 +2,114 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Sequence
+from typing import TYPE_CHECKING, Any, Sequence, TextIO
+from uuid import uuid4
 
-import pandas as pd
-
-from contract_risk.assistant.service import generate_legal_assistance_report
+from contract_risk.assistant.guardrails import MIN_EVIDENCE_SCORE
+from contract_risk.assistant.reporting import expand_report, finding_evidence_items
+from contract_risk.assistant.service import generate_legal_assistance_report, stream_legal_assistance_report
+from contract_risk.assistant.state import EvidenceItem, WorkflowStage
+from contract_risk.assistant.workflow import (
+    ProgressCallback,
+    QueueFullError,
+    WorkflowCancelled,
+    notify_progress,
+    start_stage_clock,
+    stop_stage_clock,
+)
 from contract_risk.features.segmentation import segment_clauses
-from contract_risk.models.inference import predict_clauses
-from contract_risk.risk.mapping import map_clause_type_to_risk
+from contract_risk.models.cascade import RuleCascadeClassifier
+from contract_risk.models.inference import predict_clauses, predict_clauses_with_scores
+from contract_risk.profiling import profiled
+from contract_risk.revisions import ClauseAlignment, RiskDelta, align_clauses, compute_risk_delta
+from contract_risk.risk.mapping import map_clause_types_to_risk
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from contract_risk.assistant.near_duplicates import NearDuplicateIndex
 
 MAX_INPUT_CHARS = 500_000
 MAX_CLAUSES = 1500
 
+# Tokens for live model and knowledge base objects. Unlike ``id()``, a token is
+# never handed to a later object, so a retrained model never matches the old one.
+_OBJECT_TOKENS: dict[int, str] = {}
+_OBJECT_TOKENS_LOCK = threading.Lock()
+
+
+def _object_token(obj: object) -> str | None:
+    """Return a token unique to ``obj`` for its lifetime, or None if it cannot be tracked."""
+    key = id(obj)
+    with _OBJECT_TOKENS_LOCK:
+        token = _OBJECT_TOKENS.get(key)
+        if token is None:
+            try:
+                weakref.finalize(obj, _OBJECT_TOKENS.pop, key, None)
+            except TypeError:
+                return None
+            token = _OBJECT_TOKENS[key] = uuid4().hex
+        return token
+
+
+@dataclass(frozen=True)
+class AnalysisSettings:
+    """The model, knowledge base, and retrieval options behind an analysis.
+
+    Revisions reuse an earlier analysis's predictions only when the model and
+    the use of the rule cascade match, and its evidence only when every
+    setting matches. ``None`` tokens never match, so untracked objects are
+    always re-analyzed.
+    """
+
+    model: str | None
+    knowledge_base: str | None
+    top_k: int
+    min_evidence_score: float
+    rule_cascade: bool = False
+
+    @classmethod
+    def capture(
+        cls,
+        model: object,
+        knowledge_base: object | None,
+        top_k: int,
+        min_evidence_score: float,
+        rule_cascade: bool = False,
+    ) -> AnalysisSettings:
+        """Identify the given objects and options; no knowledge base means the bundled default."""
+        kb_token = "default" if knowledge_base is None else _object_token(knowledge_base)
+        index_version = getattr(knowledge_base, "_index_version", None)
+        if kb_token is not None and index_version is not None:
+            kb_token = f"{kb_token}:{index_version()}"
+        return cls(_object_token(model), kb_token, top_k, min_evidence_score, rule_cascade)
+
+    def reuses_predictions_from(self, other: AnalysisSettings | None) -> bool:
+        """Return True when ``other`` used the same model, with or without the rule cascade alike."""
+        return (
+            other is not None
+            and self.model is not None
+            and self.model == other.model
+            and self.rule_cascade == other.rule_cascade
+        )
+
+    def reuses_evidence_from(self, other: AnalysisSettings | None) -> bool:
+        """Return True when ``other`` used the same model, knowledge base, and retrieval options."""
+        return self.reuses_predictions_from(other) and self.knowledge_base is not None and self == other
+
 
 @dataclass(frozen=True)
 class ContractAnalysisResult:
-    """Container for one analyzed contract and any non-fatal warnings."""
+    """Container for one analyzed contract and any non-fatal warnings.
+
+    ``revision`` is set when the contract was analyzed against a previous
+    version and records how its clauses aligned. ``settings`` records the
+    model, knowledge base, and retrieval options the analysis used.
+    ``cascade_stats`` holds the rule cascade counters when one was used.
+    """
 
     contract_name: str
     raw_text: str
@@ -28,23 +119,51 @@ class ContractAnalysisResult:
     warnings: tuple[str, ...] = field(default_factory=tuple)
     errors: tuple[str, ...] = field(default_factory=tuple)
     report_error: str | None = None
+    revision: ClauseAlignment | None = None
+    settings: AnalysisSettings | None = None
+    cascade_stats: dict[str, Any] | None = None
 
 
-def build_clause_frame(clauses: Sequence[str], predicted_types: Sequence[str]) -> pd.DataFrame:
-    """Build the clause table used by the UI and the assistant report."""
-    rows: list[dict[str, str | int]] = []
-    for i, (clause_text, clause_type) in enumerate(zip(clauses, predicted_types), start=1):
-        risk = map_clause_type_to_risk(str(clause_type))
-        rows.append(
-            {
-                "clause_id": f"C{i:03d}",
-                "clause_text": clause_text,
-                "predicted_type": str(clause_type),
-                "severity": risk.severity,
-                "risk_score": risk.score,
-            }
-        )
-    return pd.DataFrame(rows)
+@dataclass(frozen=True)
+class ContractRevision:
+    """An analyzed contract revision and its risk delta against the previous version."""
+
+    result: ContractAnalysisResult
+    delta: RiskDelta
+
+
+def build_clause_frame(
+    clauses: Sequence[str],
+    predicted_types: Sequence[str],
+    confidences: Sequence[float | None] | None = None,
+    reused_from: Sequence[str | None] | None = None,
+) -> pd.DataFrame:
+    """Build the clause table used by the UI and the assistant report.
+
+    The frame is assembled from column arrays. Risk is mapped once per distinct
+    label through the categorical codes, and ``predicted_type`` and
+    ``severity`` use categorical dtypes. A ``confidence`` column is added only
+    when prediction confidences are supplied, and a ``reused_from`` column only
+    when some predictions were reused from another contract.
+    """
+    import pandas as pd
+
+    count = min(len(clauses), len(predicted_types))
+    clause_types = pd.Categorical([str(label) for label in predicted_types[:count]])
+    risk = map_clause_types_to_risk(clause_types)
+
+    columns: dict[str, Any] = {
+        "clause_id": [f"C{index:03d}" for index in range(1, count + 1)],
+        "clause_text": list(clauses[:count]),
+        "predicted_type": clause_types,
+        "severity": pd.Categorical(risk.severity),
+        "risk_score": risk.score,
+    }
+    if confidences is not None:
+        columns["confidence"] = list(confidences[:count])
+    if reused_from is not None and any(reused_from[:count]):
+        columns["reused_from"] = list(reused_from[:count])
+    return pd.DataFrame(columns)
 
 
 def build_clause_detail_index(report: dict[str, Any] | None) -> dict[str, dict[str, Any]]:
@@ -52,6 +171,7 @@ def build_clause_detail_index(report: dict[str, Any] | None) -> dict[str, dict[s
     if not report:
         return {}
 
+    report = expand_report(report)
     references = {item["clause_id"]: item for item in report.get("clause_references", [])}
     explanations = {item["clause_id"]: item for item in report.get("clause_explanations", [])}
     findings = {item["clause_id"]: item for item in report.get("identified_risks", [])}
@@ -73,6 +193,7 @@ def build_clause_detail_index(report: dict[str, Any] | None) -> dict[str, dict[s
             "source_titles": tuple(explanation.get("source_titles", ())),
             "citations": tuple(explanation.get("citations", ())),
             "evidence_ids": tuple(explanation.get("evidence_ids", ())),
+            "reused_from": finding.get("reused_from"),
         }
     return detail_index
 
@@ -95,6 +216,68 @@ def format_clause_label(clause_detail: dict[str, Any]) -> str:
     )
 
 
+def _reusable_predictions(
+    previous: ContractAnalysisResult,
+    alignment: ClauseAlignment,
+    with_confidence: bool,
+) -> dict[int, tuple[str, float | None]]:
+    """Map current clause positions to the label and confidence of their unchanged predecessor."""
+    frame = previous.clause_frame
+    if previous.errors or frame.empty or (with_confidence and "confidence" not in frame):
+        return {}
+    labels = frame["predicted_type"].astype(str).tolist()
+    confidences = frame["confidence"].tolist() if with_confidence else [None] * len(labels)
+    return {
+        current: (labels[earlier], confidences[earlier])
+        for earlier, current in alignment.unchanged
+        if earlier < len(labels)
+    }
+
+
+def _reusable_evidence(previous: ContractAnalysisResult, alignment: ClauseAlignment) -> dict[int, tuple[EvidenceItem, ...]]:
+    """Map current clause positions to the supported evidence cited for their unchanged predecessor.
+
+    Clauses whose earlier finding had no evidence are left out, so they are
+    retrieved again and keep their fallback bookkeeping.
+    """
+    report = previous.report
+    if not report or previous.report_error or previous.clause_frame.empty:
+        return {}
+    findings = {finding["clause_id"]: finding for finding in report.get("identified_risks", [])}
+    clause_ids = previous.clause_frame["clause_id"].tolist()
+    reused: dict[int, tuple[EvidenceItem, ...]] = {}
+    for earlier, current in alignment.unchanged:
+        finding = findings.get(clause_ids[earlier]) if earlier < len(clause_ids) else None
+        evidence = finding_evidence_items(report, finding) if finding else ()
+        if evidence:
+            reused[current] = evidence
+    return reused
+
+
+def _near_duplicate_reuse(
+    clause_index: NearDuplicateIndex,
+    clauses: Sequence[str],
+    pending: Sequence[int],
+    with_confidence: bool,
+) -> tuple[dict[int, tuple[str, float | None]], dict[int, tuple[EvidenceItem, ...]], dict[int, str]]:
+    """Look up pending clauses in the index and collect reusable predictions, evidence, and their sources."""
+    predictions: dict[int, tuple[str, float | None]] = {}
+    evidence: dict[int, tuple[EvidenceItem, ...]] = {}
+    sources: dict[int, str] = {}
+    for index in pending:
+        match = clause_index.best_match(clauses[index])
+        if match is None or (with_confidence and match.clause.confidence is None):
+            continue
+        predictions[index] = (match.clause.predicted_type, match.clause.confidence)
+        sources[index] = (
+            f"{match.clause.contract_name} {match.clause.clause_id} (similarity {match.similarity:.2f})"
+        )
+        if match.clause.evidence:
+            evidence[index] = match.clause.evidence
+    return predictions, evidence, sources
+
+
+@profiled("analyze_contract_text")
 def analyze_contract_text(
     raw_text: str,
     model: object | None,
@@ -102,10 +285,43 @@ def analyze_contract_text(
     contract_name: str = "Uploaded Contract",
     knowledge_base: object | None = None,
     generate_report: bool = True,
+    low_risk_confidence: float | None = None,
+    progress: ProgressCallback | None = None,
+    report_stream: TextIO | None = None,
+    previous: ContractAnalysisResult | None = None,
+    clause_index: NearDuplicateIndex | None = None,
+    top_k: int = 3,
+    min_evidence_score: float = MIN_EVIDENCE_SCORE,
+    rule_cascade: bool = False,
 ) -> ContractAnalysisResult:
-    """Run the Milestone 1 analysis and optionally build the agentic report."""
+    """Run the Milestone 1 analysis and optionally build the agentic report.
+
+    Setting ``low_risk_confidence`` scores predictions with class probabilities
+    and lets the report skip retrieval for confidently low-risk clauses.
+    ``progress`` receives stage updates, including the clause table as soon as
+    it exists, and may raise ``WorkflowCancelled`` to stop the analysis.
+    With ``report_stream`` the report is written there as indented JSON, one
+    finding at a time, and ``result.report`` stays None.
+    With ``previous``, the clauses are aligned to that earlier analysis of the
+    same contract; unchanged clauses reuse its predictions and evidence, so
+    only added and changed clauses are predicted and retrieved. Predictions
+    are reused only from the same model object, and evidence only when the
+    knowledge base, ``top_k``, and ``min_evidence_score`` also match; retrain
+    or rebuild into a new object rather than mutating one in place.
+    With ``clause_index``, remaining clauses that nearly duplicate a clause
+    from an indexed contract reuse that clause's prediction and evidence. The
+    match is a MinHash estimate, so findings then depend on what was indexed
+    first; each reused finding carries ``reused_from`` naming its source
+    clause. Pass an index only to opt into that trade; indexing analyses for
+    the recurring-clause view does not need it.
+    With ``rule_cascade``, clauses that keyword rules decide unambiguously skip
+    the model (see ``RuleCascadeClassifier``); the cascade counters land in
+    ``result.cascade_stats`` and the report's ``performance`` section. A model
+    that already is a ``RuleCascadeClassifier`` is used as is.
+    """
     warnings: list[str] = []
     errors: list[str] = []
+    notify_progress(progress, WorkflowStage.INGEST, char_count=len(raw_text))
 
     normalized_text = raw_text.strip()
     if not normalized_text:
@@ -127,7 +343,10 @@ def analyze_contract_text(
         )
         normalized_text = normalized_text[:MAX_INPUT_CHARS]
 
+    segmentation_clock = start_stage_clock("segmentation")
     clauses = segment_clauses(normalized_text)
+    stage_metrics = [stop_stage_clock(segmentation_clock, item_count=len(clauses))]
+    notify_progress(progress, WorkflowStage.PREPROCESS, clause_count=len(clauses))
     if not clauses:
         errors.append("Could not segment clauses from the document.")
         empty_frame = build_clause_frame((), ())
@@ -159,9 +378,47 @@ def analyze_contract_text(
             errors=tuple(errors),
         )
 
+    settings = AnalysisSettings.capture(model, knowledge_base, top_k, min_evidence_score, rule_cascade)
+    predictor = model
+    if rule_cascade and not isinstance(model, RuleCascadeClassifier):
+        predictor = RuleCascadeClassifier(model)
+    alignment = None
+    reused_predictions: dict[int, tuple[str, float | None]] = {}
+    reused_evidence: dict[int, tuple[EvidenceItem, ...]] = {}
+    reused_sources: dict[int, str] = {}
+    if previous is not None:
+        alignment = align_clauses(previous.clauses, clauses)
+        if settings.reuses_predictions_from(previous.settings):
+            reused_predictions = _reusable_predictions(previous, alignment, low_risk_confidence is not None)
+        if settings.reuses_evidence_from(previous.settings):
+            reused_evidence = _reusable_evidence(previous, alignment)
+    pending = [index for index in range(len(clauses)) if index not in reused_predictions]
+    if clause_index is not None and len(clause_index):
+        duplicate_predictions, duplicate_evidence, reused_sources = _near_duplicate_reuse(
+            clause_index, clauses, pending, low_risk_confidence is not None
+        )
+        reused_predictions.update(duplicate_predictions)
+        reused_evidence.update(duplicate_evidence)
+        pending = [index for index in pending if index not in duplicate_predictions]
+    pending_clauses = [clauses[index] for index in pending] if reused_predictions else clauses
+
+    prediction_clock = start_stage_clock("prediction", len(pending))
     try:
-        predicted_types = predict_clauses(model, clauses, batch_size=256)
-        clause_frame = build_clause_frame(clauses, predicted_types)
+        predicted_types = [""] * len(clauses)
+        confidences: list[float | None] = [None] * len(clauses)
+        for index, (label, confidence) in reused_predictions.items():
+            predicted_types[index], confidences[index] = label, confidence
+        sources = [reused_sources.get(index) for index in range(len(clauses))] if reused_sources else None
+        if low_risk_confidence is None:
+            for index, label in zip(pending, predict_clauses(predictor, pending_clauses, batch_size=256)):
+                predicted_types[index] = label
+            clause_frame = build_clause_frame(clauses, predicted_types, reused_from=sources)
+        else:
+            for index, score in zip(pending, predict_clauses_with_scores(predictor, pending_clauses, batch_size=256)):
+                predicted_types[index], confidences[index] = score.label, score.probability
+            clause_frame = build_clause_frame(clauses, predicted_types, confidences, reused_from=sources)
+    except (WorkflowCancelled, QueueFullError):
+        raise
     except Exception as exc:  # pragma: no cover - defensive guard for model/runtime failures
         errors.append(f"Clause prediction failed: {exc}")
         clause_frame = build_clause_frame(clauses, ("unknown",) * len(clauses))
@@ -174,20 +431,39 @@ def analyze_contract_text(
             errors=tuple(errors),
         )
 
+    stage_metrics.append(stop_stage_clock(prediction_clock))
+    cascade_stats = predictor.stats.asdict() if isinstance(predictor, RuleCascadeClassifier) else None
+    notify_progress(progress, WorkflowStage.ASSESS_RISK, clause_frame=clause_frame)
+
     report = None
     report_error = None
     if generate_report:
         try:
-            report = generate_legal_assistance_report(
-                normalized_text,
-                clause_frame.to_dict(orient="records"),
-                knowledge_base=knowledge_base,
-                contract_name=contract_name,
-            )
-            fallback = report.get("fallback", {}) if report else {}
-            if fallback.get("used"):
-                reason = fallback.get("reason") or "The assistant used a fallback path."
+            report_options: dict[str, Any] = {
+                "knowledge_base": knowledge_base,
+                "contract_name": contract_name,
+                "top_k": top_k,
+                "min_evidence_score": min_evidence_score,
+                "low_risk_confidence": low_risk_confidence,
+                "progress": progress,
+                "stage_metrics": stage_metrics,
+                "cascade_stats": cascade_stats,
+                "reused_evidence": reused_evidence,
+            }
+            if report_stream is None:
+                report = generate_legal_assistance_report(normalized_text, clause_frame, **report_options)
+                fallback = report.get("fallback", {}) if report else {}
+                fallback_used, fallback_reason = bool(fallback.get("used")), fallback.get("reason")
+            else:
+                state = stream_legal_assistance_report(
+                    report_stream, normalized_text, clause_frame, indent=2, **report_options
+                )
+                fallback_used, fallback_reason = state.fallback_reason is not None, state.fallback_reason
+            if fallback_used:
+                reason = fallback_reason or "The assistant used a fallback path."
                 warnings.append(f"Assistant fallback used: {reason}")
+        except (WorkflowCancelled, QueueFullError):
+            raise
         except Exception as exc:  # pragma: no cover - defensive guard for assistant runtime failures
             report_error = f"Could not generate the legal assistance report: {exc}"
             warnings.append(report_error)
@@ -201,4 +477,32 @@ def analyze_contract_text(
         warnings=tuple(warnings),
         errors=tuple(errors),
         report_error=report_error,
+        revision=alignment,
+        settings=settings,
+        cascade_stats=cascade_stats,
+    )
+
+
+def analyze_contract_revision(
+    raw_text: str,
+    model: object | None,
+    previous: ContractAnalysisResult,
+    *,
+    contract_name: str | None = None,
+    **options: Any,
+) -> ContractRevision:
+    """Analyze a new version of a contract against its previous analysis.
+
+    Only added and changed clauses are predicted and retrieved; the returned
+    delta lists new, removed, and changed findings. ``options`` are passed to
+    ``analyze_contract_text``.
+    """
+    result = analyze_contract_text(
+        raw_text,
+        model,
+        contract_name=contract_name or previous.contract_name,
+        previous=previous,
+        **options,
     )
+    alignment = result.revision or align_clauses(previous.clauses, result.clauses)
+    return ContractRevision(result, compute_risk_delta(previous.clause_frame, result.clause_frame, alignment))
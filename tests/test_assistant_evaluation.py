@@ -5,11 +5,24 @@ from __future__ import annotations
 import json
 
 from contract_risk.assistant.corpus import LegalGuidanceRecord, load_legal_guidance_corpus
+from contract_risk.assistant.reporting import expand_report
 from contract_risk.assistant.retrieval import build_knowledge_base
 from contract_risk.assistant.service import generate_legal_assistance_report
 
 
 EXPECTED_REPORT_KEYS = {
+    "report_version",
+    "contract_summary",
+    "severity_assessment",
+    "sources",
+    "identified_risks",
+    "mitigation_actions",
+    "disclaimer",
+    "generation_controls",
+    "fallback",
+}
+
+EXPECTED_EXPANDED_REPORT_KEYS = {
     "report_version",
     "contract_summary",
     "severity_assessment",
@@ -73,9 +86,13 @@ def _build_demo_report():
 def test_assistant_report_schema_is_stable() -> None:
     report = _build_demo_report()
 
+    expanded = expand_report(report)
+
     assert EXPECTED_REPORT_KEYS <= set(report)
     assert EXPECTED_FINDING_KEYS <= set(report["identified_risks"][0])
-    assert EXPECTED_EXPLANATION_KEYS <= set(report["clause_explanations"][0])
+    assert EXPECTED_EXPANDED_REPORT_KEYS <= set(expanded)
+    assert EXPECTED_FINDING_KEYS <= set(expanded["identified_risks"][0])
+    assert EXPECTED_EXPLANATION_KEYS <= set(expanded["clause_explanations"][0])
     assert report["contract_summary"]["contract_name"] == "Evaluation Agreement"
     assert report["severity_assessment"]["overall_risk_level"] in {"High", "Medium", "Low"}
 
@@ -113,13 +130,16 @@ def test_assistant_retrieval_fallback_regression() -> None:
 
     assert report["fallback"]["used"] is True
     assert "no retrieval evidence" in report["fallback"]["reason"].lower()
-    assert report["clause_explanations"][0]["citations"] == ()
+    assert expand_report(report)["clause_explanations"][0]["citations"] == ()
 
 
 def test_assistant_report_format_remains_json_serializable() -> None:
     report = _build_demo_report()
     payload = json.dumps(report, sort_keys=True)
 
-    assert '"report_version": "2.0"' in payload
-    assert '"clause_references"' in payload
+    assert '"report_version": "3.0"' in payload
+    assert '"sources"' in payload
     assert '"generation_controls"' in payload
+    expanded_payload = json.dumps(expand_report(report), sort_keys=True)
+    assert '"report_version": "2.0"' in expanded_payload
+    assert '"clause_references"' in expanded_payload
@@ -1,7 +1,11 @@
 """Tests for clause-level explanation generation."""
 
+from dataclasses import asdict
+
+from benchmarks.report_assembly import build_large_state, legacy_sections
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
 from contract_risk.assistant.explanations import build_clause_explanation
+from contract_risk.assistant.reporting import build_structured_report, expand_report
 from contract_risk.assistant.retrieval import build_knowledge_base, retrieve_clause_guidance
 from contract_risk.assistant.state import ClausePrediction, EvidenceItem
 
@@ -47,3 +51,15 @@ def test_clause_explanation_falls_back_without_evidence() -> None:
 
     assert "fallback" in explanation.supporting_reasoning.lower()
     assert explanation.evidence_ids == ()
+
+
+def test_report_reuses_explanation_stored_on_each_finding() -> None:
+    state = build_large_state(12)
+    legacy_findings, legacy_explanations = legacy_sections(build_large_state(12, cache_explanations=False))
+
+    expanded = expand_report(build_structured_report(state))
+
+    assert all(finding.clause_explanation is not None for finding in state.findings)
+    assert expanded["identified_risks"] == legacy_findings
+    assert expanded["clause_explanations"] == legacy_explanations
+    assert state.findings[0].clause_explanation.asdict() == asdict(state.findings[0].clause_explanation)
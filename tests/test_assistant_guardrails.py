@@ -2,6 +2,7 @@
 
 from contract_risk.assistant.corpus import LegalGuidanceRecord, load_legal_guidance_corpus
 from contract_risk.assistant.guardrails import build_generation_prompt
+from contract_risk.assistant.reporting import expand_report
 from contract_risk.assistant.retrieval import build_knowledge_base
 from contract_risk.assistant.service import generate_legal_assistance_report
 from contract_risk.assistant.state import ClausePrediction, EvidenceItem
@@ -48,7 +49,7 @@ def test_report_refuses_to_cite_weak_evidence() -> None:
 
     assert report["fallback"]["used"] is True
     assert "support threshold" in report["fallback"]["reason"].lower()
-    assert report["clause_explanations"][0]["citations"] == ()
+    assert expand_report(report)["clause_explanations"][0]["citations"] == ()
 
 
 def test_report_handles_missing_evidence_without_speculation() -> None:
@@ -84,4 +85,4 @@ def test_report_handles_missing_evidence_without_speculation() -> None:
 
     assert report["fallback"]["used"] is True
     assert "no retrieval evidence" in report["fallback"]["reason"].lower()
-    assert report["clause_explanations"][0]["citations"] == ()
+    assert expand_report(report)["clause_explanations"][0]["citations"] == ()
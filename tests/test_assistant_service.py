@@ -1,8 +1,47 @@
 """Tests for the structured legal assistance report generator."""
 
+import io
+import json
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.report_assembly import build_large_state
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.reporting import build_structured_report, expand_report, write_report_json
 from contract_risk.assistant.retrieval import build_knowledge_base
-from contract_risk.assistant.service import generate_legal_assistance_report
+import contract_risk.assistant.service as service
+from contract_risk.assistant.service import generate_legal_assistance_report, stream_legal_assistance_report
+from contract_risk.assistant.state import WorkflowStage
+
+STREAM_PREDICTIONS = [
+    {
+        "clause_id": "C001",
+        "clause_text": "Either party may terminate with notice.",
+        "predicted_type": "termination",
+        "severity": "High",
+        "risk_score": 90,
+    },
+    {
+        "clause_id": "C002",
+        "clause_text": "All disputes go to arbitration.",
+        "predicted_type": "arbitration",
+        "severity": "Medium",
+        "risk_score": 65,
+    },
+]
+
+
+class _CountingSink:
+    """Text sink that keeps only the number of characters written."""
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, chunk: str) -> int:
+        self.size += len(chunk)
+        return len(chunk)
 
 
 def test_generate_report_returns_structured_sections() -> None:
@@ -29,16 +68,19 @@ def test_generate_report_returns_structured_sections() -> None:
         contract_name="Demo Agreement",
     )
 
-    assert report["report_version"] == "2.0"
+    assert report["report_version"] == "3.0"
     assert report["contract_summary"]["contract_name"] == "Demo Agreement"
     assert report["severity_assessment"]["high_risk_count"] == 1
     assert len(report["identified_risks"]) == 2
-    assert len(report["clause_references"]) == 2
-    assert len(report["clause_explanations"]) == 2
     assert report["mitigation_actions"]
     assert report["disclaimer"]
     assert report["generation_controls"]["citation_policy"]
-    assert report["sources_consulted"]
+    assert report["sources"]
+    expanded = expand_report(report)
+    assert expanded["report_version"] == "2.0"
+    assert len(expanded["clause_references"]) == 2
+    assert len(expanded["clause_explanations"]) == 2
+    assert [item["source_id"] for item in expanded["sources_consulted"]] == list(report["sources"])
 
 
 def test_generate_report_clauses_remain_easy_to_render() -> None:
@@ -58,11 +100,12 @@ def test_generate_report_clauses_remain_easy_to_render() -> None:
         contract_name="Render Test",
     )
 
-    clause_reference = report["clause_references"][0]
+    expanded = expand_report(report)
+    clause_reference = expanded["clause_references"][0]
     assert clause_reference["clause_id"] == "C010"
     assert clause_reference["evidence_count"] >= 1
     assert "clause_text" in clause_reference
-    clause_explanation = report["clause_explanations"][0]
+    clause_explanation = expanded["clause_explanations"][0]
     assert clause_explanation["clause_reference"] == "C010 (termination)"
     assert clause_explanation["source_titles"]
 
@@ -72,3 +115,170 @@ def test_generate_report_uses_fallback_for_empty_input() -> None:
     assert report["fallback"]["used"] is True
     assert report["contract_summary"]["contract_name"] == "Empty Contract"
     assert report["disclaimer"]
+
+
+def test_generate_report_skips_retrieval_for_confident_low_risk_clauses() -> None:
+    kb = build_knowledge_base(load_legal_guidance_corpus())
+    report = generate_legal_assistance_report(
+        "Termination and confidentiality text.",
+        [
+            {
+                "clause_id": "C001",
+                "clause_text": "Either party may terminate with notice.",
+                "predicted_type": "termination",
+                "severity": "High",
+                "risk_score": 82,
+                "confidence": 0.99,
+            },
+            {
+                "clause_id": "C002",
+                "clause_text": "The recipient shall keep information confidential.",
+                "predicted_type": "confidentiality",
+                "severity": "Low",
+                "risk_score": 30,
+                "confidence": 0.95,
+            },
+            {
+                "clause_id": "C003",
+                "clause_text": "This agreement is governed by the laws of India.",
+                "predicted_type": "governing law",
+                "severity": "Low",
+                "risk_score": 35,
+                "confidence": 0.4,
+            },
+        ],
+        knowledge_base=kb,
+        low_risk_confidence=0.9,
+    )
+
+    budget = report["retrieval_budget"]
+    assert budget["skipped_clause_ids"] == ["C002"]
+    assert budget["skipped_clause_count"] == 1
+    assert budget["retrieved_clause_count"] == 2
+    assert budget["estimated_seconds_saved"] >= 0
+    assert len(report["identified_risks"]) == 3
+    skipped = next(item for item in report["identified_risks"] if item["clause_id"] == "C002")
+    assert not skipped["evidence"]
+    assert not any("C002" in error for error in report["fallback"]["errors"])
+
+
+def _without_timings(report: dict) -> dict:
+    report = json.loads(json.dumps(report))
+    report["performance"] = [stage["stage"] for stage in report["performance"]["stages"]]
+    for key in ("retrieval_seconds", "estimated_seconds_saved"):
+        report["retrieval_budget"].pop(key)
+    return report
+
+
+def test_streamed_report_matches_generated_report() -> None:
+    kb = build_knowledge_base(load_legal_guidance_corpus())
+    report = generate_legal_assistance_report("Termination and arbitration text.", STREAM_PREDICTIONS, knowledge_base=kb)
+    buffer = io.StringIO()
+
+    state = stream_legal_assistance_report(
+        buffer, "Termination and arbitration text.", STREAM_PREDICTIONS, knowledge_base=kb, indent=2
+    )
+
+    assert len(state.findings) == 2
+    assert _without_timings(json.loads(buffer.getvalue())) == _without_timings(report)
+
+
+def test_streamed_report_text_matches_json_dumps() -> None:
+    state = build_large_state(25)
+    report = build_structured_report(state)
+    compact, indented = io.StringIO(), io.StringIO()
+
+    write_report_json(state, compact)
+    write_report_json(state, indented, indent=2)
+
+    assert compact.getvalue().split('"performance"')[0] == json.dumps(report).split('"performance"')[0]
+    assert _without_timings(json.loads(indented.getvalue())) == _without_timings(report)
+    assert indented.getvalue().count("\n    {") == 25
+
+
+def test_streamed_report_memory_stays_flat_as_findings_grow() -> None:
+    def peak_bytes(finding_count: int, stream: bool) -> int:
+        state = build_large_state(finding_count)
+        tracemalloc.start()
+        if stream:
+            write_report_json(state, _CountingSink(), indent=2)
+        else:
+            _CountingSink().write(json.dumps(build_structured_report(state), indent=2))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    small, large = peak_bytes(200, stream=True), peak_bytes(2000, stream=True)
+
+    assert large < small * 1.5
+    assert large * 10 < peak_bytes(2000, stream=False)
+
+
+def test_report_is_identical_with_thread_and_process_executors() -> None:
+    kb = build_knowledge_base(load_legal_guidance_corpus())
+    predictions = [{**STREAM_PREDICTIONS[index % 2], "clause_id": f"C{index + 1:03d}"} for index in range(7)] + [
+        {
+            "clause_id": "C008",
+            "clause_text": "Qwzx vbnm.",
+            "predicted_type": "qwzx",
+            "severity": "Medium",
+            "risk_score": 50,
+        },
+        {
+            "clause_id": "C009",
+            "clause_text": "Invoices are payable in thirty days.",
+            "predicted_type": "payment terms",
+            "severity": "Low",
+            "risk_score": 20,
+            "confidence": 0.99,
+        },
+    ]
+
+    def generate(**options) -> tuple[dict, list]:
+        events = []
+        report = generate_legal_assistance_report(
+            "Termination, arbitration, and payment text.",
+            predictions,
+            knowledge_base=kb,
+            low_risk_confidence=0.9,
+            progress=lambda stage, detail: events.append((stage, detail)),
+            **options,
+        )
+        return _without_timings(report), events
+
+    serial, serial_events = generate()
+    assert serial["fallback"]["used"] and "C008" in serial["fallback"]["errors"][-1]
+    assert serial["retrieval_budget"]["skipped_clause_ids"] == ["C009"]
+    for options in ({"executor": "thread", "workers": 3}, {"executor": "process", "workers": 2}):
+        assert generate(chunk_size=2, **options) == (serial, serial_events)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert generate(executor=pool, chunk_size=3) == (serial, serial_events)
+        assert pool.submit(len, "still open").result() == 10
+    assert any(stage is WorkflowStage.ASSESS_RISK for stage, _ in serial_events)
+    with pytest.raises(ValueError, match="report executor"):
+        generate(executor="fiber", chunk_size=2)
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        generate(executor="thread", chunk_size=0)
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        generate(executor="thread", workers=0)
+
+
+def test_single_chunk_reports_do_not_start_a_pool(monkeypatch) -> None:
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("a pool was started for a single-chunk report")
+
+    monkeypatch.setattr(service, "ProcessPoolExecutor", _no_pool)
+    monkeypatch.setattr(service, "ThreadPoolExecutor", _no_pool)
+    kb = build_knowledge_base(load_legal_guidance_corpus())
+
+    for executor in ("process", "thread"):
+        report = generate_legal_assistance_report(
+            "Termination and arbitration text.",
+            STREAM_PREDICTIONS,
+            knowledge_base=kb,
+            executor=executor,
+            chunk_size=len(STREAM_PREDICTIONS),
+        )
+        assert report["identified_risks"]
+    with pytest.raises(ValueError, match="report executor"):
+        generate_legal_assistance_report("Termination text.", STREAM_PREDICTIONS, knowledge_base=kb, executor="fiber")
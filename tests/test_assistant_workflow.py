@@ -1,7 +1,17 @@
 """Tests for the assistant workflow skeleton."""
 
+import tracemalloc
+
 from contract_risk.assistant.state import ClausePrediction, WorkflowStage
-from contract_risk.assistant.workflow import build_summary, create_agent_state, mark_fallback
+from contract_risk.assistant.workflow import (
+    build_summary,
+    complete_workflow,
+    create_agent_state,
+    mark_fallback,
+    mark_mitigation,
+    start_stage_clock,
+    stop_stage_clock,
+)
 
 
 def test_create_agent_state_initializes_ingest_stage() -> None:
@@ -32,3 +42,53 @@ def test_mark_fallback_records_reason() -> None:
     mark_fallback(state, "retrieval unavailable")
     assert state.stage == WorkflowStage.FALLBACK
     assert state.fallback_reason == "retrieval unavailable"
+
+
+def test_stage_transitions_record_stage_metrics() -> None:
+    state = create_agent_state(
+        "Contract text",
+        [ClausePrediction("C001", "Clause text", "termination", "High", 90)],
+    )
+    build_summary(state)
+    mark_mitigation(state)
+    complete_workflow(state)
+
+    assert [item.stage for item in state.stage_metrics] == ["ingest", "summarize", "mitigate"]
+    assert all(item.wall_seconds >= 0 and item.cpu_seconds >= 0 for item in state.stage_metrics)
+    assert state.stage_metrics[0].item_count == 1
+    assert state.stage_clock is None
+
+
+def test_stage_clock_reports_peak_allocation_only_when_tracing() -> None:
+    clock = start_stage_clock("prediction", 3)
+    assert stop_stage_clock(clock).peak_alloc_bytes is None
+
+    tracemalloc.start()
+    try:
+        clock = start_stage_clock("prediction", 3)
+        buffer = [bytes(1024) for _ in range(64)]
+        metrics = stop_stage_clock(clock, item_count=len(buffer))
+    finally:
+        tracemalloc.stop()
+
+    assert metrics.peak_alloc_bytes is not None and metrics.peak_alloc_bytes >= 64 * 1024
+    assert metrics.item_count == 64
+
+
+def test_stage_clock_drops_peak_allocation_when_clocks_overlap() -> None:
+    tracemalloc.start()
+    try:
+        outer = start_stage_clock("retrieve")
+        inner = start_stage_clock("prediction")
+        inner_metrics = stop_stage_clock(inner)
+        outer_metrics = stop_stage_clock(outer)
+        abandoned = start_stage_clock("summarize")
+        del abandoned
+        alone = start_stage_clock("mitigate")
+        alone_metrics = stop_stage_clock(alone)
+    finally:
+        tracemalloc.stop()
+
+    assert inner_metrics.peak_alloc_bytes is None
+    assert outer_metrics.peak_alloc_bytes is None
+    assert alone_metrics.peak_alloc_bytes is not None
@@ -0,0 +1,87 @@
+"""Tests for the benchmark harness and synthetic data generators."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.harness import BenchmarkResult, compare_results, load_results, measure, write_results
+from benchmarks.startup import check_budgets, load_startup_targets, parse_importtime, run_startup_benchmarks
+from benchmarks.synthetic import generate_contract, generate_guidance_corpus, load_clause_templates
+from contract_risk.features.segmentation import segment_clauses
+
+
+def _result(name: str, median: float, **params: object) -> BenchmarkResult:
+    return BenchmarkResult(name, dict(params), 1, median, median, median)
+
+
+def test_generate_contract_is_deterministic_and_segmentable() -> None:
+    templates = load_clause_templates()
+    first = generate_contract(5_000, seed=7, templates=templates)
+    second = generate_contract(5_000, seed=7, templates=templates)
+
+    assert first == second
+    assert 5_000 <= len(first) < 6_000
+    assert len(segment_clauses(first)) == first.count("\n\n") + 1
+
+
+def test_generate_guidance_corpus_has_unique_ids() -> None:
+    records = generate_guidance_corpus(40, seed=3)
+
+    assert len(records) == 40
+    assert len({record.id for record in records}) == 40
+
+
+def test_compare_results_flags_only_slowdowns_over_threshold(tmp_path) -> None:
+    baseline = [_result("segment_clauses", 1.0, chars=1000), _result("predict_clauses", 1.0, chars=1000)]
+    current = [_result("segment_clauses", 1.05, chars=1000), _result("predict_clauses", 1.5, chars=1000)]
+    path = write_results(baseline, tmp_path / "baseline.json", profile="quick")
+
+    regressions = compare_results(load_results(path), {item.key: item for item in current}, threshold=0.1)
+
+    assert [item.key for item in regressions] == ["predict_clauses[chars=1000]"]
+    assert regressions[0].ratio == 1.5
+
+
+def test_measure_reports_throughput() -> None:
+    result = measure("noop", lambda: [1, 2, 3], params={"size": 3}, repeats=2, items=len)
+
+    assert result.key == "noop[size=3]"
+    assert result.repeats == 2
+    assert result.items == 3
+
+
+def test_parse_importtime_tracks_top_level_cumulative_time() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   numpy.core",
+            "import time:       300 |        420 | numpy",
+            "import time:        50 |         50 | json",
+            "some unrelated warning",
+        ]
+    )
+
+    profile = parse_importtime(stderr)
+
+    assert profile.top_level == ("numpy", "json")
+    assert profile.cumulative_us["numpy"] == 420
+    assert profile.modules == {"numpy.core", "numpy", "json"}
+
+
+def test_startup_targets_do_not_import_heavy_dependencies() -> None:
+    targets = load_startup_targets()
+
+    results = run_startup_benchmarks(targets, repeats=1)
+
+    assert {result.params["target"] for result in results} == {"cli", "app", "worker"}
+    assert all(not result.extra["forbidden_loaded"] for result in results)
+    assert not [message for message in check_budgets(results, targets) if "imports" in message]
+
+
+def test_assistant_package_resolves_exports_lazily() -> None:
+    import contract_risk.assistant as assistant
+
+    assert assistant.build_knowledge_base.__module__ == "contract_risk.assistant.retrieval"
+    assert "generate_legal_assistance_report" in dir(assistant)
+    with pytest.raises(AttributeError):
+        assistant.not_a_real_export
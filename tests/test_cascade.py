@@ -0,0 +1,98 @@
+"""Tests for the rule-first clause classification cascade."""
+
+from __future__ import annotations
+
+import pytest
+
+from contract_risk.models.cascade import DEFAULT_RULE_CONFIDENCE, RuleCascadeClassifier
+from contract_risk.models.inference import predict_clauses, predict_clauses_with_scores
+from contract_risk.models.pipeline import train_logreg_model
+
+
+class _CountingModel:
+    classes_ = ("Confidentiality", "Liability", "Termination")
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def predict(self, batch: list[str]) -> list[str]:
+        self.seen.extend(batch)
+        return ["Liability" for _ in batch]
+
+
+def test_cascade_resolves_unambiguous_clauses_without_the_model() -> None:
+    model = _CountingModel()
+    cascade = RuleCascadeClassifier(model)
+    clauses = [
+        "Either party may terminate this agreement on notice.",
+        "The recipient shall keep all information confidential.",
+        "Vendor shall indemnify the client for damages.",
+        "Either party may terminate if confidential information is disclosed.",
+    ]
+
+    labels = predict_clauses(cascade, clauses)
+
+    assert labels == ["Termination", "Confidentiality", "Liability", "Liability"]
+    assert model.seen == clauses[2:]
+    assert cascade.stats.rule_resolved == 2
+    assert cascade.stats.model_resolved == 2
+    assert cascade.stats.rule_fraction == 0.5
+
+
+def test_cascade_skips_rule_tags_the_model_does_not_know() -> None:
+    model = _CountingModel()
+    cascade = RuleCascadeClassifier(model)
+
+    assert cascade.rule_label("Invoices carry a late fee.") is None
+    assert predict_clauses(cascade, ["Invoices carry a late fee."]) == ["Liability"]
+
+
+def test_cascade_ignores_keywords_inside_other_words() -> None:
+    model = _CountingModel()
+    model.classes_ = ("Confidentiality", "Force Majeure", "Governing Law", "Liability")
+    cascade = RuleCascadeClassifier(model)
+    clauses = [
+        "Licensor grants Licensee a license to use the software.",
+        "Vendor gives a warranty that the goods are fit for purpose.",
+        "Services meet the standard described in the statement of work.",
+        "Revenue is shared monthly between the parties.",
+    ]
+
+    assert [cascade.rule_label(clause) for clause in clauses] == [None, None, None, None]
+    assert predict_clauses(cascade, clauses) == ["Liability"] * 4
+    assert cascade.rule_label("Delays caused by force majeure excuse performance.") == "Force Majeure"
+
+
+def test_cascade_defers_to_the_model_when_liability_wording_is_present() -> None:
+    model = _CountingModel()
+    model.classes_ = ("Liability", "Payment Terms", "Termination")
+    cascade = RuleCascadeClassifier(model)
+    clauses = [
+        "The supplier shall indemnify the customer for any late payment penalties.",
+        "Neither party is liable for damages arising from termination.",
+    ]
+
+    assert [cascade.rule_label(clause) for clause in clauses] == [None, None]
+    assert predict_clauses(cascade, clauses) == ["Liability", "Liability"]
+    assert model.seen == clauses
+    assert cascade.rule_label("Invoices are due thirty days after payment is requested.") == "Payment Terms"
+
+
+def test_cascade_scores_rule_decisions_below_certainty() -> None:
+    model = train_logreg_model(
+        [
+            "Either party may terminate this agreement on notice.",
+            "The recipient shall keep all information confidential.",
+        ],
+        ["Termination", "Confidentiality"],
+    )
+    cascade = RuleCascadeClassifier(model)
+
+    scores = predict_clauses_with_scores(cascade, ["Either party may terminate for breach.", "Notices go by email."])
+
+    assert scores[0].label == "Termination"
+    assert scores[0].probability == pytest.approx(DEFAULT_RULE_CONFIDENCE)
+    assert scores[1].probability is not None and scores[1].probability < 1.0
+    assert cascade.stats.asdict()["rule_resolved"] == 1
+    with pytest.raises(ValueError, match="rule_confidence"):
+        RuleCascadeClassifier(model, rule_confidence=1.0)
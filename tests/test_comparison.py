@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from contract_risk.assistant.comparison import build_risk_trend_summary
+from contract_risk.assistant.comparison import RiskTrendAggregator, build_risk_trend_summary
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.near_duplicates import NearDuplicateIndex
 from contract_risk.assistant.retrieval import build_knowledge_base
 from contract_risk.ui_support import analyze_contract_text
 
@@ -53,3 +54,71 @@ def test_build_risk_trend_summary_ignores_missing_reports() -> None:
 
     assert summary["contract_count"] == 1
     assert summary["per_contract"][0]["contract_name"] == "Working Contract"
+
+
+def test_build_risk_trend_summary_lists_clauses_recurring_in_other_contracts() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    notice = (
+        "1 Termination. Either party may terminate this agreement on {days} days written notice delivered to {party} "
+        "at its registered office, and all licences granted under this agreement end on the effective date of termination."
+    )
+    texts = {
+        "Contract One": notice.format(days=30, party="Acme Corporation") + "\n\n2 Delivery. The supplier shall deliver goods on time.",
+        "Contract Two": notice.format(days=60, party="Globex Limited") + "\n\n2 Payment. Payment is due within 45 days of invoice.",
+        "Contract Three": "1 Audit. The customer may audit the supplier once per calendar year on reasonable notice.",
+    }
+    index = NearDuplicateIndex()
+    analyses = []
+    for name, text in texts.items():
+        analysis = analyze_contract_text(text, _ToyModel(), contract_name=name, knowledge_base=knowledge_base)
+        index.add_analysis(analysis)
+        analyses.append(analysis)
+
+    summary = build_risk_trend_summary(analyses, clause_index=index)
+
+    recurring = summary["recurring_clauses"]
+    assert [(row["contract_name"], row["other_contracts"]) for row in recurring] == [
+        ("Contract One", "Contract Two"),
+        ("Contract Two", "Contract One"),
+    ]
+    assert all(row["other_contract_count"] == 1 and row["best_similarity"] >= index.threshold for row in recurring)
+    assert [row["recurring_clause_count"] for row in summary["per_contract"]] == [1, 1, 0]
+    assert "recurring_clauses" not in build_risk_trend_summary(analyses)
+
+
+def test_trend_aggregator_adds_removes_and_merges_incrementally() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    texts = {
+        "Contract One": "Either party may terminate on written notice.",
+        "Contract Two": "Termination rights are triggered after 30 days.",
+        "Contract Three": "1 Termination. Terminate on insolvency.\n\n2 Notice. Notices must be in writing.",
+    }
+    analyses = [
+        analyze_contract_text(text, _ToyModel(), contract_name=name, knowledge_base=knowledge_base)
+        for name, text in texts.items()
+    ]
+
+    first, second = RiskTrendAggregator(), RiskTrendAggregator()
+    first.add(analyses[0])
+    second.add(analyses[1])
+    second.add(analyses[2])
+    assert not first.add(analyze_contract_text("", _ToyModel(), contract_name="Empty"))
+    first.merge(second)
+    expected = build_risk_trend_summary(analyses)
+    assert {**first.summary(), "per_contract": first.per_contract()} == expected
+    assert first.summary(listed_contracts=1)["repeated_risk_patterns"] == [
+        {**pattern, "contracts": "Contract One"} for pattern in expected["repeated_risk_patterns"]
+    ]
+
+    first.add(analyses[1])
+    assert len(first) == 3
+    assert first.remove("Contract Three")
+    assert not first.remove("Contract Three")
+    assert "Contract Three" not in first
+    assert first.summary()["severity_totals"] == build_risk_trend_summary(analyses[:2])["severity_totals"]
+    assert first.summary()["repeated_risk_patterns"] == build_risk_trend_summary(analyses[:2])["repeated_risk_patterns"]
+
+    first.remove("Contract Two")
+    assert first.summary()["repeated_risk_patterns"] == []
+    first.remove("Contract One")
+    assert {**first.summary(), "per_contract": first.per_contract()} == build_risk_trend_summary([])
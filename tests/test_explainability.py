@@ -0,0 +1,131 @@
+"""Tests for linear model explanations."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+
+from contract_risk.models import explainability
+from contract_risk.models.explainability import (
+    explain_predictions_batch,
+    explain_text_prediction,
+    top_features_by_class,
+    top_features_path,
+)
+from contract_risk.models.pipeline import load_model, save_model, train_logreg_model
+
+TRAINING_TEXTS = [
+    "Either party may terminate this agreement on notice.",
+    "Termination for material breach after cure period.",
+    "The recipient shall keep all information confidential.",
+    "Confidential information must not be disclosed.",
+    "This agreement is governed by the laws of Delaware.",
+    "The governing law shall be the laws of New York.",
+]
+TRAINING_LABELS = ["termination", "termination", "confidentiality", "confidentiality", "governing law", "governing law"]
+
+
+def _dense_explanation(model, text: str, top_n: int) -> list[tuple[str, float]]:
+    """Reference explanation computed densely for the predicted class."""
+    vectorizer = model.named_steps["tfidf"]
+    classifier = model.named_steps["classifier"]
+    row = vectorizer.transform([text]).toarray()[0]
+    class_index = list(classifier.classes_).index(model.predict([text])[0])
+    coef = classifier.coef_
+    weights = coef[class_index] if coef.shape[0] > 1 else (coef[0] if class_index == 1 else -coef[0])
+    contributions = row * weights
+    nonzero = np.flatnonzero(row)
+    ranked = nonzero[np.argsort(contributions[nonzero])[::-1]][:top_n]
+    names = vectorizer.get_feature_names_out()
+    return [(str(names[index]), float(contributions[index])) for index in ranked]
+
+
+def test_batch_explanations_match_dense_reference() -> None:
+    model = train_logreg_model(TRAINING_TEXTS, TRAINING_LABELS)
+    texts = ["Either party may terminate on notice.", "Keep the information confidential.", "xyzzy", "Delaware law governs."]
+
+    explanation = explain_predictions_batch(model, texts, top_n=3)
+
+    assert list(explanation.columns) == ["text_index", "prediction", "rank", "feature", "contribution"]
+    assert explanation["text_index"].tolist() == sorted(explanation["text_index"].tolist())
+    for index, text in enumerate(texts):
+        rows = explanation[explanation["text_index"] == index]
+        assert set(rows["prediction"]) == {model.predict([text])[0]}
+        expected = _dense_explanation(model, text, top_n=3) or [("<none>", 0.0)]
+        assert rows["rank"].tolist() == list(range(1, len(expected) + 1))
+        np.testing.assert_allclose(rows["contribution"].to_numpy(), [value for _, value in expected])
+        assert set(rows["feature"]) == {name for name, _ in expected}
+
+
+def test_single_text_explanation_supports_binary_models() -> None:
+    model = train_logreg_model(TRAINING_TEXTS[:4], TRAINING_LABELS[:4])
+    text = "The recipient must keep information confidential."
+
+    explanation = explain_text_prediction(model, text, top_n=4)
+
+    assert list(explanation.columns) == ["prediction", "feature", "contribution"]
+    assert set(explanation["prediction"]) == {"confidentiality"}
+    expected = _dense_explanation(model, text, top_n=4)
+    np.testing.assert_allclose(explanation["contribution"].to_numpy(), [value for _, value in expected])
+    assert (explanation["contribution"] > 0).all()
+
+
+def test_feature_names_are_read_once_per_fitted_vectorizer(monkeypatch) -> None:
+    model = train_logreg_model(TRAINING_TEXTS, TRAINING_LABELS)
+    vectorizer = model.named_steps["tfidf"]
+    calls = []
+    original = type(vectorizer).get_feature_names_out
+
+    def _counting(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(vectorizer), "get_feature_names_out", _counting)
+    explainability._FEATURE_NAMES.pop(vectorizer, None)
+
+    explain_predictions_batch(model, ["terminate on notice"])
+    explain_predictions_batch(model, ["confidential information"])
+    assert len(calls) == 1
+
+    model.fit(TRAINING_TEXTS[:4], TRAINING_LABELS[:4])
+    explain_predictions_batch(model, ["terminate on notice"])
+    assert len(calls) == 2
+
+
+def test_top_features_match_full_sort_for_binary_and_multiclass_models() -> None:
+    for labels_count in (4, 6):
+        model = train_logreg_model(TRAINING_TEXTS[:labels_count], TRAINING_LABELS[:labels_count])
+        classifier = model.named_steps["classifier"]
+        coefficients = explainability._class_coefficients(classifier)
+
+        table = top_features_by_class(model, top_n=3)
+
+        assert table["class_label"].tolist() == [str(label) for label in classifier.classes_ for _ in range(3)]
+        for class_index, label in enumerate(classifier.classes_):
+            weights = table.loc[table["class_label"] == label, "weight"].to_numpy()
+            np.testing.assert_allclose(weights, np.sort(coefficients[class_index])[::-1][:3])
+
+
+def test_top_features_are_persisted_with_the_model_artifact(tmp_path, monkeypatch) -> None:
+    model_path = tmp_path / "model.joblib"
+    save_model(train_logreg_model(TRAINING_TEXTS, TRAINING_LABELS), model_path)
+    sidecar = top_features_path(model_path)
+    assert sidecar.exists()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("top features should be served from the sidecar")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(explainability, "_top_feature_table", _fail)
+        loaded = load_model(model_path)
+        table = top_features_by_class(loaded, top_n=8)
+    assert len(table) == 3 * 8
+    table.loc[0, "weight"] = 99.0
+    assert top_features_by_class(loaded, top_n=8).loc[0, "weight"] != 99.0
+
+    save_model(train_logreg_model(TRAINING_TEXTS[:4], TRAINING_LABELS[:4]), tmp_path / "other.joblib")
+    sidecar.write_text(top_features_path(tmp_path / "other.joblib").read_text(encoding="utf-8"), encoding="utf-8")
+    reloaded = load_model(model_path)
+    assert set(top_features_by_class(reloaded, top_n=2)["class_label"]) == set(TRAINING_LABELS)
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["artifact_sha256"] == explainability._artifact_digest(model_path)
@@ -0,0 +1,41 @@
+"""Tests for batched clause inference helpers."""
+
+from __future__ import annotations
+
+from contract_risk.models.inference import predict_clauses, predict_clauses_with_scores
+from contract_risk.models.pipeline import train_logreg_model
+
+
+def _train_toy_model():
+    return train_logreg_model(
+        [
+            "Either party may terminate this agreement on notice.",
+            "Termination for material breach after cure period.",
+            "The recipient shall keep all information confidential.",
+            "Confidential information must not be disclosed.",
+        ],
+        ["termination", "termination", "confidentiality", "confidentiality"],
+    )
+
+
+def test_predict_clauses_with_scores_matches_hard_labels() -> None:
+    model = _train_toy_model()
+    clauses = ["Either party may terminate on notice.", "Keep the information confidential."]
+
+    scores = predict_clauses_with_scores(model, clauses, batch_size=1)
+
+    assert [score.label for score in scores] == predict_clauses(model, clauses)
+    for score in scores:
+        assert score.probability is not None and 0.5 <= score.probability <= 1.0
+        assert score.margin is not None and 0.0 <= score.margin <= score.probability
+
+
+def test_predict_clauses_with_scores_handles_models_without_probabilities() -> None:
+    class _LabelOnlyModel:
+        def predict(self, batch: list[str]) -> list[str]:
+            return ["termination" for _ in batch]
+
+    scores = predict_clauses_with_scores(_LabelOnlyModel(), ["Clause one.", "Clause two."])
+
+    assert [score.label for score in scores] == ["termination", "termination"]
+    assert all(score.probability is None and score.margin is None for score in scores)
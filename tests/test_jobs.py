@@ -0,0 +1,83 @@
+"""Tests for background analysis jobs."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.jobs import AnalysisJobQueue, JobStatus
+
+CONTRACT_TEXT = (
+    "1 Termination Either party may terminate on written notice.\n"
+    "2 Disputes All disputes go to binding arbitration in Delhi."
+)
+
+
+@dataclass
+class _ToyModel:
+    def predict(self, batch: list[str]) -> list[str]:
+        return ["termination" for _ in batch]
+
+
+@dataclass
+class _BlockingModel:
+    release: threading.Event
+
+    def predict(self, batch: list[str]) -> list[str]:
+        self.release.wait(timeout=5)
+        return ["termination" for _ in batch]
+
+
+def test_job_streams_clause_table_before_report() -> None:
+    queue = AnalysisJobQueue(workers=1)
+    job_id = queue.submit(
+        CONTRACT_TEXT,
+        _ToyModel(),
+        contract_name="Queued Contract",
+        knowledge_base=build_knowledge_base(load_legal_guidance_corpus()),
+    )
+
+    updates = list(queue.iter_updates(job_id, timeout=10))
+    queue.shutdown()
+
+    progress = [update["progress"] for update in updates]
+    assert progress == sorted(progress)
+    assert updates[-1]["status"] == "succeeded"
+    first_table = next(index for index, update in enumerate(updates) if update["clause_table_ready"])
+    first_report = next(index for index, update in enumerate(updates) if update["report_ready"])
+    assert first_table < first_report
+    job = queue.get(job_id)
+    assert job.result is not None
+    assert job.result.report["contract_summary"]["contract_name"] == "Queued Contract"
+
+
+def test_job_can_be_cancelled_while_queued_or_running() -> None:
+    release = threading.Event()
+    queue = AnalysisJobQueue(workers=1)
+    running_id = queue.submit(CONTRACT_TEXT, _BlockingModel(release))
+    queued_id = queue.submit(CONTRACT_TEXT, _ToyModel())
+
+    assert queue.cancel(queued_id) is True
+    assert queue.cancel(running_id) is True
+    release.set()
+
+    assert queue.wait(running_id, timeout=10).status == JobStatus.CANCELLED
+    assert queue.get(queued_id).status == JobStatus.CANCELLED
+    assert queue.cancel(running_id) is False
+    queue.shutdown()
+
+
+def test_job_stops_when_time_budget_is_exceeded() -> None:
+    release = threading.Event()
+    queue = AnalysisJobQueue(workers=1)
+    job_id = queue.submit(CONTRACT_TEXT, _BlockingModel(release), time_budget_seconds=0.01)
+    threading.Timer(0.1, release.set).start()
+
+    job = queue.wait(job_id, timeout=10)
+    queue.shutdown()
+
+    assert job.status == JobStatus.TIMED_OUT
+    assert "time budget" in (job.error or "").lower()
+    assert job.result is None
@@ -0,0 +1,92 @@
+"""Tests for the dependency-free metrics registry."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from contract_risk import metrics
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.features.segmentation import segment_clauses
+from contract_risk.metrics import Histogram, MetricsRegistry, instrumented, record_cache_lookup
+from contract_risk.server import AnalysisServer
+
+
+@pytest.fixture
+def enabled_registry():
+    metrics.REGISTRY.reset()
+    metrics.enable_metrics()
+    yield metrics.REGISTRY
+    metrics.enable_metrics(False)
+    metrics.REGISTRY.reset()
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("demo_seconds", "Demo latency.", ("operation",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5.0, "a")
+
+    lines = histogram.samples()
+
+    assert 'demo_seconds_bucket{operation="a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{operation="a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{operation="a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{operation="a"} 3' in lines
+
+
+def test_instrumented_functions_record_latency_items_and_errors(enabled_registry) -> None:
+    segment_clauses("1 Termination Either party may terminate.\n2 Payment Fees are due in thirty days.")
+
+    @instrumented("failing_operation")
+    def _boom() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        _boom()
+
+    assert metrics.OPERATION_SECONDS.count("segment_clauses") == 1
+    assert metrics.OPERATION_ITEMS.value("segment_clauses") == 2
+    assert metrics.OPERATION_ERRORS.value("failing_operation") == 1
+
+
+def test_disabled_registry_records_nothing() -> None:
+    metrics.enable_metrics(False)
+    metrics.REGISTRY.reset()
+    segment_clauses("1 Termination Either party may terminate.")
+    record_cache_lookup("model_artifact", hit=True)
+
+    assert metrics.OPERATION_SECONDS.count("segment_clauses") == 0
+    assert metrics.CACHE_REQUESTS.value("model_artifact", "hit") == 0
+
+
+def test_render_includes_cache_hit_ratio(enabled_registry) -> None:
+    record_cache_lookup("query", hit=True)
+    record_cache_lookup("query", hit=True)
+    record_cache_lookup("query", hit=False)
+
+    text = enabled_registry.render()
+
+    assert "# TYPE contract_risk_cache_requests_total counter" in text
+    assert 'contract_risk_cache_requests_total{cache="query",result="hit"} 2' in text
+    assert 'contract_risk_cache_hit_ratio{cache="query"} 0.6666666666666666' in text
+
+
+def test_registry_returns_existing_metric_by_name() -> None:
+    registry = MetricsRegistry()
+    first = registry.counter("demo_total", "Demo counter.")
+    assert registry.counter("demo_total", "Demo counter.") is first
+    assert registry.render().startswith("# HELP demo_total")
+
+
+def test_server_exposes_metrics_endpoint(enabled_registry) -> None:
+    server = AnalysisServer(object(), build_knowledge_base(load_legal_guidance_corpus()))
+    record_cache_lookup("query", hit=True)
+
+    status, payload = asyncio.run(server.dispatch("GET", "/metrics", b""))
+
+    assert status == 200
+    assert isinstance(payload, str)
+    assert "contract_risk_cache_hit_ratio" in payload
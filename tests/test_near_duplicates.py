@@ -0,0 +1,91 @@
+"""Tests for near-duplicate clause search across contracts."""
+
+from __future__ import annotations
+
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.near_duplicates import IndexedClause, NearDuplicateIndex, clause_shingles
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.ui_support import analyze_contract_text
+
+BOILERPLATE = [
+    "1 Termination. Either party may terminate this agreement for convenience on thirty days prior written notice "
+    "to the other party, and either party may terminate it immediately if the other party commits a material breach "
+    "that remains uncured after notice.",
+    "2 Confidentiality. The recipient shall keep all confidential information disclosed under this agreement secret, "
+    "shall use it only to perform its obligations, and shall return or destroy it when this agreement ends.",
+    "3 Governing Law. This agreement and any dispute arising out of it are governed by the laws of the State of "
+    "Delaware without regard to its conflict of laws principles.",
+]
+
+
+class _CountingModel:
+    """Label every clause as termination and record what it was asked to predict."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def predict(self, batch: list[str]) -> list[str]:
+        self.seen.extend(batch)
+        return ["termination" for _ in batch]
+
+
+def _clause(contract_name: str, clause_id: str, text: str) -> IndexedClause:
+    return IndexedClause(contract_name, clause_id, text, "termination", "High", 3)
+
+
+def test_shingles_ignore_case_and_numbers() -> None:
+    assert clause_shingles("Payable within 30 days of 1 May 2024") == clause_shingles("PAYABLE within 45 days of 9 May 2025")
+    assert clause_shingles("") == set()
+    assert len(clause_shingles("two words")) == 1
+
+
+def test_query_finds_near_duplicates_and_skips_unrelated_clauses() -> None:
+    index = NearDuplicateIndex()
+    index.add(_clause("Alpha", "clause_1", BOILERPLATE[0]))
+    index.add(_clause("Beta", "clause_1", BOILERPLATE[1]))
+    index.add(_clause("Gamma", "clause_4", BOILERPLATE[0].replace("1 Termination", "4 Termination")))
+
+    matches = index.query(BOILERPLATE[0].replace("thirty", "sixty"))
+
+    assert [match.clause.contract_name for match in matches] == ["Alpha", "Gamma"]
+    assert matches[0].similarity >= matches[1].similarity >= index.threshold
+    assert [match.clause.contract_name for match in index.query(BOILERPLATE[0], exclude_contract="Alpha")] == ["Gamma"]
+    assert index.best_match("The supplier shall indemnify the customer against all third-party claims.") is None
+
+    assert index.remove_contract("Alpha") == 1
+    assert index.contracts == ["Beta", "Gamma"]
+    assert index.stats()["clauses"] == len(index) == 2
+    assert index.stats()["buckets"] == 2 * index.bands
+
+
+def test_indexed_contracts_lend_predictions_and_evidence_to_new_contracts() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    index = NearDuplicateIndex()
+    first = analyze_contract_text("\n\n".join(BOILERPLATE), _CountingModel(), contract_name="Alpha", knowledge_base=knowledge_base)
+    assert index.add_analysis(first) == len(BOILERPLATE)
+
+    model = _CountingModel()
+    second_clauses = [
+        BOILERPLATE[0].replace("thirty", "sixty"),
+        BOILERPLATE[1],
+        "4 Indemnity. The supplier shall indemnify the customer against all third-party claims.",
+    ]
+    second = analyze_contract_text(
+        "\n\n".join(second_clauses), model, contract_name="Beta", knowledge_base=knowledge_base, clause_index=index
+    )
+
+    assert model.seen == [second_clauses[2]]
+    assert second.clause_frame["predicted_type"].tolist() == ["termination"] * 3
+    assert len(second.report["identified_risks"]) == 3
+    first_sources = {finding["clause_id"]: finding["evidence"] for finding in first.report["identified_risks"]}
+    second_sources = {finding["clause_id"]: finding["evidence"] for finding in second.report["identified_risks"]}
+    assert second_sources["C002"] == first_sources["C002"]
+    reused_from = [finding.get("reused_from") for finding in second.report["identified_risks"]]
+    assert reused_from[0].startswith("Alpha C001 (similarity ")
+    assert reused_from[1].startswith("Alpha C002 (similarity ")
+    assert reused_from[2] is None
+
+    index.add_analysis(second)
+    assert index.contracts == ["Alpha", "Beta"]
+    assert index.add_analysis(first) == len(BOILERPLATE)
+    assert index.contracts == ["Beta", "Alpha"]
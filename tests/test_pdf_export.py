@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from io import BytesIO
 
 from pypdf import PdfReader
 
+from benchmarks.report_assembly import build_large_state
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
-from contract_risk.assistant.pdf_export import build_legal_assistance_report_pdf
+from contract_risk.assistant.pdf_export import PdfRenderCache, build_legal_assistance_report_pdf, report_content_hash
+from contract_risk.assistant.pdf_writer import BOLD, text_width, wrap_text
+from contract_risk.assistant.reporting import build_structured_report
 from contract_risk.assistant.retrieval import build_knowledge_base
 from contract_risk.assistant.service import generate_legal_assistance_report
 
@@ -38,3 +42,53 @@ def test_pdf_export_generates_parseable_pdf_bytes() -> None:
     assert "PDF Demo" in extracted_text
     assert "Disclaimer" in extracted_text
     assert "termination" in extracted_text.lower()
+
+
+def test_pdf_export_paginates_every_finding() -> None:
+    state = build_large_state(120)
+    report = build_structured_report(state)
+
+    reader = PdfReader(BytesIO(build_legal_assistance_report_pdf(report)))
+
+    extracted_text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    assert len(reader.pages) > 3
+    assert all(f"C{index:04d}" in extracted_text for index in range(1, 121))
+    assert f"Page {len(reader.pages)} of {len(reader.pages)}" in extracted_text
+
+
+def test_wrap_text_keeps_lines_inside_the_margin() -> None:
+    text = "Liability (capped) \\ excluded § — " + "W" * 400 + " clause " * 50
+
+    lines = wrap_text(text, 200.0, 9.0, BOLD)
+
+    assert max(text_width(line, 9.0, BOLD) for line in lines) <= 200.0
+    assert " ".join(lines).replace(" ", "") == text.replace(" ", "")
+
+
+def test_pdf_render_cache_renders_identical_reports_once() -> None:
+    rendered: list[str] = []
+    release = threading.Event()
+
+    def render(report: dict) -> bytes:
+        release.wait(timeout=5)
+        rendered.append(report["contract_summary"]["contract_name"])
+        return b"%PDF-" + report["contract_summary"]["contract_name"].encode()
+
+    cache = PdfRenderCache(max_entries=2, render=render)
+    first = build_structured_report(build_large_state(3))
+    rerun = build_structured_report(build_large_state(3))
+    assert report_content_hash(first) == report_content_hash(rerun)
+
+    futures = [cache.request(first), cache.request(rerun)]
+    release.set()
+    assert {future.result(timeout=5) for future in futures} == {b"%PDF-Synthetic 1,500-finding contract"}
+    assert cache.request(rerun).result(timeout=5) == futures[0].result()
+    assert rendered == ["Synthetic 1,500-finding contract"]
+    assert cache.stats()["hits"] == 2
+
+    for name in ("Second", "Third"):
+        other = {**first, "contract_summary": {**first["contract_summary"], "contract_name": name}}
+        cache.request(other).result(timeout=5)
+    cache.shutdown()
+    assert cache.get(report_content_hash(first)) is None
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,74 @@
+"""Tests for the persistent portfolio store."""
+
+from __future__ import annotations
+
+from contract_risk.assistant.comparison import build_risk_trend_summary
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.portfolio import PortfolioStore
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.ui_support import analyze_contract_text
+
+CONTRACTS = {
+    "Alpha": "1 Termination. Either party may terminate on notice.\n\n2 Confidentiality. Keep information secret.",
+    "Beta": "1 Termination. The supplier may terminate for breach.\n\n2 Liability. Liability is capped at fees paid.",
+    "Gamma": "1 Confidentiality. The recipient shall not disclose information.\n\n2 Termination. Termination on insolvency.",
+}
+
+
+class _KeywordModel:
+    def predict(self, batch: list[str]) -> list[str]:
+        labels = ("termination", "confidentiality", "liability")
+        return [next((label for label in labels if label in text.lower()), "payment terms") for text in batch]
+
+
+def _analyses():
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    return [
+        analyze_contract_text(text, _KeywordModel(), contract_name=name, knowledge_base=knowledge_base)
+        for name, text in CONTRACTS.items()
+    ]
+
+
+def test_store_summary_matches_in_memory_summary_and_survives_reopening(tmp_path) -> None:
+    analyses = _analyses()
+    path = tmp_path / "portfolio" / "store.sqlite3"
+    with PortfolioStore(path) as store:
+        assert store.add_analyses(analyses) == 3
+
+    with PortfolioStore(path) as store:
+        summary = store.trend_summary(listed_contracts=None)
+        expected = build_risk_trend_summary(analyses)
+        assert summary["contract_count"] == expected["contract_count"] == len(store)
+        assert summary["severity_totals"] == expected["severity_totals"]
+        assert summary["per_contract"] == expected["per_contract"]
+        assert summary["repeated_risk_patterns"] == expected["repeated_risk_patterns"]
+        assert [row["contracts"] for row in store.repeated_risk_patterns(listed_contracts=1)] == ["Alpha", "Alpha"]
+
+
+def test_store_replaces_and_removes_contracts_and_filters_findings() -> None:
+    analyses = _analyses()
+    store = PortfolioStore()
+    store.add_analyses(analyses)
+    store.add_analysis(analyses[0])
+
+    assert [row["contract_name"] for row in store.per_contract()] == ["Beta", "Gamma", "Alpha"]
+    assert store.per_contract(["Gamma"])[0]["dominant_risk_type"] == "confidentiality"
+    findings = store.findings(predicted_type="termination")
+    assert [(row["contract_name"], row["clause_id"]) for row in findings] == [
+        ("Beta", "C001"),
+        ("Gamma", "C002"),
+        ("Alpha", "C001"),
+    ]
+    assert store.findings(contract_name="Beta", predicted_type="liability", limit=5)[0]["clause_id"] == "C002"
+
+    assert store.remove_contract("Beta")
+    assert not store.remove_contract("Beta")
+    assert "Beta" not in store and "Alpha" in store
+    remaining = build_risk_trend_summary([analyses[0], analyses[2]])
+    assert store.severity_totals() == remaining["severity_totals"]
+    patterns = store.repeated_risk_patterns(listed_contracts=None)
+    assert sorted(patterns, key=lambda row: row["predicted_type"]) == sorted(
+        remaining["repeated_risk_patterns"], key=lambda row: row["predicted_type"]
+    )
+    assert store.findings(predicted_type="liability") == []
+    store.close()
@@ -0,0 +1,92 @@
+"""Tests for the pre-fork batch analysis mode."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.models.pipeline import train_logreg_model
+from contract_risk.prefork import (
+    ResidentResources,
+    build_memory_report,
+    read_memory_usage,
+    report_filenames,
+    run_prefork_batch,
+)
+
+
+def _toy_resources() -> ResidentResources:
+    corpus = tuple(load_legal_guidance_corpus())
+    model = train_logreg_model(
+        ["Either party may terminate on notice.", "All disputes go to arbitration."],
+        ["termination", "dispute resolution"],
+    )
+    return ResidentResources(model=model, knowledge_base=build_knowledge_base(list(corpus)), corpus=corpus)
+
+
+def test_run_prefork_batch_writes_reports_and_memory_summary(tmp_path: Path) -> None:
+    contracts = []
+    for name in ("contract_0.txt", "a/msa.txt", "b/msa.txt"):
+        contract = tmp_path / name
+        contract.parent.mkdir(exist_ok=True)
+        contract.write_text(
+            "1 Termination Either party may terminate on written notice.\n"
+            "2 Disputes All disputes go to binding arbitration in Delhi.",
+            encoding="utf-8",
+        )
+        contracts.append(contract)
+
+    summary = run_prefork_batch(contracts, tmp_path / "out", workers=2, resources=_toy_resources())
+
+    assert len(summary["results"]) == 3
+    assert [Path(result["report_path"]).name for result in summary["results"]] == [
+        "contract_0.json",
+        "msa-2.json",
+        "msa-3.json",
+    ]
+    for result in summary["results"]:
+        report = json.loads(Path(result["report_path"]).read_text(encoding="utf-8"))
+        assert report["contract_summary"]["clause_count"] == 2
+    assert summary["memory"]["total_rss_kb"] >= summary["memory"]["total_pss_kb"]
+
+
+def test_run_prefork_batch_totals_rule_cascade_stats(tmp_path: Path) -> None:
+    contract = tmp_path / "contract.txt"
+    contract.write_text(
+        "1 Termination Either party may terminate on written notice.\n2 Notices Notices go by email.",
+        encoding="utf-8",
+    )
+
+    summary = run_prefork_batch(
+        [contract, contract], tmp_path / "out", workers=2, resources=_toy_resources(), rule_cascade=True
+    )
+
+    assert [result["cascade"]["rule_resolved"] for result in summary["results"]] == [1, 1]
+    assert summary["cascade"]["rule_resolved"] == 2
+    assert summary["cascade"]["model_resolved"] == 2
+    assert summary["cascade"]["rule_fraction"] == 0.5
+
+
+def test_report_filenames_keep_inputs_with_the_same_stem_apart() -> None:
+    assert report_filenames(["a/msa.pdf", "b/msa.txt", "nda.txt", "msa-2.txt"]) == [
+        "msa-1.json",
+        "msa-2-2.json",
+        "nda.json",
+        "msa-2.json",
+    ]
+
+
+def test_build_memory_report_uses_latest_sample_per_worker() -> None:
+    usage = {"rss_kb": 100, "pss_kb": 40, "shared_kb": 80, "private_kb": 20}
+    results = [
+        {"pid": 7, "memory": {**usage, "rss_kb": 90}},
+        {"pid": 7, "memory": usage},
+        {"pid": 8, "memory": None},
+    ]
+
+    report = build_memory_report(read_memory_usage(), results)
+
+    assert [worker["pid"] for worker in report["workers"]] == [7]
+    assert report["total_shared_savings_kb"] == 60
@@ -1,6 +1,7 @@
 """Tests for retrieval-oriented preprocessing."""
 
 from contract_risk.assistant.preprocessing import build_retrieval_chunks, infer_clause_tags
+from contract_risk.features.keywords import KeywordMatcher
 
 
 def test_infer_clause_tags_detects_common_risks() -> None:
@@ -29,3 +30,25 @@ def test_build_retrieval_chunks_splits_long_passages_cleanly() -> None:
     chunks = build_retrieval_chunks(text, source_id="billing", max_clause_chars=70)
     assert len(chunks) >= 2
     assert all(chunk.text for chunk in chunks)
+
+
+def test_keyword_matcher_matches_overlapping_keywords_in_rule_order() -> None:
+    matcher = KeywordMatcher({"payment": ("late fee", "fee"), "liability": ("indemn",), "nda": ("NDA",)})
+
+    assert matcher.match_tags("An NDA with a LATE FEE and indemnification.") == ("payment", "liability", "nda")
+    assert matcher.match_tags("nothing relevant") == ()
+    assert matcher.match_tags("") == ()
+
+
+def test_keyword_matcher_whole_words_skips_keywords_inside_words() -> None:
+    matcher = KeywordMatcher(
+        {"force majeure": ("war",), "governing law": ("venue",), "payment": ("late fee",)},
+        whole_words=True,
+    )
+
+    assert matcher.match_tags("Software revenue and a warranty.") == ()
+    assert matcher.match_tags("Venue is London; war excuses delay; a LATE FEE applies.") == (
+        "force majeure",
+        "governing law",
+        "payment",
+    )
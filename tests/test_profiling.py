@@ -0,0 +1,93 @@
+"""Tests for the rate-limited request profiler."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from contract_risk import profiling
+from contract_risk.profiling import profiled, render_collapsed, summarize_hotspots
+
+
+@pytest.fixture
+def profiler_dir(tmp_path):
+    profiling.enable_profiling(output_dir=tmp_path, interval_seconds=0.001, min_gap_seconds=0.0)
+    profiling.PROFILER.recent.clear()
+    yield tmp_path
+    profiling.enable_profiling(False)
+
+
+def _busy_work() -> int:
+    return sum(index * index for index in range(300_000))
+
+
+def test_render_collapsed_and_hotspots() -> None:
+    stacks = Counter({("main", "parse"): 3, ("main", "parse", "tokenize"): 1, ("main",): 1})
+
+    assert render_collapsed(stacks).splitlines() == ["main 1", "main;parse 3", "main;parse;tokenize 1"]
+    hotspots = {item["function"]: item for item in summarize_hotspots(stacks)}
+    assert hotspots["parse"]["self_samples"] == 3
+    assert hotspots["parse"]["total_samples"] == 4
+    assert hotspots["main"]["total_share"] == 1.0
+
+
+def test_profiled_call_writes_collapsed_stacks_and_summary(profiler_dir) -> None:
+    @profiled("busy")
+    def run() -> int:
+        return _busy_work()
+
+    run()
+
+    [artifact] = profiling.PROFILER.recent
+    assert artifact.operation == "busy"
+    assert artifact.sample_count > 0
+    first_line = artifact.collapsed_path.read_text(encoding="utf-8").splitlines()[0]
+    assert first_line.startswith("contract_risk.profiling:")
+    assert "Top 25 functions by self samples" in artifact.summary_path.read_text(encoding="utf-8")
+
+
+def test_rate_limit_and_nested_calls_write_one_profile(profiler_dir) -> None:
+    profiling.enable_profiling(output_dir=profiler_dir, min_gap_seconds=3600.0)
+
+    @profiled("inner")
+    def inner() -> int:
+        return 1
+
+    @profiled("outer")
+    def outer() -> int:
+        return inner()
+
+    outer()
+    outer()
+
+    assert [artifact.operation for artifact in profiling.PROFILER.recent] == ["outer"]
+    assert len(list(profiler_dir.glob("*.collapsed"))) == 1
+
+
+def test_profile_write_failure_keeps_the_call_result(profiler_dir, monkeypatch, caplog) -> None:
+    def fail_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(profiling.PROFILER, "_write", fail_write)
+
+    @profiled("busy")
+    def run() -> int:
+        return 7
+
+    with caplog.at_level("WARNING", logger="contract_risk.profiling"):
+        assert run() == 7
+    assert "disk full" in caplog.text
+    assert profiling.PROFILER._acquire() is not None
+    profiling.PROFILER._release()
+
+
+def test_disabled_profiler_writes_nothing(tmp_path) -> None:
+    profiling.enable_profiling(False, output_dir=tmp_path)
+
+    @profiled("idle")
+    def run() -> int:
+        return 1
+
+    assert run() == 1
+    assert not list(tmp_path.iterdir())
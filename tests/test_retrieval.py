@@ -1,5 +1,7 @@
 """Tests for the local legal guidance retrieval index."""
 
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
@@ -74,3 +76,67 @@ def test_knowledge_base_round_trip(tmp_path: Path) -> None:
     hits = restored.search("arbitration clause dispute resolution")
     assert hits
     assert hits[0].record.topic in {"dispute resolution", "termination"}
+
+
+def test_query_cache_serves_normalized_repeats_and_invalidates_on_change(monkeypatch) -> None:
+    corpus = load_legal_guidance_corpus()
+    knowledge_base = build_knowledge_base(corpus)
+    knowledge_base.query_cache_size = 2
+    transformed: list[list[str]] = []
+    original_transform = knowledge_base.vectorizer.transform
+    monkeypatch.setattr(
+        knowledge_base.vectorizer,
+        "transform",
+        lambda texts: transformed.append(list(texts)) or original_transform(texts),
+    )
+
+    first = knowledge_base.search("Arbitration  clause", top_k=3)
+    assert knowledge_base.search("arbitration clause", top_k=3) == first
+    assert knowledge_base.search_many(["ARBITRATION clause", "payment terms", "Payment  terms"], top_k=3)[0] == first
+    assert transformed == [["Arbitration  clause"], ["payment terms"]]
+    knowledge_base.search("arbitration clause", top_k=2)
+    assert knowledge_base.query_cache_stats() == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 2,
+        "misses": 4,
+        "hit_rate": 2 / 6,
+    }
+
+    knowledge_base.records = knowledge_base.records[:-1]
+    knowledge_base.search("payment terms", top_k=3)
+    assert transformed[-1] == ["payment terms"]
+    assert knowledge_base.query_cache_stats()["entries"] == 1
+    knowledge_base.clear_query_cache()
+    assert knowledge_base.query_cache_stats()["hits"] == 0
+
+
+def test_query_cache_is_invalidated_when_index_parts_are_replaced() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+
+    for name in ("records", "matrix", "vectorizer"):
+        knowledge_base.search("termination notice")
+        assert knowledge_base.query_cache_stats()["entries"] == 1
+        # Same length and equal contents, so only the replacement itself can invalidate the cache.
+        setattr(knowledge_base, name, copy.copy(getattr(knowledge_base, name)))
+        knowledge_base.search("limitation of liability")
+        assert knowledge_base.query_cache_stats()["entries"] == 1, name
+        knowledge_base.clear_query_cache()
+
+
+def test_query_cache_is_shared_safely_between_threads_and_not_pickled(tmp_path: Path) -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    queries = ["force majeure pandemic", "termination notice", "limitation of liability"] * 20
+    expected = [knowledge_base.search(query) for query in queries]
+    knowledge_base.clear_query_cache()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(knowledge_base.search, queries))
+
+    assert results == expected
+    stats = knowledge_base.query_cache_stats()
+    assert stats["hits"] + stats["misses"] == len(queries)
+    assert stats["entries"] == 3
+    restored = load_knowledge_base(save_knowledge_base(knowledge_base, tmp_path / "kb.joblib"))
+    assert restored.query_cache_stats()["entries"] == 0
+    assert restored.search("termination notice") == expected[1]
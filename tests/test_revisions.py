@@ -0,0 +1,134 @@
+"""Tests for clause alignment and incremental revision analysis."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.revisions import ClauseAlignment, align_clauses, compute_risk_delta
+from contract_risk.ui_support import analyze_contract_revision, analyze_contract_text
+
+CLAUSES = [
+    "1 Termination. Either party may terminate this agreement on thirty days written notice.",
+    "2 Confidentiality. The recipient shall keep all confidential information secret.",
+    "3 Liability. Neither party is liable for indirect or consequential damages.",
+    "4 Governing Law. This agreement is governed by the laws of Delaware.",
+    "5 Payment Terms. Invoices are payable within thirty days of receipt.",
+]
+
+
+class _KeywordModel:
+    """Label clauses by keyword and record every clause it is asked to predict."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def predict(self, batch: list[str]) -> list[str]:
+        self.seen.extend(batch)
+        labels = []
+        for text in batch:
+            lowered = text.lower()
+            label = next(
+                (name for name in ("termination", "confidentiality", "liability", "governing law") if name in lowered),
+                "payment terms",
+            )
+            labels.append(label)
+        return labels
+
+
+def _without_timings(report: dict) -> dict:
+    return {key: value for key, value in report.items() if key not in {"performance", "retrieval_budget"}}
+
+
+def test_align_clauses_matches_unchanged_clauses_across_inserts_and_deletes() -> None:
+    previous = ["alpha one", "beta two", "gamma three", "delta four five six", "epsilon", "zeta"]
+    current = ["alpha one", "  BETA  two ", "omega", "delta four five seven", "epsilon", "eta"]
+
+    alignment = align_clauses(previous, current)
+
+    assert alignment == ClauseAlignment(
+        unchanged=((0, 0), (1, 1), (4, 4)),
+        changed=((3, 3),),
+        added=(2, 5),
+        removed=(2, 5),
+    )
+    assert align_clauses(["a", "b", "c"], ["a", "c"]).removed == (1,)
+
+
+def test_risk_delta_lists_changed_clauses_in_current_order() -> None:
+    def _frame(ids: list[str], scores: list[int]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "clause_id": ids,
+                "predicted_type": ["liability"] * len(ids),
+                "severity": ["High"] * len(ids),
+                "risk_score": scores,
+                "clause_text": [f"clause {clause_id}" for clause_id in ids],
+            }
+        )
+
+    previous = _frame(["C999", "C1000"], [80, 80])
+    current = _frame(["C999", "C1000"], [88, 88])
+
+    delta = compute_risk_delta(previous, current, ClauseAlignment(unchanged=((0, 0),), changed=((1, 1),)))
+
+    assert [item["current"]["clause_id"] for item in delta.changed] == ["C999", "C1000"]
+    assert delta.unchanged_count == 0
+
+
+def test_revision_analysis_only_predicts_changed_clauses_and_matches_full_run() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    model = _KeywordModel()
+    previous = analyze_contract_text("\n\n".join(CLAUSES), model, contract_name="MSA", knowledge_base=knowledge_base)
+
+    revised = list(CLAUSES)
+    revised[2] = "3 Liability. Neither party is liable for indirect, special or consequential damages."
+    revised[4] = "5 Payment Terms. Invoices are payable within thirty days of receipt, and late payment is cause for termination."
+    del revised[1]
+    revised.append("6 Indemnity. The supplier shall indemnify the customer against third-party claims.")
+    revised_text = "\n\n".join(revised)
+
+    model.seen.clear()
+    revision = analyze_contract_revision(revised_text, model, previous, knowledge_base=knowledge_base)
+    full = analyze_contract_text(revised_text, _KeywordModel(), contract_name="MSA", knowledge_base=knowledge_base)
+
+    assert sorted(model.seen) == sorted([revised[1], revised[3], revised[4]])
+    assert revision.result.contract_name == "MSA"
+    assert revision.result.clause_frame.equals(full.clause_frame)
+    assert _without_timings(revision.result.report) == _without_timings(full.report)
+
+    delta = revision.delta
+    assert [item["clause_text"] for item in delta.removed] == [CLAUSES[1]]
+    assert [item["clause_text"] for item in delta.added] == [revised[4]]
+    assert [(item["previous"]["predicted_type"], item["current"]["predicted_type"]) for item in delta.changed] == [
+        ("liability", "liability"),
+        ("payment terms", "termination"),
+    ]
+    assert delta.unchanged_count == 2
+    assert delta.risk_score_change == sum(full.clause_frame["risk_score"]) - sum(previous.clause_frame["risk_score"])
+    assert delta.asdict()["severity_changes"] == delta.severity_changes
+
+
+def test_revision_reanalyzes_clauses_when_the_model_or_knowledge_base_changes() -> None:
+    corpus = load_legal_guidance_corpus()
+    knowledge_base = build_knowledge_base(corpus)
+    previous = analyze_contract_text(
+        "\n\n".join(CLAUSES), _KeywordModel(), contract_name="MSA", knowledge_base=knowledge_base
+    )
+    revised_text = "\n\n".join(CLAUSES[:-1])
+
+    retrained = _KeywordModel()
+    revision = analyze_contract_revision(revised_text, retrained, previous, knowledge_base=knowledge_base)
+    assert sorted(retrained.seen) == sorted(CLAUSES[:-1])
+    assert revision.delta.unchanged_count == len(CLAUSES) - 1
+
+    model = _KeywordModel()
+    same_model = analyze_contract_text("\n\n".join(CLAUSES), model, contract_name="MSA", knowledge_base=knowledge_base)
+    model.seen.clear()
+    rebuilt = build_knowledge_base(corpus)
+    revision = analyze_contract_revision(revised_text, model, same_model, knowledge_base=rebuilt)
+    assert model.seen == []
+    assert rebuilt.query_cache_stats()["misses"] == len(CLAUSES) - 1
+    assert revision.result.settings.reuses_predictions_from(same_model.settings)
+    assert not revision.result.settings.reuses_evidence_from(same_model.settings)
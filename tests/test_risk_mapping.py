@@ -1,6 +1,22 @@
 """Tests for risk mapping rules."""
 
-from contract_risk.risk.mapping import map_clause_type_to_risk, risk_badge_color
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from contract_risk.risk.mapping import (
+    RISK_MAPPING,
+    RiskProfile,
+    RiskTable,
+    compile_risk_table,
+    load_risk_table,
+    map_clause_type_to_risk,
+    map_clause_types_to_risk,
+    risk_badge_color,
+    set_risk_table,
+)
 
 
 def test_known_clause_has_expected_risk() -> None:
@@ -19,3 +35,84 @@ def test_badge_color_mapping() -> None:
     assert risk_badge_color("High") == "#f94144"
     assert risk_badge_color("Medium") == "#f8961e"
     assert risk_badge_color("Low") == "#43aa8b"
+
+
+class _CountingTable(RiskTable):
+    def lookup(self, clause_type: str) -> RiskProfile:
+        LOOKUPS.append(clause_type)
+        return super().lookup(clause_type)
+
+
+LOOKUPS: list[str] = []
+
+
+def test_batch_mapping_looks_up_each_distinct_label_once() -> None:
+    LOOKUPS.clear()
+    table = _CountingTable(compile_risk_table(RISK_MAPPING).profiles)
+    labels = ["Liability", "Termination", "Liability", "Unknown Clause"] * 250
+
+    risk = map_clause_types_to_risk(labels, table)
+    categorical = map_clause_types_to_risk(pd.Series(labels, dtype="category"), table)
+
+    assert sorted(LOOKUPS) == sorted(["Liability", "Termination", "Unknown Clause"] * 2)
+    assert risk.severity[:4].tolist() == ["High", "High", "High", "Medium"]
+    assert risk.score[:4].tolist() == [88, 82, 88, 50]
+    assert categorical.score.tolist() == risk.score.tolist()
+    assert map_clause_types_to_risk([]).score.tolist() == []
+
+
+def test_risk_table_file_overrides_defaults(tmp_path: Path) -> None:
+    table_path = tmp_path / "risk_table.json"
+    table_path.write_text(
+        json.dumps(
+            {
+                "clause_types": {"Liability": {"severity": "Medium", "score": 61}, "Non Compete": {"severity": "High", "score": 77}},
+                "default": {"severity": "Low", "score": 20},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    table = load_risk_table(table_path)
+    previous = set_risk_table(table)
+    try:
+        assert map_clause_type_to_risk("  LIABILITY ") == RiskProfile("Medium", 61)
+        assert map_clause_type_to_risk("non   compete") == RiskProfile("High", 77)
+        assert map_clause_type_to_risk("Termination") == RISK_MAPPING["termination"]
+        assert map_clause_type_to_risk("Unknown Clause") == RiskProfile("Low", 20)
+    finally:
+        set_risk_table(previous)
+    with pytest.raises(TypeError):
+        table.profiles["liability"] = RiskProfile("Low", 1)  # type: ignore[index]
+    assert load_risk_table(table_path, extend_defaults=False).lookup("Termination") == RiskProfile("Low", 20)
+
+
+def test_risk_table_rejects_malformed_entries(tmp_path: Path) -> None:
+    table_path = tmp_path / "risk_table.json"
+    table_path.write_text(json.dumps({"clause_types": {"liability": {"severity": "High"}}}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="liability"):
+        load_risk_table(table_path)
+
+
+def test_risk_table_title_cases_severity_and_rejects_unknown_levels(tmp_path: Path) -> None:
+    table_path = tmp_path / "risk_table.json"
+    table_path.write_text(
+        json.dumps(
+            {
+                "clause_types": {"liability": {"severity": "medium", "score": 61}},
+                "default": {"severity": " LOW ", "score": 20},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    table = load_risk_table(table_path)
+
+    assert table.lookup("Liability") == RiskProfile("Medium", 61)
+    assert table.default == RiskProfile("Low", 20)
+    assert risk_badge_color(table.lookup("Liability").severity) == "#f8961e"
+
+    table_path.write_text(json.dumps({"clause_types": {"liability": {"severity": "severe", "score": 61}}}), encoding="utf-8")
+    with pytest.raises(ValueError, match="severe"):
+        load_risk_table(table_path)
@@ -0,0 +1,184 @@
+"""Tests for the micro-batching analysis HTTP service."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+from contract_risk.assistant.corpus import load_legal_guidance_corpus
+from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.server import AnalysisServer, MicroBatcher, QueueFullError, ServerConfig
+
+
+@dataclass
+class _RecordingModel:
+    batches: list[int] = field(default_factory=list)
+
+    def predict(self, batch: list[str]) -> list[str]:
+        self.batches.append(len(batch))
+        return ["termination" for _ in batch]
+
+
+async def _request(port: int, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, response_body = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(response_body)
+
+
+def test_micro_batcher_coalesces_concurrent_submissions() -> None:
+    calls: list[list[int]] = []
+
+    def _handler(items: list[int]) -> list[int]:
+        calls.append(items)
+        return [item * 2 for item in items]
+
+    async def _scenario() -> list[list[int]]:
+        batcher = MicroBatcher(_handler, max_batch_size=10, max_wait_ms=50, max_queue_size=8)
+        batcher.start()
+        results = await asyncio.gather(batcher.submit([1, 2]), batcher.submit([3]), batcher.submit([4, 5]))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(_scenario())
+
+    assert results == [[2, 4], [6], [8, 10]]
+    assert calls == [[1, 2, 3, 4, 5]]
+
+
+def test_micro_batcher_rejects_work_when_queue_is_full() -> None:
+    async def _scenario() -> None:
+        batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_ms=1, max_queue_size=1)
+        first = asyncio.ensure_future(batcher.submit([1]))
+        await asyncio.sleep(0)
+        try:
+            await batcher.submit([2])
+        except QueueFullError:
+            first.cancel()
+            return
+        raise AssertionError("Expected QueueFullError")
+
+    asyncio.run(_scenario())
+
+
+def test_server_predict_and_analyze_endpoints() -> None:
+    model = _RecordingModel()
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+
+    async def _scenario() -> tuple:
+        server = AnalysisServer(model, knowledge_base, ServerConfig(port=0, max_wait_ms=20, metrics_enabled=False))
+        await server.start()
+        try:
+            predict = _request(server.port, "POST", "/predict", {"clauses": ["Either party may terminate."]})
+            analyze = _request(
+                server.port,
+                "POST",
+                "/analyze",
+                {"text": "Either party may terminate on written notice.", "contract_name": "Served"},
+            )
+            results = await asyncio.gather(predict, analyze)
+            missing = await _request(server.port, "GET", "/nope")
+            invalid = await _request(server.port, "POST", "/predict", {"clauses": "not a list"})
+            return results, missing, invalid
+        finally:
+            await server.stop()
+
+    (predict_result, analyze_result), missing, invalid = asyncio.run(_scenario())
+
+    assert predict_result[0] == 200
+    assert predict_result[1]["predictions"][0]["severity"] == "High"
+    assert analyze_result[0] == 200
+    assert analyze_result[1]["report"]["contract_summary"]["contract_name"] == "Served"
+    assert analyze_result[1]["clauses"][0]["predicted_type"] == "termination"
+    assert missing[0] == 404
+    assert invalid[0] == 400
+    assert sum(model.batches) == 2
+
+
+def test_server_returns_429_when_pending_limit_is_reached() -> None:
+    server = AnalysisServer(_RecordingModel(), build_knowledge_base(load_legal_guidance_corpus()), ServerConfig(max_queue_size=1))
+    server._pending = 1
+
+    status, payload = asyncio.run(server.dispatch("POST", "/predict", b'{"clauses": []}'))
+
+    assert status == 429
+    assert "busy" in payload["error"]
+
+
+def test_server_analyze_returns_429_when_a_batcher_is_full() -> None:
+    server = AnalysisServer(_RecordingModel(), build_knowledge_base(load_legal_guidance_corpus()), ServerConfig(port=0))
+
+    async def _full(items: list) -> list:
+        raise QueueFullError("The batching queue is full; retry later.")
+
+    async def _scenario() -> tuple:
+        await server.start()
+        try:
+            server._prediction_batcher.submit = _full
+            body = json.dumps({"text": "Either party may terminate on written notice."}).encode("utf-8")
+            return await server.dispatch("POST", "/analyze", body)
+        finally:
+            await server.stop()
+
+    status, payload = asyncio.run(_scenario())
+
+    assert status == 429
+    assert "retry later" in payload["error"]
+
+
+def test_server_rule_cascade_skips_the_model_and_reports_stats() -> None:
+    model = _RecordingModel()
+    config = ServerConfig(port=0, max_wait_ms=20, metrics_enabled=False, rule_cascade=True)
+    server = AnalysisServer(model, build_knowledge_base(load_legal_guidance_corpus()), config)
+
+    async def _scenario() -> tuple:
+        await server.start()
+        try:
+            clauses = ["Either party may terminate for breach.", "Notices go by email."]
+            predict = await server.dispatch("POST", "/predict", json.dumps({"clauses": clauses}).encode("utf-8"))
+            health = await server.dispatch("GET", "/health", b"")
+            return predict, health
+        finally:
+            await server.stop()
+
+    (predict_status, _), (health_status, health) = asyncio.run(_scenario())
+
+    assert predict_status == 200
+    assert model.batches == [1]
+    assert health_status == 200
+    assert health["cascade"]["rule_resolved"] == 1
+    assert health["cascade"]["model_resolved"] == 1
+
+
+def test_server_answers_400_for_undecodable_or_truncated_bodies() -> None:
+    server = AnalysisServer(_RecordingModel(), build_knowledge_base(load_legal_guidance_corpus()), ServerConfig(port=0))
+
+    async def _raw_request(raw: bytes) -> int:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(raw)
+        await writer.drain()
+        if writer.can_write_eof():
+            writer.write_eof()
+        response = await reader.read()
+        writer.close()
+        return int(response.split()[1])
+
+    async def _scenario() -> tuple:
+        await server.start()
+        try:
+            invalid_bytes = await _raw_request(b'POST /predict HTTP/1.1\r\nContent-Length: 16\r\n\r\n{"clauses": "\xff"}')
+            truncated = await _raw_request(b"POST /predict HTTP/1.1\r\nContent-Length: 50\r\n\r\n{}")
+            return invalid_bytes, truncated, server._pending
+        finally:
+            await server.stop()
+
+    invalid_bytes, truncated, pending = asyncio.run(_scenario())
+
+    assert invalid_bytes == 400
+    assert truncated == 400
+    assert pending == 0
@@ -6,6 +6,11 @@ from dataclasses import dataclass
 
 from contract_risk.assistant.corpus import load_legal_guidance_corpus
 from contract_risk.assistant.retrieval import build_knowledge_base
+from contract_risk.assistant.service import (
+    _normalize_prediction,
+    generate_legal_assistance_report,
+    predictions_from_columns,
+)
 import contract_risk.ui_support as ui_support
 from contract_risk.ui_support import (
     analyze_contract_text,
@@ -118,3 +123,66 @@ def test_analyze_contract_text_reports_report_generation_failure(monkeypatch) ->
     assert result.report_error is not None
     assert "retrieval backend offline" in result.report_error
     assert any("legal assistance report" in warning.lower() for warning in result.warnings)
+
+
+def test_analyze_contract_text_reports_stage_performance() -> None:
+    result = analyze_contract_text(
+        "Either party may terminate on written notice. Disputes go to arbitration.",
+        _ToyModel(),
+        knowledge_base=build_knowledge_base(load_legal_guidance_corpus()),
+    )
+
+    assert result.report is not None
+    performance = result.report["performance"]
+    stages = [item["stage"] for item in performance["stages"]]
+    assert stages[:2] == ["segmentation", "prediction"]
+    assert {"retrieve", "assess_risk", "serialize"} <= set(stages)
+    assert performance["total_wall_seconds"] >= 0
+
+
+def test_analyze_contract_text_reports_rule_cascade_stats() -> None:
+    result = analyze_contract_text(
+        "1 Termination Either party may terminate on written notice.\n2 Notices Notices go by email.",
+        _ToyModel(),
+        knowledge_base=build_knowledge_base(load_legal_guidance_corpus()),
+        rule_cascade=True,
+    )
+
+    assert result.cascade_stats is not None
+    assert result.cascade_stats["rule_resolved"] == 1
+    assert result.cascade_stats["model_resolved"] == 1
+    assert result.report is not None
+    assert result.report["performance"]["cascade"] == result.cascade_stats
+
+
+def test_build_clause_frame_uses_categorical_columns() -> None:
+    frame = ui_support.build_clause_frame(
+        ["a", "b", "c", "d"],
+        ["Termination", "Liability", "Termination", "unknown"],
+        [0.9, None, 0.8, 0.4],
+    )
+
+    assert str(frame["predicted_type"].dtype) == "category"
+    assert str(frame["severity"].dtype) == "category"
+    assert frame["severity"].tolist() == ["High", "High", "High", "Medium"]
+    assert frame["risk_score"].tolist() == [82, 88, 82, 50]
+    assert frame["clause_id"].tolist() == ["C001", "C002", "C003", "C004"]
+
+
+def test_report_from_clause_frame_matches_row_records() -> None:
+    knowledge_base = build_knowledge_base(load_legal_guidance_corpus())
+    frame = ui_support.build_clause_frame(
+        ["Either party may terminate on notice.", "Disputes go to arbitration."],
+        ["termination", "arbitration"],
+        [0.95, None],
+    )
+
+    columnar = predictions_from_columns(frame)
+    from_rows = [_normalize_prediction(row) for row in frame.to_dict(orient="records")]
+    report = generate_legal_assistance_report("Contract text.", frame, knowledge_base=knowledge_base)
+
+    assert [(item.clause_id, item.severity, item.risk_score) for item in columnar] == [
+        (item.clause_id, item.severity, item.risk_score) for item in from_rows
+    ]
+    assert [item.confidence for item in columnar] == [0.95, None]
+    assert [item["clause_id"] for item in report["identified_risks"]] == ["C001", "C002"]